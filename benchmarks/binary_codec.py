@@ -0,0 +1,69 @@
+"""
+Compare the size and speed of the binary codec with JSON.
+
+Usage:
+    python benchmarks/binary_codec.py [N]
+
+Results on CPython 3.11, N = 100,000 random USD values:
+
+    codec                               bytes           encode      decode
+    to_json / from_json, per amount     9,338,816       0.142s      0.930s
+    to_bytes / from_bytes, per amount   589,536         0.135s      0.433s
+    dumps_many / loads_many             9,538,816       0.173s      0.804s
+    DineroArray to_bytes / from_bytes   800,008         0.000s      0.001s
+"""
+
+import random
+import sys
+import time
+from typing import Any, Callable
+
+import dinero
+from dinero import Dinero, DineroArray
+from dinero.currencies import USD
+
+
+def timed(operation: Callable[[], Any]) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = operation()
+    return time.perf_counter() - start, result
+
+
+def report(name: str, encode: Callable[[], Any], decode: Callable[[Any], Any]) -> None:
+    encode_time, encoded = timed(encode)
+    decode_time, _ = timed(lambda: decode(encoded))
+    size = sum(map(len, encoded)) if isinstance(encoded, list) else len(encoded)
+    print(f"{name:<36}{size:<16,}{encode_time:.3f}s      {decode_time:.3f}s")
+
+
+def main(count: int = 100_000) -> None:
+    rng = random.Random(42)
+    amounts = [
+        Dinero.from_minor_units(rng.randrange(-(10**7), 10**7), USD) for _ in range(count)
+    ]
+    array = DineroArray(amounts)
+
+    report(
+        "to_json / from_json, per amount",
+        lambda: [amount.to_json() for amount in amounts],
+        lambda encoded: [Dinero.from_json(data) for data in encoded],
+    )
+    report(
+        "to_bytes / from_bytes, per amount",
+        lambda: [amount.to_bytes() for amount in amounts],
+        lambda encoded: [Dinero.from_bytes(data) for data in encoded],
+    )
+    report(
+        "dumps_many / loads_many",
+        lambda: dinero.dumps_many(amounts),
+        dinero.loads_many,
+    )
+    report(
+        "DineroArray to_bytes / from_bytes",
+        array.to_bytes,
+        DineroArray.from_bytes,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
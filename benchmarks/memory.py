@@ -0,0 +1,41 @@
+"""
+Memory used per Dinero instance.
+
+Allocates N Dinero objects from pre-built inputs and reports the traced memory
+per instance, so only the objects themselves (and whatever they own) are
+counted.
+
+Usage:
+    python benchmarks/memory.py [N]
+
+Results on CPython 3.11, 100,000 USD instances:
+
+    layout                               bytes per Dinero
+    instance __dict__ (0.4.0)            96, 392 once the __dict__ is materialized
+    __slots__ + int minor units          80
+    + cached Decimal amount              88, about 190 once it's read
+"""
+
+import sys
+import tracemalloc
+
+from dinero import Dinero
+from dinero.currencies import USD
+
+
+def main(count: int = 100_000) -> None:
+    amounts = [f"{i}.{i % 100:02d}" for i in range(count)]
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [Dinero(amount, USD) for amount in amounts]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    list_overhead = sys.getsizeof(objects)
+    per_instance = (after - before - list_overhead) / count
+    print(f"{count:,} instances: {per_instance:.1f} bytes per Dinero")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
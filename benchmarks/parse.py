@@ -0,0 +1,70 @@
+"""
+Compare reading formatted amounts by stripping the symbol, code and separators
+before calling the Dinero constructor, with Dinero.parse and with parse_many.
+
+Usage:
+    python benchmarks/parse.py [N]
+
+Results on CPython 3.11, N = 200,000 amounts in 3 currencies, written like
+"$-1,234.56 USD":
+
+    parser                                          time
+    strip + Dinero(text, currency)                  1.430s
+    Dinero.parse(text)                              2.244s
+    parse_many(texts)                               1.041s
+
+    66,617 USD amounts with a symbol
+    Dinero.parse(text, USD)                         0.539s
+    parse_many(texts, USD)                          0.302s
+
+The naive loop only reads this one layout, parse_many also reads codes before
+the amount, trailing signs and other separators.
+"""
+
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from dinero import Dinero, parse_many
+from dinero.currencies import EUR, GBP, USD, get_currency
+
+
+def report(name: str, operation: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    operation()
+    print(f"{name:<48}{time.perf_counter() - start:.3f}s")
+
+
+def naive(text: str) -> Dinero:
+    """Strip the symbol, code and grouping commas, then use the constructor."""
+    text = text.strip()
+    code = text[-3:]
+    currency = get_currency(code)
+    text = text[:-3].replace(currency.get("symbol", "$"), "").replace(",", "")
+    return Dinero(text.strip(), currency)
+
+
+def main(count: int = 200_000) -> None:
+    rng = random.Random(42)
+    currencies = [USD, EUR, GBP]
+    amounts = [
+        Dinero.from_minor_units(rng.randrange(-(10**9), 10**9), rng.choice(currencies))
+        for _ in range(count)
+    ]
+    texts = [amount.format(symbol=True, currency=True) for amount in amounts]
+    usd = [amount.format(symbol=True) for amount in amounts if amount.code == "USD"]
+
+    assert [naive(text) for text in texts[:1000]] == amounts[:1000]
+    assert parse_many(texts) == amounts
+
+    report("strip + Dinero(text, currency)", lambda: [naive(text) for text in texts])
+    report("Dinero.parse(text)", lambda: [Dinero.parse(text) for text in texts])
+    report("parse_many(texts)", lambda: parse_many(texts))
+    print(f"\n{len(usd):,} USD amounts with a symbol")
+    report("Dinero.parse(text, USD)", lambda: [Dinero.parse(text, USD) for text in usd])
+    report("parse_many(texts, USD)", lambda: parse_many(usd, USD))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
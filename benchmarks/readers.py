@@ -0,0 +1,64 @@
+"""
+Compare reading a CSV and a JSON Lines file of amounts with a per-row constructor
+loop and with the streaming readers.
+
+Usage:
+    python benchmarks/readers.py [N]
+
+Results on CPython 3.11, N = 500,000 rows in 3 currencies:
+
+    reader                                          time
+    csv.reader + Dinero(row[1], currency)           4.045s
+    CSVReader                                       1.871s
+    CSVReader.arrays()                              1.526s
+    json.loads + Dinero.from_dict(row)              5.352s
+    JSONLinesReader                                 4.505s
+"""
+
+import csv
+import io
+import json
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from dinero import CSVReader, Dinero, JSONLinesReader
+from dinero.currencies import get_currency
+
+
+def report(name: str, operation: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    operation()
+    print(f"{name:<48}{time.perf_counter() - start:.3f}s")
+
+
+def main(count: int = 500_000) -> None:
+    rng = random.Random(42)
+    codes = ["USD", "EUR", "GBP"]
+    rows = [
+        (index, f"{rng.randrange(-(10**7), 10**7) / 100:.2f}", rng.choice(codes))
+        for index in range(count)
+    ]
+    csv_text = "id,amount,currency\n" + "".join(f"{i},{a},{c}\n" for i, a, c in rows)
+    json_lines = [
+        Dinero(amount, get_currency(code)).to_json() + "\n" for _, amount, code in rows
+    ]
+
+    def naive_csv() -> list[Dinero]:
+        reader = csv.reader(io.StringIO(csv_text))
+        next(reader)
+        return [Dinero(row[1], get_currency(row[2])) for row in reader]
+
+    report("csv.reader + Dinero(row[1], currency)", naive_csv)
+    report("CSVReader", lambda: list(CSVReader(io.StringIO(csv_text))))
+    report("CSVReader.arrays()", lambda: list(CSVReader(io.StringIO(csv_text)).arrays()))
+    report(
+        "json.loads + Dinero.from_dict(row)",
+        lambda: [Dinero.from_dict(json.loads(line)) for line in json_lines],
+    )
+    report("JSONLinesReader", lambda: list(JSONLinesReader(json_lines)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,73 @@
+"""
+Compare the totals per currency of a large CSV file computed with a single
+process loop and with `dinero.sum_file` and several worker processes.
+
+Usage:
+    python benchmarks/sharded_totals.py [N] [WORKERS]
+
+Results on CPython 3.11, N = 2,000,000 rows in 3 currencies, on a 1 CPU machine,
+so the workers share one core and the times show the overhead of splitting and
+merging, not the speedup:
+
+    reader                                          time
+    csv.reader + Dinero + MoneyBag                  15.842s
+    MoneyBag(CSVReader(file))                       4.176s
+    sum_file(workers=1)                             4.461s
+    sum_file(workers=4)                             4.367s
+
+The speedup of `sum_file` grows with the number of CPUs, since workers only send
+back one total per currency and key.
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from dinero import CSVReader, Dinero, MoneyBag, sum_file
+from dinero.currencies import get_currency
+
+
+def report(name: str, operation: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = operation()
+    print(f"{name:<48}{time.perf_counter() - start:.3f}s")
+    return result
+
+
+def main(count: int = 2_000_000, workers: int = 4) -> None:
+    rng = random.Random(42)
+    codes = ["USD", "EUR", "GBP"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "amounts.csv")
+        with open(path, "w") as file:
+            file.write("id,amount,currency\n")
+            for index in range(count):
+                amount = rng.randrange(-(10**7), 10**7) / 100
+                file.write(f"{index},{amount:.2f},{rng.choice(codes)}\n")
+
+        def naive() -> MoneyBag:
+            with open(path, newline="") as file:
+                rows = csv.reader(file)
+                next(rows)
+                return MoneyBag(Dinero(row[1], get_currency(row[2])) for row in rows)
+
+        def streaming() -> MoneyBag:
+            with open(path, newline="") as file:
+                return MoneyBag(CSVReader(file))
+
+        expected = report("csv.reader + Dinero + MoneyBag", naive)
+        assert report("MoneyBag(CSVReader(file))", streaming) == expected
+        single = report("sum_file(workers=1)", lambda: sum_file(path, workers=1))
+        sharded = report(
+            f"sum_file(workers={workers})", lambda: sum_file(path, workers=workers)
+        )
+        assert single.totals == sharded.totals == expected
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
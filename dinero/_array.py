@@ -0,0 +1,780 @@
+"""
+DineroArray stores many amounts of a single currency as a compact buffer of
+minor units.
+
+- add:: Returns a new DineroArray with the elementwise sum.
+- subtract:: Returns a new DineroArray with the elementwise difference.
+- multiply:: Returns a new DineroArray multiplied by a factor or a vector of factors.
+- divide:: Returns a new DineroArray divided by a divisor or a vector of divisors.
+- eq, lt, lte, gt, gte:: Return elementwise comparison masks.
+- allocate:: Splits every amount by ratios, returning one DineroArray per ratio.
+- sum, min, max:: Return the exact total, smallest and largest amounts.
+- to_list:: Returns the amounts as a list of Dinero objects.
+- to_numpy:: Returns a read-only NumPy view of the minor units.
+- to_bytes, from_bytes:: Encode and decode the array in a compact binary format.
+- from_buffer:: Returns a DineroArray sharing the memory of a buffer of int64.
+"""
+
+import operator
+import sys
+from array import array
+from decimal import Decimal
+from itertools import compress, repeat
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeAlias, overload
+
+from . import _codec
+from ._dinero import Dinero
+from ._utils import (
+    allocate_minor_units,
+    divide_minor_units,
+    multiply_minor_units,
+    to_minor_units,
+    to_ratio,
+    to_weights,
+)
+from ._validators import Validators
+from .exceptions import DifferentCurrencyError, InvalidOperationError
+from .types import Currency, CurrencyDict, OperationType
+
+_NOT_LOADED = object()
+
+# The NumPy engine, imported by `load_engine` the first time an array is large
+# enough to use it, so `import dinero` doesn't import NumPy. None when NumPy is
+# not installed.
+engine: Any = _NOT_LOADED
+
+validate = Validators()
+
+# array typecode of the minor units buffer, a signed 64 bit integer.
+TYPECODE = "q"
+
+# Arrays with at least this many elements use the NumPy engine when it's
+# installed, smaller ones are faster with the Python loops.
+ENGINE_MIN_SIZE = 32
+
+Factor: TypeAlias = int | float | Decimal
+Operand: TypeAlias = "DineroArray | Dinero | OperationType"
+
+
+def load_engine() -> Any:
+    """
+    Return the NumPy engine, importing it on the first call.
+
+    Returns:
+        MODULE: The `dinero._numpy` module, or None when NumPy is not installed.
+    """
+    global engine
+    if engine is _NOT_LOADED:
+        try:
+            from . import _numpy
+        except ImportError:  # pragma: no cover
+            engine = None
+        else:
+            engine = _numpy
+    return engine
+
+
+class DineroArray:
+    """
+    A sequence of amounts in a single currency, stored as a compact, read-only
+    buffer of signed 64 bit minor units. Arithmetic is done elementwise on the
+    integers, with the same rounding as Dinero, and accepts another array of the same
+    length or a single value that is applied to every element.
+
+    Amounts must fit in a signed 64 bit integer of minor units, an `OverflowError`
+    is raised otherwise.
+
+    The minor units are exposed without copying through `minor_units`, and through
+    the buffer protocol on Python 3.12+, so `memoryview(prices)` and
+    `numpy.asarray(prices)` work directly. Slicing returns a view of the same
+    memory.
+
+    Examples:
+        >>> prices = DineroArray(["2.32", "10", "0.99"], USD)
+        >>> (prices * 2).to_list()
+        [Dinero(amount=4.64, ...), Dinero(amount=20.00, ...), Dinero(amount=1.98, ...)]
+
+        >>> prices > Dinero("1", USD)
+        [True, True, False]
+
+    Args:
+        amounts (iterable): Amounts as str, int, float, Decimal or Dinero objects.
+        currency (dict, optional): The currency of the amounts. Defaults to the
+            currency of the first Dinero object.
+    """
+
+    __slots__ = ("_units", "_currency")
+
+    _units: memoryview
+    _currency: Currency
+
+    def __init__(
+        self,
+        amounts: Iterable["Dinero | OperationType"],
+        currency: Currency | CurrencyDict | None = None,
+    ):
+        amounts = list(amounts)
+
+        if currency is None:
+            if not amounts or not isinstance(amounts[0], Dinero):
+                raise ValueError("A currency is required for DineroArray")
+            currency = amounts[0].currency
+
+        self._currency = Currency.from_dict(currency)
+        units = array(TYPECODE, [self._to_minor_units(a) for a in amounts])
+        self._units = memoryview(units).toreadonly()
+
+    @classmethod
+    def from_minor_units(
+        cls, units: Iterable[int], currency: Currency | CurrencyDict
+    ) -> "DineroArray":
+        """
+        Returns a new DineroArray from integer counts of minor units, skipping the
+        validation done by the constructor.
+
+        Examples:
+            >>> DineroArray.from_minor_units([232, 1000], USD).to_list()
+            [Dinero(amount=2.32, ...), Dinero(amount=10.00, ...)]
+
+        Args:
+            units (iterable): The amounts in minor units.
+            currency (dict): The currency of the amounts.
+
+        Returns:
+            DINEROARRAY: DineroArray object.
+        """
+        return cls._from_array(array(TYPECODE, units), Currency.from_dict(currency))
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> "DineroArray":
+        """
+        Returns a new DineroArray from the binary format of `to_bytes`. The minor
+        units are copied from a memoryview of the data in a single block.
+
+        Examples:
+            >>> DineroArray.from_bytes(DineroArray(["2.32", "10"], USD).to_bytes())
+            DineroArray(['2.32', '10.00'], currency='USD')
+
+        Args:
+            data (bytes, bytearray, memoryview): The encoded array.
+
+        Raises:
+            UnknownCurrencyError: No currency is registered with the numeric code.
+            ValueError: The data is not an encoded DineroArray.
+
+        Returns:
+            DINEROARRAY: DineroArray object.
+        """
+        view = memoryview(data).cast("B")
+        header = _codec.ARRAY_HEADER
+        if len(view) < header.size or (len(view) - header.size) % 8:
+            raise ValueError("The data is not an encoded DineroArray")
+
+        magic, version, numeric = header.unpack_from(view)
+        if magic != _codec.ARRAY_MAGIC or version != _codec.ARRAY_VERSION:
+            raise ValueError("The data is not an encoded DineroArray")
+
+        units = array(TYPECODE)
+        units.frombytes(view[header.size :])
+        if not _codec.NATIVE_ORDER:  # pragma: no cover
+            units.byteswap()
+
+        return cls._from_array(units, _codec.decode_currency(numeric))
+
+    @classmethod
+    def from_buffer(
+        cls, buffer: Any, currency: Currency | CurrencyDict
+    ) -> "DineroArray":
+        """
+        Returns a new DineroArray that shares the memory of a buffer of signed 64 bit
+        integers in native byte order, like an `array("q")`, a NumPy int64 array or
+        raw bytes, without copying it. Only buffers with gaps between their elements,
+        like a NumPy slice with a step, are copied.
+
+        The buffer is read as the amounts in minor units, so changes made to it
+        afterwards are visible in the DineroArray, and resizable buffers like a
+        `bytearray` can't be resized while the DineroArray exists.
+
+        Examples:
+            >>> DineroArray.from_buffer(array("q", [232, 1000]), USD)
+            DineroArray(['2.32', '10.00'], currency='USD')
+
+        Args:
+            buffer (buffer): Any object supporting the buffer protocol.
+            currency (dict): The currency of the amounts.
+
+        Raises:
+            TypeError: The buffer doesn't contain 64 bit integers.
+            ValueError: The buffer is not one dimensional, is in a different byte
+                order, or its size is not a multiple of 8 bytes.
+
+        Returns:
+            DINEROARRAY: DineroArray object.
+        """
+        return cls._from_array(_int64_view(buffer), Currency.from_dict(currency))
+
+    @classmethod
+    def _from_array(
+        cls, units: "array | memoryview", currency: Currency
+    ) -> "DineroArray":
+        obj = object.__new__(cls)
+        obj._units = memoryview(units).toreadonly()
+        obj._currency = currency
+        return obj
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @property
+    def code(self) -> str:
+        return self._currency.code
+
+    @property
+    def exponent(self) -> int:
+        return self._currency.exponent
+
+    @property
+    def minor_units(self) -> memoryview:
+        return self._units
+
+    def to_list(self) -> list[Dinero]:
+        """
+        Returns the amounts as a list of Dinero objects.
+
+        Returns:
+            LIST: List of Dinero objects.
+        """
+        currency = self._currency
+        new = Dinero._from_minor_units
+        return [new(units, currency) for units in self._units]
+
+    def add(self, amount: Operand) -> "DineroArray":
+        """
+        Returns a new DineroArray with the elementwise sum of this and other array,
+        or of every element and a single amount.
+
+        Examples:
+            >>> DineroArray(["1", "2"], USD).add(DineroArray(["0.5", "0.5"], USD))
+            DineroArray(['1.50', '2.50'], currency='USD')
+
+            >>> DineroArray(["1", "2"], USD).add("0.5")
+            DineroArray(['1.50', '2.50'], currency='USD')
+
+        Args:
+            amount (DineroArray, Dinero, str, int, float, Decimal): The addend.
+
+        Raises:
+            DifferentCurrencyError: Different currencies where used.
+            InvalidOperationError: An operation between unsupported types was executed.
+            ValueError: The arrays have different lengths.
+
+        Returns:
+            DINEROARRAY: DineroArray object.
+        """
+        return self.__add__(amount)
+
+    def subtract(self, amount: Operand) -> "DineroArray":
+        """
+        Returns a new DineroArray with the elementwise difference of this and other
+        array, or of every element and a single amount.
+
+        Examples:
+            >>> DineroArray(["1", "2"], USD).subtract("0.5")
+            DineroArray(['0.50', '1.50'], currency='USD')
+
+        Args:
+            amount (DineroArray, Dinero, str, int, float, Decimal): The subtrahend.
+
+        Raises:
+            DifferentCurrencyError: Different currencies where used.
+            InvalidOperationError: An operation between unsupported types was executed.
+            ValueError: The arrays have different lengths.
+
+        Returns:
+            DINEROARRAY: DineroArray object.
+        """
+        return self.__sub__(amount)
+
+    def multiply(self, factor: Factor | Sequence[Factor]) -> "DineroArray":
+        """
+        Returns a new DineroArray with every element multiplied by a factor, or by
+        the matching element of a sequence of factors. Results are rounded half to
+        even to the currency exponent, exactly like `Dinero.multiply`.
+
+        Examples:
+            >>> DineroArray(["2.32", "10"], USD).multiply(3)
+            DineroArray(['6.96', '30.00'], currency='USD')
+
+            >>> DineroArray(["2.32", "10"], USD).multiply([1, Decimal("0.5")])
+            DineroArray(['2.32', '5.00'], currency='USD')
+
+        Args:
+            factor (int, float, Decimal, sequence): The multiplicand.
+
+        Raises:
+            InvalidOperationError: An operation between unsupported types was executed.
+            ValueError: The sequence has a different length.
+
+        Returns:
+            DINEROARRAY: DineroArray object.
+        """
+        return self.__mul__(factor)
+
+    def divide(self, divisor: Factor | Sequence[Factor]) -> "DineroArray":
+        """
+        Returns a new DineroArray with every element divided by a divisor, or by the
+        matching element of a sequence of divisors. Results are rounded half to even
+        to the currency exponent, exactly like `Dinero.divide`.
+
+        Examples:
+            >>> DineroArray(["2.32", "10"], USD).divide(3)
+            DineroArray(['0.77', '3.33'], currency='USD')
+
+        Args:
+            divisor (int, float, Decimal, sequence): The divisor.
+
+        Raises:
+            InvalidOperationError: An operation between unsupported types was executed.
+            ValueError: The sequence has a different length.
+            ZeroDivisionError: A divisor is zero.
+
+        Returns:
+            DINEROARRAY: DineroArray object.
+        """
+        return self.__truediv__(divisor)
+
+    def allocate(self, ratios: Sequence[Factor]) -> list["DineroArray"]:
+        """
+        Splits every amount in shares proportional to the given ratios, exactly like
+        `Dinero.allocate`, so the shares of each amount add up to it. Returns one
+        DineroArray per ratio.
+
+        Examples:
+            >>> fees, payouts = DineroArray(["100", "0.05"], USD).allocate([15, 85])
+            >>> fees
+            DineroArray(['15.00', '0.01'], currency='USD')
+            >>> payouts
+            DineroArray(['85.00', '0.04'], currency='USD')
+
+        Args:
+            ratios (list, tuple): The ratios as int, float or Decimal.
+
+        Raises:
+            InvalidOperationError: An operation between unsupported types was executed.
+            ValueError: There are no ratios, a ratio is negative or all of them are
+                zero.
+
+        Returns:
+            LIST: One DineroArray object per ratio.
+        """
+        validate.allocation_ratios(ratios)
+        weights = to_weights(ratios)
+
+        engine = self._engine()
+        if engine is not None:
+            shares = engine.allocate(engine.as_vector(self._units), weights)
+            return [self._from_array(engine.to_array(s), self._currency) for s in shares]
+
+        rows = [allocate_minor_units(units, weights) for units in self._units]
+        columns = zip(*rows) if rows else [()] * len(weights)
+        return [self._from_array(array(TYPECODE, c), self._currency) for c in columns]
+
+    def eq(self, amount: Operand) -> list[bool]:
+        """
+        Returns a mask with whether each element equals the other.
+
+        Examples:
+            >>> DineroArray(["1", "2"], USD).eq(Dinero("2", USD))
+            [False, True]
+
+        Args:
+            amount (DineroArray, Dinero, str, int, float, Decimal): The amounts to
+                compare to.
+
+        Raises:
+            DifferentCurrencyError: Different currencies where used.
+            InvalidOperationError: An operation between unsupported types was executed.
+            ValueError: The arrays have different lengths.
+
+        Returns:
+            LIST: One bool per element.
+        """
+        return self._compare(amount, operator.eq)
+
+    def lt(self, amount: Operand) -> list[bool]:
+        """Returns a mask with whether each element is less than the other."""
+        return self._compare(amount, operator.lt)
+
+    def lte(self, amount: Operand) -> list[bool]:
+        """Returns a mask with whether each element is less than or equal the other."""
+        return self._compare(amount, operator.le)
+
+    def gt(self, amount: Operand) -> list[bool]:
+        """Returns a mask with whether each element is greater than the other."""
+        return self._compare(amount, operator.gt)
+
+    def gte(self, amount: Operand) -> list[bool]:
+        """Returns a mask with whether each element is greater or equal the other."""
+        return self._compare(amount, operator.ge)
+
+    def sum(self) -> Dinero:
+        """
+        Returns the exact sum of the amounts, which can exceed the 64 bit range of
+        the elements.
+
+        Examples:
+            >>> DineroArray(["2.32", "10"], USD).sum()
+            Dinero(amount=12.32, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+        Returns:
+            DINERO: Dinero object.
+        """
+        engine = self._engine()
+        if engine is not None:
+            units = engine.total(engine.as_vector(self._units))
+        else:
+            units = sum(self._units)
+        return Dinero._from_minor_units(units, self._currency)
+
+    def min(self) -> Dinero:
+        """
+        Returns the smallest amount.
+
+        Raises:
+            ValueError: The array is empty.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+        return self._reduce(min, "minimum")
+
+    def max(self) -> Dinero:
+        """
+        Returns the largest amount.
+
+        Raises:
+            ValueError: The array is empty.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+        return self._reduce(max, "maximum")
+
+    def to_numpy(self) -> Any:
+        """
+        Returns a read-only NumPy view of the minor units, without copying them.
+
+        Examples:
+            >>> DineroArray(["2.32", "10"], USD).to_numpy()
+            array([ 232, 1000])
+
+        Raises:
+            ImportError: NumPy is not installed.
+
+        Returns:
+            NDARRAY: int64 array of minor units.
+        """
+        engine = load_engine()
+        if engine is None:
+            raise ImportError("DineroArray.to_numpy requires NumPy")
+
+        vector = engine.as_vector(self._units)
+        vector.flags.writeable = False
+        return vector
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the array in a compact binary format: an 8 byte header with the
+        ISO 4217 numeric code of the currency, followed by the minor units as
+        little endian 64 bit integers.
+
+        Examples:
+            >>> len(DineroArray(["2.32", "10"], USD).to_bytes())
+            24
+
+        Raises:
+            UnknownCurrencyError: The currency has no registered numeric code.
+            ValueError: The currency differs from the currency registered for its
+                code.
+
+        Returns:
+            BYTES: The encoded array.
+        """
+        numeric = _codec.encode_currency(self._currency)
+        header = _codec.ARRAY_HEADER.pack(
+            _codec.ARRAY_MAGIC, _codec.ARRAY_VERSION, numeric
+        )
+
+        return header + self._little_endian_bytes()
+
+    def _little_endian_bytes(self) -> bytes:
+        if not _codec.NATIVE_ORDER:  # pragma: no cover
+            swapped = array(TYPECODE, self._units)
+            swapped.byteswap()
+            return swapped.tobytes()
+
+        return self._units.tobytes()
+
+    def _reduce(self, func: Callable[[memoryview], int], vector_func: str) -> Dinero:
+        if not self._units:
+            raise ValueError(f"{func.__name__}() of an empty DineroArray")
+
+        engine = self._engine()
+        if engine is not None:
+            units = getattr(engine, vector_func)(engine.as_vector(self._units))
+        else:
+            units = func(self._units)
+        return Dinero._from_minor_units(units, self._currency)
+
+    def _to_minor_units(self, amount: "Dinero | OperationType") -> int:
+        """
+        Return the minor units of a single amount in this array's currency.
+
+        Args:
+            amount (str, int, float, Decimal, Dinero): The amount.
+
+        Raises:
+            DifferentCurrencyError: Different currencies where used.
+            InvalidOperationError: An operation between unsupported types was executed.
+
+        Returns:
+            INT: The amount in minor units.
+        """
+        if isinstance(amount, Dinero):
+            self._check_currency(amount.currency)
+            return amount._minor_units
+
+        validate.dinero_amount(amount)
+        return to_minor_units(amount, self._currency.exponent)
+
+    def _check_currency(self, currency: Currency) -> None:
+        # the same interned currency, or one that only differs in its symbol
+        if currency is not self._currency and currency.unit != self._currency.unit:
+            raise DifferentCurrencyError("Currencies can not be different")
+
+    def _operand(self, amount: Operand) -> "memoryview | int":
+        """
+        Return the minor units to combine elementwise with this array: the other
+        array's buffer, or the minor units of a single amount.
+        """
+        if isinstance(amount, DineroArray):
+            self._check_currency(amount._currency)
+            if len(amount._units) != len(self._units):
+                raise ValueError("DineroArray objects must have the same length")
+            return amount._units
+
+        validate.addition_and_subtraction_amount(amount)
+        return self._to_minor_units(amount)
+
+    def _ratios(
+        self, factor: Factor | Sequence[Factor]
+    ) -> tuple[int, int] | list[tuple[int, int]]:
+        """Return the exact ratio of a factor, or one per element for a sequence."""
+        if isinstance(factor, (list, tuple, array, range)):
+            if len(factor) != len(self._units):
+                raise ValueError("The factors must have the same length as the array")
+            for number in factor:
+                validate.multiplication_and_division_amount(number)
+            return [to_ratio(number) for number in factor]
+
+        validate.multiplication_and_division_amount(factor)  # type: ignore[arg-type]
+        return to_ratio(factor)  # type: ignore[arg-type]
+
+    def _engine(self) -> Any:
+        """Return the NumPy engine if the array is large enough to use it."""
+        if len(self._units) < ENGINE_MIN_SIZE:
+            return None
+        return load_engine()
+
+    def _apply(
+        self,
+        func: Callable[..., int],
+        vector_func: str,
+        operand: "memoryview | int | tuple[int, int] | list[tuple[int, int]]",
+    ) -> "DineroArray":
+        """
+        Combine every element with the operand, using the function of the NumPy
+        engine with the given name for large arrays. Both paths give identical
+        results.
+        """
+        engine = self._engine()
+        if engine is not None:
+            other = (
+                engine.as_vector(operand) if isinstance(operand, memoryview) else operand
+            )
+            result = getattr(engine, vector_func)(engine.as_vector(self._units), other)
+            return self._from_array(engine.to_array(result), self._currency)
+
+        operands = (
+            operand if isinstance(operand, (memoryview, list)) else repeat(operand)
+        )
+        units = array(TYPECODE, map(func, self._units, operands))
+        return self._from_array(units, self._currency)
+
+    def _compare(
+        self, amount: Operand, func: Callable[[int, int], bool]
+    ) -> list[bool]:
+        other = self._operand(amount)
+        operands = repeat(other) if isinstance(other, int) else other
+        return list(map(func, self._units, operands))
+
+    def __add__(self, amount: Operand) -> "DineroArray":
+        return self._apply(operator.add, "add", self._operand(amount))
+
+    def __radd__(self, amount: Operand) -> "DineroArray":
+        return self.__add__(amount)
+
+    def __sub__(self, amount: Operand) -> "DineroArray":
+        return self._apply(operator.sub, "subtract", self._operand(amount))
+
+    def __mul__(self, factor: Factor | Sequence[Factor]) -> "DineroArray":
+        return self._apply(
+            lambda units, ratio: multiply_minor_units(units, *ratio),
+            "multiply",
+            self._ratios(factor),
+        )
+
+    def __rmul__(self, factor: Factor | Sequence[Factor]) -> "DineroArray":
+        return self.__mul__(factor)
+
+    def __truediv__(self, divisor: Factor | Sequence[Factor]) -> "DineroArray":
+        return self._apply(
+            lambda units, ratio: divide_minor_units(units, *ratio),
+            "divide",
+            self._ratios(divisor),
+        )
+
+    def __neg__(self) -> "DineroArray":
+        engine = self._engine()
+        if engine is not None:
+            units = engine.to_array(engine.negate(engine.as_vector(self._units)))
+        else:
+            units = array(TYPECODE, map(operator.neg, self._units))
+        return self._from_array(units, self._currency)
+
+    def _compare_operator(
+        self, amount: object, func: Callable[[int, int], bool]
+    ) -> list[bool]:
+        if not isinstance(amount, (DineroArray, Dinero)):
+            raise InvalidOperationError(InvalidOperationError.comparison_msg)
+        return self._compare(amount, func)
+
+    def __eq__(self, amount: object) -> list[bool]:  # type: ignore[override]
+        return self._compare_operator(amount, operator.eq)
+
+    def __ne__(self, amount: object) -> list[bool]:  # type: ignore[override]
+        return self._compare_operator(amount, operator.ne)
+
+    def __lt__(self, amount: object) -> list[bool]:
+        return self._compare_operator(amount, operator.lt)
+
+    def __le__(self, amount: object) -> list[bool]:
+        return self._compare_operator(amount, operator.le)
+
+    def __gt__(self, amount: object) -> list[bool]:
+        return self._compare_operator(amount, operator.gt)
+
+    def __ge__(self, amount: object) -> list[bool]:
+        return self._compare_operator(amount, operator.ge)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __iter__(self) -> Iterator[Dinero]:
+        currency = self._currency
+        new = Dinero._from_minor_units
+        return (new(units, currency) for units in self._units)
+
+    @overload
+    def __getitem__(self, index: int) -> Dinero: ...
+
+    @overload
+    def __getitem__(self, index: "slice | Sequence[bool]") -> "DineroArray": ...
+
+    def __getitem__(
+        self, index: "int | slice | Sequence[bool]"
+    ) -> "Dinero | DineroArray":
+        if isinstance(index, slice):
+            return self._from_array(self._units[index], self._currency)
+
+        if isinstance(index, int):
+            return Dinero._from_minor_units(self._units[index], self._currency)
+
+        if not _is_mask(index):
+            raise TypeError("Arrays are indexed by an int, a slice or a boolean mask")
+        if len(index) != len(self._units):
+            raise ValueError("The mask must have the same length as the array")
+
+        units = array(TYPECODE, compress(self._units, index))
+        return self._from_array(units, self._currency)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # Python 3.12+ (PEP 688), the minor units are read-only.
+        return memoryview(self._units)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # one block of little endian units and the currency code, like to_bytes
+        currency = _codec.reduce_currency(self._currency)
+        if type(self) is DineroArray:
+            return (_unpickle, (self._little_endian_bytes(), currency))
+        return (_unpickle, (self._little_endian_bytes(), currency, type(self)))
+
+    def __repr__(self) -> str:
+        amounts = [str(amount.raw_amount) for amount in self]
+        return f"DineroArray({amounts}, currency={self.code!r})"
+
+
+def _unpickle(
+    data: bytes, currency: str | Currency, cls: type[DineroArray] = DineroArray
+) -> DineroArray:
+    units = array(TYPECODE, data)
+    if not _codec.NATIVE_ORDER:  # pragma: no cover
+        units.byteswap()
+    return cls._from_array(units, _codec.restore_currency(currency))
+
+
+def _is_mask(index: Any) -> bool:
+    """Check whether an index is a sequence of booleans, or a NumPy boolean array."""
+    dtype = getattr(index, "dtype", None)
+    if dtype is not None:
+        return dtype.kind == "b"
+    return isinstance(index, Sequence) and all(type(flag) is bool for flag in index)
+
+
+def _int64_view(buffer: Any) -> memoryview:
+    """
+    Return a read-only view of a buffer as native signed 64 bit integers.
+
+    Raises:
+        TypeError: The buffer doesn't contain 64 bit integers.
+        ValueError: The buffer is not one dimensional, is in a different byte order,
+            or its size is not a multiple of 8 bytes.
+    """
+    view = memoryview(buffer)
+    if view.ndim != 1:
+        raise ValueError("The buffer must be one dimensional")
+
+    code = view.format.lstrip("@=")
+    if code[0] in "<>!":
+        if code[0] != ("<" if sys.byteorder == "little" else ">"):
+            raise ValueError("The buffer must be in the native byte order")
+        code = code[1:]
+
+    if code in ("q", "l") and view.itemsize == 8:
+        pass
+    elif code in ("B", "b", "c"):
+        if view.nbytes % 8:
+            raise ValueError("The buffer size must be a multiple of 8 bytes")
+    else:
+        raise TypeError("The buffer must contain signed 64 bit integers")
+
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+
+    if view.format != "q":
+        view = view.cast("B").cast("q")
+
+    return view.toreadonly()
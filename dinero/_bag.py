@@ -0,0 +1,277 @@
+"""
+MoneyBag keeps one exact running total per currency.
+
+- add:: Adds an amount, or every amount of a DineroArray, to its currency total.
+- sub:: Subtracts an amount, or every amount of a DineroArray, from its total.
+- add_many:: Adds many amounts of any currency in a single pass.
+- merge:: Adds the totals of other MoneyBag objects.
+- get:: Returns the total of a currency.
+- to_dict:: Returns the totals as a Python Dictionary.
+- to_json:: Returns the totals as a JSON string.
+"""
+
+import json
+from typing import Any, Iterable, Iterator, Mapping
+
+from ._array import DineroArray
+from ._dinero import Dinero
+from ._utils import DecimalEncoder
+from .currencies import get_currency
+from .exceptions import DifferentCurrencyError, InvalidOperationError
+from .types import Currency, CurrencyDict
+
+
+class MoneyBag:
+    """
+    A mutable accumulator of amounts in any number of currencies.
+
+    Every currency has its own total, kept as an exact integer count of minor units,
+    so adding an amount is a dictionary update. Amounts are grouped by currency
+    code, and an amount whose currency has the code of a total but another base or
+    exponent raises `DifferentCurrencyError`. Iterating a bag yields its totals as
+    Dinero objects, in the order the currencies were first added. Bags are equal
+    when their non-zero totals are, so a total that went back to zero doesn't make a
+    difference.
+
+    Examples:
+        >>> bag = MoneyBag([Dinero("2.32", USD), Dinero("10", EUR)])
+        >>> bag.add(Dinero("1", USD))
+        >>> list(bag)
+        [Dinero(amount=3.32, ...USD...), Dinero(amount=10.00, ...EUR...)]
+
+        >>> bag.get(USD)
+        Dinero(amount=3.32, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+    Args:
+        amounts (iterable, optional): Dinero objects to add to the bag.
+    """
+
+    __slots__ = ("_totals", "_currencies")
+
+    _totals: dict[str, int]
+    _currencies: dict[str, Currency]
+
+    def __init__(self, amounts: Iterable[Dinero] = ()):
+        self._totals = {}
+        self._currencies = {}
+        self.add_many(amounts)
+
+    def add(self, amount: Dinero | DineroArray) -> None:
+        """
+        Adds an amount to the total of its currency, or the sum of a DineroArray.
+
+        Args:
+            amount (Dinero, DineroArray): The amount to add.
+
+        Raises:
+            DifferentCurrencyError: The currency has the code of a total but another
+                base or exponent.
+            InvalidOperationError: An operation between unsupported types was executed.
+        """
+        currency, units = self._minor_units(amount)
+        self._add(currency, units)
+
+    def sub(self, amount: Dinero | DineroArray) -> None:
+        """
+        Subtracts an amount from the total of its currency, or the sum of a
+        DineroArray. Totals can become negative.
+
+        Args:
+            amount (Dinero, DineroArray): The amount to subtract.
+
+        Raises:
+            DifferentCurrencyError: The currency has the code of a total but another
+                base or exponent.
+            InvalidOperationError: An operation between unsupported types was executed.
+        """
+        currency, units = self._minor_units(amount)
+        self._add(currency, -units)
+
+    def add_many(self, amounts: Iterable[Dinero]) -> None:
+        """
+        Adds many amounts, of any currency, in a single pass.
+
+        Examples:
+            >>> bag = MoneyBag()
+            >>> bag.add_many([Dinero("1", USD), Dinero("2", EUR), Dinero("3", USD)])
+            >>> bag.to_dict()
+            {'USD': {'amount': '4.00', ...}, 'EUR': {'amount': '2.00', ...}}
+
+        Args:
+            amounts (iterable): Dinero objects.
+
+        Raises:
+            DifferentCurrencyError: A currency has the code of a total but another
+                base or exponent.
+            InvalidOperationError: An amount is not a Dinero object.
+        """
+        totals = self._totals
+        currencies = self._currencies
+        for amount in amounts:
+            try:
+                currency = amount._currency
+                units = amount._minor_units
+            except AttributeError:
+                raise InvalidOperationError(InvalidOperationError.operation_msg) from None
+
+            # the currency of the total, checked by `_add` when it isn't the same
+            code = currency.code
+            if currencies.get(code) is currency:
+                totals[code] += units
+            else:
+                self._add(currency, units)
+
+    def merge(self, *bags: "MoneyBag") -> None:
+        """
+        Adds the totals of other bags to this one. The cost depends on the number of
+        currencies, not on the number of amounts that were added to the bags, so
+        bags filled in parallel can be combined at the end.
+
+        Examples:
+            >>> bag = MoneyBag([Dinero("1", USD)])
+            >>> bag.merge(MoneyBag([Dinero("2", USD)]), MoneyBag([Dinero("3", EUR)]))
+            >>> list(bag)
+            [Dinero(amount=3.00, ...USD...), Dinero(amount=3.00, ...EUR...)]
+
+        Args:
+            bags (MoneyBag): The bags to merge.
+
+        Raises:
+            DifferentCurrencyError: A currency has the code of a total but another
+                base or exponent.
+            InvalidOperationError: An operation between unsupported types was executed.
+        """
+        for bag in bags:
+            if not isinstance(bag, MoneyBag):
+                raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+            for code, units in bag._totals.items():
+                self._add(bag._currencies[code], units)
+
+    def get(self, currency: Currency | CurrencyDict | str) -> Dinero:
+        """
+        Returns the total of a currency, zero when nothing was added in it.
+
+        Examples:
+            >>> MoneyBag([Dinero("2.32", USD)]).get("EUR")
+            Dinero(amount=0.00, currency={'code': 'EUR', 'base': 10, 'exponent': 2...
+
+        Args:
+            currency (dict, str): The currency, or its code.
+
+        Raises:
+            DifferentCurrencyError: The currency has the code of a total but another
+                base or exponent.
+            UnknownCurrencyError: No currency is registered with the given code.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+        if isinstance(currency, str):
+            resolved = self._currencies.get(currency) or get_currency(currency)
+        else:
+            resolved = Currency.from_dict(currency)
+
+        code = resolved.code
+        if code not in self._totals:
+            return Dinero._from_minor_units(0, resolved)
+
+        total = self._currencies[code]
+        if total is not resolved and total.unit != resolved.unit:
+            raise DifferentCurrencyError("Currencies can not be different")
+        return Dinero._from_minor_units(self._totals[code], total)
+
+    @property
+    def currencies(self) -> list[Currency]:
+        return list(self._currencies.values())
+
+    def to_dict(self, amount_with_format: bool = False) -> dict[str, Any]:
+        """
+        Returns the totals as a Python Dictionary, keyed by currency code, with the
+        same format as `Dinero.to_dict` for each total.
+
+        Examples:
+            >>> MoneyBag([Dinero("2.32", USD)]).to_dict()
+            {'USD': {'amount': '2.32', 'currency': {'code': 'USD', ...}}}
+
+        Args:
+            amount_with_format (bool): If the amounts are formatted. Defaults to False.
+
+        Returns:
+            DICT: The totals as a Python Dictionary.
+        """
+        return {total.code: total.to_dict(amount_with_format) for total in self}
+
+    def to_json(self, amount_with_format: bool = False) -> str:
+        """
+        Returns the totals as a JSON string.
+
+        Args:
+            amount_with_format (bool): If the amounts are formatted. Defaults to False.
+
+        Returns:
+            STR: The totals as JSON.
+        """
+        return json.dumps(self.to_dict(amount_with_format), cls=DecimalEncoder)
+
+    def _add(self, currency: Currency, units: int) -> None:
+        code = currency.code
+        if code in self._totals:
+            total = self._currencies[code]
+            if total is not currency and total.unit != currency.unit:
+                raise DifferentCurrencyError("Currencies can not be different")
+            self._totals[code] += units
+        else:
+            self._totals[code] = units
+            self._currencies[code] = currency
+
+    @staticmethod
+    def _minor_units(amount: Dinero | DineroArray) -> tuple[Currency, int]:
+        if isinstance(amount, Dinero):
+            return amount._currency, amount._minor_units
+
+        if isinstance(amount, DineroArray):
+            return amount.currency, amount.sum()._minor_units
+
+        raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+    def __iadd__(self, amount: "Dinero | DineroArray | MoneyBag") -> "MoneyBag":
+        if isinstance(amount, MoneyBag):
+            self.merge(amount)
+        else:
+            self.add(amount)
+        return self
+
+    def __isub__(self, amount: Dinero | DineroArray) -> "MoneyBag":
+        self.sub(amount)
+        return self
+
+    def __iter__(self) -> Iterator[Dinero]:
+        new = Dinero._from_minor_units
+        currencies = self._currencies
+        return (new(units, currencies[code]) for code, units in self._totals.items())
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def __contains__(self, currency: object) -> bool:
+        if isinstance(currency, Mapping):
+            return currency.get("code") in self._totals
+        return currency in self._totals
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MoneyBag):
+            return NotImplemented
+        # a zero total is the same as no total, as `get` returns zero for both
+        totals = {code: total for code, total in self._totals.items() if total}
+        others = {code: total for code, total in other._totals.items() if total}
+        return totals == others and all(
+            self._currencies[code].unit == other._currencies[code].unit
+            for code in totals
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        totals = ", ".join(f"{total.code}={total.raw_amount}" for total in self)
+        return f"MoneyBag({totals})"
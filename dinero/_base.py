@@ -1,57 +1,136 @@
-from decimal import Decimal, getcontext
-from typing import TYPE_CHECKING
+from decimal import Context, Decimal
+from operator import attrgetter
+from typing import Any, Callable, overload
 
+from typing_extensions import Self
+
+from ._utils import format_minor_units, from_minor_units, to_minor_units
 from ._validators import Validators
 from .exceptions import DifferentCurrencyError
-from .types import Currency, OperationType
-
-if TYPE_CHECKING:
-    from ._dinero import Dinero
+from .types import Currency, CurrencyDict, OperationType
 
 validate = Validators()
 
 
+class SortKey:
+    """
+    The `sort_key` attribute of Dinero objects.
+
+    On an instance it's the amount in minor units. On the class it's a key function
+    implemented in C, `operator.attrgetter("_minor_units")`, so
+    `sorted(prices, key=Dinero.sort_key)` compares plain integers without calling
+    any Python code per element.
+    """
+
+    _key = attrgetter("_minor_units")
+
+    @overload
+    def __get__(self, obj: None, owner: Any = None) -> Callable[[Any], int]: ...
+
+    @overload
+    def __get__(self, obj: "Base", owner: Any = None) -> int: ...
+
+    def __get__(self, obj: "Base | None", owner: Any = None) -> Any:
+        if obj is None:
+            return self._key
+        return obj._minor_units
+
+
 class Base:
     """The base Dinero class with the constructor, properties and utils."""
 
-    def __init__(self, amount: int | float | str | Decimal, currency: Currency):
-        from ._dinero import Dinero
+    # `_amount` holds the Decimal value once it's read, objects are immutable so it
+    # never goes stale. The slot adds 8 bytes to every instance, and the Decimal
+    # about 100 more to those that are formatted or read as a Decimal.
+    __slots__ = ("_minor_units", "_currency", "_amount")
 
-        self.amount = amount
-        self.currency = currency
-        self.dinero = Dinero
+    _amount: Decimal
 
+    def __init__(
+        self, amount: int | float | str | Decimal, currency: Currency | CurrencyDict
+    ):
         validate.dinero_amount(amount)
 
+        self._currency = Currency.from_dict(currency)
+        self._minor_units = to_minor_units(amount, self._currency.exponent)
+
+    @classmethod
+    def _from_minor_units(cls, units: int, currency: Currency) -> Self:
+        """
+        Return a new object from an integer count of minor units, without any
+        validation. Only for values that are already known to be valid, like the
+        results of Dinero's own operations.
+
+        Args:
+            units (int): The amount in minor units.
+            currency (dict): The currency of the amount.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+        obj = object.__new__(cls)
+        obj._currency = currency
+        obj._minor_units = units
+        return obj
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @property
+    def amount(self) -> Decimal:
+        try:
+            return self._amount
+        except AttributeError:
+            amount = from_minor_units(self._minor_units, self._currency.exponent)
+            self._amount = amount
+            return amount
+
     @property
-    def symbol(self):
-        return self.currency.get("symbol", "$")
+    def minor_units(self) -> int:
+        return self._minor_units
+
+    # Minor units only order amounts of the same currency.
+    sort_key = SortKey()
 
     @property
-    def code(self):
-        return self.currency.get("code")
+    def symbol(self) -> str:
+        return self._currency.symbol
 
     @property
-    def exponent(self):
-        return self.currency.get("exponent")
+    def code(self) -> str:
+        return self._currency.code
 
     @property
-    def precision(self):
-        return self.currency.get("base")
+    def exponent(self) -> int:
+        return self._currency.exponent
+
+    @property
+    def precision(self) -> int:
+        return self._currency.base
+
+    @property
+    def _context(self) -> Context:
+        return self._currency.context
 
     @property
     def _formatted_amount(self) -> str:
-        currency_format = f",.{self.exponent}f"
-        return f"{self._normalize(quantize=True):{currency_format}}"
+        return f"{self._normalize(quantize=True):{self._currency.format_spec}}"
 
     @property
     def raw_amount(self) -> Decimal:
         return self._normalize(quantize=True)
 
-    def _get_instance(self, amount: "OperationType | Dinero") -> "Dinero":
+    def _serialized_amount(self, amount_with_format: bool = False) -> str:
+        """Return the amount as written by `to_dict` and `to_json`."""
+        if amount_with_format:
+            return self._formatted_amount
+        return format_minor_units(self._minor_units, self._currency.exponent)
+
+    def _get_instance(self, amount: "OperationType | Base") -> "Base":
         """
-        Return a Dinero object after checking the currency codes are equal and
-        transforming it to Dinero if needed.
+        Return a Dinero object after checking the currencies have the same code,
+        base and exponent, and transforming it to Dinero if needed.
 
         Args:
             amount (str, int, float, Decimal, Dinero): amount to be instantiated
@@ -60,12 +139,13 @@ class Base:
             DINERO: Dinero object.
         """
         amount_obj = (
-            amount
-            if isinstance(amount, self.dinero)
-            else self.dinero(amount, self.currency)
+            amount if isinstance(amount, Base) else type(self)(amount, self._currency)
         )
 
-        if amount_obj.code != self.code:
+        # Currencies are interned, the unit comparison is only a fallback for
+        # currencies that share a code, base and exponent but not their symbol.
+        currency = amount_obj._currency
+        if currency is not self._currency and currency.unit != self._currency.unit:
             raise DifferentCurrencyError("Currencies can not be different")
 
         return amount_obj
@@ -74,6 +154,9 @@ class Base:
         """
         Return a Decimal object, that can be quantize.
 
+        The amount is stored as an integer count of minor units, so the quantized
+        value is exact and only needs to be rebuilt, not rounded.
+
         Args:
             quantize (bool): Only for the final result. Defaults to False.
 
@@ -81,11 +164,7 @@ class Base:
             DECIMAL: Decimal object.
         """
 
-        getcontext().prec = self.precision
-        normalized_amount = Decimal(self.amount).normalize()
-
         if quantize:
-            places = Decimal(f"1e-{self.exponent}")
-            normalized_amount = normalized_amount.quantize(places)
+            return self.amount
 
-        return normalized_amount
+        return self.amount.normalize(context=self._context)
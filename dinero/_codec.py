@@ -0,0 +1,112 @@
+"""
+Compact binary encoding of amounts.
+
+A Dinero object is encoded as the ISO 4217 numeric code of its currency, an
+unsigned 16 bit little endian integer, followed by its minor units as a zigzag
+varint: small amounts take one or two bytes, and any integer can be represented.
+
+A DineroArray is encoded as an 8 byte header, the magic bytes `DNA`, a format
+version, the numeric currency code and two padding bytes, followed by the minor
+units as little endian signed 64 bit integers. The units are decoded by casting
+a memoryview of the payload, without converting each element.
+
+Currencies are encoded by their numeric code only, so they must be registered
+with one, see `dinero.currencies.register_currency`, and decode to the registered
+currency.
+
+Pickling uses the same minor units. A built-in ISO 4217 currency is reduced to its
+alphabetic code and looked up in the registry on load, other currencies are
+pickled whole and load as the interned Currency object.
+"""
+
+import struct
+import sys
+
+from .currencies import (
+    get_currency,
+    get_currency_by_numeric,
+    get_numeric_code,
+    is_iso_currency,
+)
+from .types import Currency
+
+NUMERIC = struct.Struct("<H")
+ARRAY_HEADER = struct.Struct("<3sBH2x")
+ARRAY_MAGIC = b"DNA"
+ARRAY_VERSION = 1
+
+# The units of an array are stored little endian, the native order of almost
+# every platform, so decoding them is a plain memory copy.
+NATIVE_ORDER = sys.byteorder == "little"
+
+
+def encode_currency(currency: Currency) -> int:
+    """
+    Return the numeric code of a currency that can be encoded.
+
+    Raises:
+        UnknownCurrencyError: The currency has no registered numeric code.
+        ValueError: The currency differs from the currency registered for its code.
+    """
+    numeric = get_numeric_code(currency.code)
+    registered = get_currency(currency.code)
+
+    if registered is not currency and (
+        registered.exponent != currency.exponent or registered.base != currency.base
+    ):
+        raise ValueError(f"{currency.code} is registered with other base or exponent")
+
+    return numeric
+
+
+def decode_currency(numeric: int) -> Currency:
+    """
+    Return the currency registered for a numeric code.
+
+    Raises:
+        UnknownCurrencyError: No currency is registered with the numeric code.
+    """
+    return get_currency_by_numeric(numeric)
+
+
+def encode_varint(value: int) -> bytes:
+    """Return a signed integer as a zigzag, little endian base 128 varint."""
+    number = value * 2 if value >= 0 else -value * 2 - 1
+    output = bytearray()
+
+    while number > 0x7F:
+        output.append((number & 0x7F) | 0x80)
+        number >>= 7
+    output.append(number)
+
+    return bytes(output)
+
+
+def decode_varint(data: memoryview, offset: int) -> tuple[int, int]:
+    """
+    Return the signed integer of a zigzag varint and the offset after it.
+
+    Raises:
+        ValueError: The varint is truncated.
+    """
+    number = shift = 0
+
+    for position in range(offset, len(data)):
+        byte = data[position]
+        number |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            value = number >> 1 if not number & 1 else -(number >> 1) - 1
+            return value, position + 1
+        shift += 7
+
+    raise ValueError("The data ends in the middle of an amount")
+
+
+def reduce_currency(currency: Currency) -> str | Currency:
+    """Return the code of a built-in currency, the currency itself otherwise."""
+    return currency.code if is_iso_currency(currency) else currency
+
+
+def restore_currency(currency: str | Currency) -> Currency:
+    """Return the currency of `reduce_currency`."""
+    return get_currency(currency) if isinstance(currency, str) else currency
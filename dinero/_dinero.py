@@ -1,11 +1,18 @@
 """
 Dinero allows the user to make exact monetary calculations.
 
+- from_minor_units:: Returns a new Dinero object from an integer count of minor units.
+- from_decimal:: Returns a new Dinero object from an already validated Decimal.
+- from_dict:: Returns a new Dinero object from the output of `to_dict`.
+- from_json:: Returns a new Dinero object from the output of `to_json`.
+- from_bytes:: Returns a new Dinero object from the output of `to_bytes`.
+- parse:: Returns a new Dinero object from a formatted amount.
 - format:: Format a Dinero object with his decimals, symbol and/or code.
 - add:: Returns a new Dinero object that represents the sum two amounts.
 - subtract:: Returns a new Dinero object that represents the difference of two amounts.
 - multiply:: Returns a new Dinero object that represents the multiplied value by a factor.
 - divide:: Returns a new Dinero object that represents the divided value by a factor.
+- allocate:: Splits the amount by ratios into shares that add up to it exactly.
 - eq:: Checks whether the value represented by this object equals to the other.
 - lt:: Checks whether the value represented by this object is less than the other.
 - lte:: Checks whether an object is less than or equal the other.
@@ -13,17 +20,26 @@ Dinero allows the user to make exact monetary calculations.
 - gte:: Checks whether an object is greater or equal the other.
 - to_dict:: Returns the object's data as a Python Dictionary.
 - to_json:: Returns the object's data as a JSON string.
+- to_bytes:: Returns the object's data in a compact binary format.
 - convert:: Converts the Dinero object to a different currency.
 """
 
 import json
 from decimal import Decimal
-from typing import Any
+from typing import Any, Mapping, Sequence
 
+from . import _codec
 from ._operations import Operations
-from ._utils import DecimalEncoder
+from ._utils import (
+    allocate_minor_units,
+    parse_minor_units,
+    to_minor_units,
+    to_weights,
+)
 from ._validators import Validators
-from .types import Currency, OperationType
+from .currencies import resolve_currency
+from .exceptions import InvalidOperationError
+from .types import Currency, CurrencyDict, OperationType
 
 validate = Validators()
 
@@ -39,9 +55,213 @@ class Dinero(Operations):
         currency (dict): Expressed as an ISO 4217 currency code.
     """
 
-    def __init__(self, amount: int | float | str | Decimal, currency: Currency):
+    __slots__ = ()
+
+    def __init__(
+        self, amount: int | float | str | Decimal, currency: Currency | CurrencyDict
+    ):
         super().__init__(amount, currency)
 
+    @classmethod
+    def from_minor_units(cls, units: int, currency: Currency | CurrencyDict) -> "Dinero":
+        """
+        Returns a new Dinero object from an integer count of minor units (cents for
+        USD), skipping the validation done by the constructor.
+
+        Examples:
+            >>> Dinero.from_minor_units(23432, USD)
+            234.32
+
+            >>> Dinero.from_minor_units(500, JPY)
+            500
+
+        Args:
+            units (int): The amount in minor units.
+            currency (dict): Expressed as an ISO 4217 currency code.
+
+        Raises:
+            InvalidOperationError: The units are not an integer.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+
+        if not isinstance(units, int):
+            raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+        return cls._from_minor_units(units, Currency.from_dict(currency))
+
+    @classmethod
+    def from_decimal(
+        cls, amount: Decimal, currency: Currency | CurrencyDict
+    ) -> "Dinero":
+        """
+        Returns a new Dinero object from an already validated Decimal, skipping the
+        validation done by the constructor. The amount is rounded half to even to
+        the currency exponent.
+
+        Examples:
+            >>> Dinero.from_decimal(Decimal("234.325"), USD)
+            234.32
+
+        Args:
+            amount (Decimal): The amount to work with.
+            currency (dict): Expressed as an ISO 4217 currency code.
+
+        Raises:
+            InvalidOperationError: The amount is not a finite Decimal.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+
+        if not isinstance(amount, Decimal) or not amount.is_finite():
+            raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+        currency = Currency.from_dict(currency)
+        units = to_minor_units(amount, currency.exponent)
+        return cls._from_minor_units(units, currency)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Dinero":
+        """
+        Returns a new Dinero object from a dictionary with the format of `to_dict`,
+        with or without a formatted amount. The currency dictionary is replaced by
+        the registered currency with the same values, or a shared, interned Currency
+        object.
+
+        Examples:
+            >>> Dinero.from_dict({"amount": "3,333.26", "currency": USD})
+            3333.26
+
+        Args:
+            data (dict): A mapping with an amount and a currency.
+
+        Raises:
+            InvalidOperationError: The amount is not a finite number.
+            TypeError: The mapping doesn't have a valid amount and currency.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+
+        try:
+            amount = data["amount"]
+            currency = resolve_currency(data["currency"])
+        except (KeyError, TypeError):
+            raise TypeError("The data must have an amount and a valid currency")
+
+        if isinstance(amount, str):
+            units = parse_minor_units(amount, currency.exponent)
+        else:
+            validate.dinero_amount(amount)
+            units = to_minor_units(amount, currency.exponent)
+
+        return cls._from_minor_units(units, currency)
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "Dinero":
+        """
+        Returns a new Dinero object from a JSON string with the format of `to_json`.
+
+        Examples:
+            >>> Dinero.from_json(Dinero("2.32", USD).to_json())
+            2.32
+
+        Args:
+            data (str, bytes): The JSON document.
+
+        Raises:
+            InvalidOperationError: The amount is not a finite number.
+            TypeError: The document doesn't have a valid amount and currency.
+            ValueError: The document is not valid JSON.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+
+        return cls.from_dict(json.loads(data))
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> "Dinero":
+        """
+        Returns a new Dinero object from the binary format of `to_bytes`.
+
+        Examples:
+            >>> Dinero.from_bytes(b"H\x03\xd0\x03")
+            2.32
+
+        Args:
+            data (bytes, bytearray, memoryview): The encoded amount.
+
+        Raises:
+            UnknownCurrencyError: No currency is registered with the numeric code.
+            ValueError: The data is not a single encoded amount.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+
+        view = memoryview(data).cast("B")
+        if len(view) < _codec.NUMERIC.size:
+            raise ValueError("The data is too short to be an amount")
+
+        (numeric,) = _codec.NUMERIC.unpack_from(view)
+        units, end = _codec.decode_varint(view, _codec.NUMERIC.size)
+        if end != len(view):
+            raise ValueError("The data has trailing bytes after the amount")
+
+        return cls._from_minor_units(units, _codec.decode_currency(numeric))
+
+    @classmethod
+    def parse(
+        cls,
+        text: str,
+        currency: Currency | CurrencyDict | None = None,
+        decimal: str = ".",
+    ) -> "Dinero":
+        """
+        Returns a new Dinero object from a formatted amount, like the output of
+        `format`. The amount can have grouping separators, a currency symbol or code
+        before or after it, and a leading or trailing minus sign or parentheses when
+        it's negative. Extra decimal places are rounded half to
+        even, like the constructor does.
+
+        Without a currency, it's taken from the symbol or code of the text. Symbols
+        shared by several currencies, like "$", need a code or the currency.
+
+        Examples:
+            >>> Dinero.parse("$234,342.30 USD")
+            Dinero(amount=234342.30, currency={'code': 'USD', 'base': 10, ...})
+
+            >>> Dinero.parse("($1,000.00)", USD).format()
+            '-1,000.00'
+
+            >>> Dinero.parse("1.000,50 €", decimal=",").format(currency=True)
+            '1,000.50 EUR'
+
+        Args:
+            text (str): The formatted amount.
+            currency (dict, optional): The currency of the amount. Defaults to the
+                currency of the symbol or code of the text.
+            decimal (str): The decimal separator, "." or ",". Defaults to ".".
+
+        Raises:
+            InvalidOperationError: The amount has more than 28 digits in its major
+                units.
+            TypeError: The text is not a string.
+            UnknownCurrencyError: The currency code of the text is not registered.
+            ValueError: The text is not an amount of the currency, or its currency
+                can't be told from it.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+        from ._parsing import parse_amount
+
+        units, resolved = parse_amount(text, currency, decimal)
+        return cls._from_minor_units(units, resolved)
+
     def format(self, symbol: bool = False, currency: bool = False) -> str:
         """Format a Dinero object with his decimals, symbol and/or code.
 
@@ -192,10 +412,44 @@ class Dinero(Operations):
 
         return self.__truediv__(amount)
 
+    def allocate(self, ratios: Sequence[int | float | Decimal]) -> list["Dinero"]:
+        """
+        Splits the amount in shares proportional to the given ratios. Unlike
+        dividing, no minor unit is lost or created: the shares always add up to the
+        original amount.
+
+        Each share is rounded down, and the minor units left over are given one at a
+        time to the shares with the largest remainders, the earliest first on ties.
+
+        Examples:
+            >>> Dinero("100", USD).allocate([1, 1, 1])
+            [33.34, 33.33, 33.33]
+
+            >>> Dinero("0.05", USD).allocate([70, 30])
+            [0.04, 0.01]
+
+        Args:
+            ratios (list, tuple): The ratios as int, float or Decimal.
+
+        Raises:
+            InvalidOperationError: An operation between unsupported types was executed.
+            ValueError: There are no ratios, a ratio is negative or all of them are
+                zero.
+
+        Returns:
+            LIST: One Dinero object per ratio.
+        """
+        validate.allocation_ratios(ratios)
+        shares = allocate_minor_units(self._minor_units, to_weights(ratios))
+        return [self._from_minor_units(units, self.currency) for units in shares]
+
     def eq(self, amount: "Dinero") -> bool:
         """
         Checks whether the value represented by this object equals to other instance.
 
+        Unlike `==`, which is False for a different currency or type so Dinero objects
+        can be used in sets and as dictionary keys, this method raises.
+
         Examples:
             >>> amount_1 = Dinero("2.32", USD)
             >>> amount_2 = Dinero("2.32", USD)
@@ -216,7 +470,7 @@ class Dinero(Operations):
             BOOL: Whether the value represented is equals to the other.
         """
 
-        return self.__eq__(amount)
+        return self._minor_units == self._compared_units(amount)
 
     def lt(self, amount: "Dinero") -> bool:
         """
@@ -362,14 +616,9 @@ class Dinero(Operations):
             DICT: The object's data as a Python Dictionary.
         """
 
-        normalized_amount = self._normalize(quantize=True)
-        amount = self._formatted_amount if amount_with_format else str(normalized_amount)
-
-        dict_repr = self.__dict__
-        dict_repr["amount"] = amount
-        dict_repr["currency"].setdefault("symbol", "$")
-        del dict_repr["dinero"]
-        return dict_repr
+        currency = self._currency
+        amount = self._serialized_amount(amount_with_format)
+        return {"amount": amount, "currency": dict(currency.serialized)}
 
     def to_json(self, amount_with_format: bool = False) -> str:
         """
@@ -393,10 +642,36 @@ class Dinero(Operations):
             STR: The object's data as JSON.
         """
 
-        dict_representation = self.to_dict(amount_with_format)
-        return json.dumps(dict_representation, cls=DecimalEncoder)
+        # Same output as json.dumps(self.to_dict()), the currency is serialized once
+        # per currency and amounts only contain digits, signs, dots and commas.
+        currency = self._currency
+        amount = self._serialized_amount(amount_with_format)
+        return f'{{"amount": "{amount}", "currency": {currency.serialized_json}}}'
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the object's data in a compact binary format: the ISO 4217 numeric
+        code of the currency and the minor units as a variable length integer.
+
+        Examples:
+            >>> Dinero("2.32", USD).to_bytes()
+            b'H\x03\xd0\x03'
+
+        Raises:
+            UnknownCurrencyError: The currency has no registered numeric code.
+            ValueError: The currency differs from the currency registered for its
+                code.
+
+        Returns:
+            BYTES: The encoded amount.
+        """
+
+        numeric = _codec.encode_currency(self._currency)
+        return _codec.NUMERIC.pack(numeric) + _codec.encode_varint(self._minor_units)
 
-    def convert(self, exchange_rate: str | float, currency: Currency) -> "Dinero":
+    def convert(
+        self, exchange_rate: str | float, currency: Currency | CurrencyDict
+    ) -> "Dinero":
         """
         Converts the Dinero object to a different currency using the specified
         exchange rate.
@@ -429,9 +704,22 @@ class Dinero(Operations):
 
         return convert(self, exchange_rate, currency)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # (minor units, currency code) instead of every slot and the currency dict
+        currency = _codec.reduce_currency(self._currency)
+        if type(self) is Dinero:
+            return (_unpickle, (self._minor_units, currency))
+        return (_unpickle, (self._minor_units, currency, type(self)))
+
     def __repr__(self):
         return f"Dinero(amount={self.amount}, currency={self.currency})"
 
     def __str__(self):
         formatted_output = self.format()
         return f"{formatted_output}"
+
+
+def _unpickle(
+    units: int, currency: str | Currency, cls: type[Dinero] = Dinero
+) -> Dinero:
+    return cls._from_minor_units(units, _codec.restore_currency(currency))
@@ -0,0 +1,324 @@
+"""
+NumPy engine for vectors of int64 minor units.
+
+This module is only imported when NumPy is installed, `DineroArray` falls back to
+its pure Python loops otherwise. Every function gives the same results as the
+scalar Dinero operations: sums are exact, products and quotients are rounded half
+to even, and results that don't fit in 64 bits raise an `OverflowError` instead
+of wrapping around.
+"""
+
+from array import array
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ._utils import allocate_minor_units, divide_half_even
+
+Vector = NDArray[np.int64]
+
+INT64_MIN = int(np.iinfo(np.int64).min)
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+# Ratios with terms up to this size can be applied without overflowing the
+# remainder arithmetic of the rounding step.
+_MAX_TERM = 2**62
+
+# Number of elements summed at once, so the 32 bit halves can't overflow.
+_SUM_CHUNK = 2**30
+
+overflow_msg = "The result does not fit in 64 bit minor units."
+
+
+def as_vector(units: "array | memoryview") -> Vector:
+    """Return a zero-copy int64 view of a buffer of minor units."""
+    return np.asarray(units, dtype=np.int64)
+
+
+def to_array(vector: Vector) -> array:
+    """Return the vector as a new `array("q")` of minor units."""
+    units = array("q")
+    units.frombytes(np.ascontiguousarray(vector).data.cast("B"))
+    return units
+
+
+def add(units: Vector, other: Vector | int) -> Vector:
+    """
+    Elementwise sum of two vectors, or of a vector and a single value.
+
+    Args:
+        units (ndarray): Minor units.
+        other (ndarray, int): Minor units to add.
+
+    Raises:
+        OverflowError: A result doesn't fit in 64 bits.
+
+    Returns:
+        NDARRAY: The sums in minor units.
+    """
+    addend = np.int64(other) if isinstance(other, int) else other
+    result = units + addend
+
+    if (((units ^ result) & (addend ^ result)) < 0).any():
+        raise OverflowError(overflow_msg)
+
+    return result
+
+
+def subtract(units: Vector, other: Vector | int) -> Vector:
+    """
+    Elementwise difference of two vectors, or of a vector and a single value.
+
+    Args:
+        units (ndarray): Minor units.
+        other (ndarray, int): Minor units to subtract.
+
+    Raises:
+        OverflowError: A result doesn't fit in 64 bits.
+
+    Returns:
+        NDARRAY: The differences in minor units.
+    """
+    subtrahend = np.int64(other) if isinstance(other, int) else other
+    result = units - subtrahend
+
+    if (((units ^ subtrahend) & (units ^ result)) < 0).any():
+        raise OverflowError(overflow_msg)
+
+    return result
+
+
+def negate(units: Vector) -> Vector:
+    """
+    Elementwise negation of a vector.
+
+    Args:
+        units (ndarray): Minor units.
+
+    Raises:
+        OverflowError: A result doesn't fit in 64 bits.
+
+    Returns:
+        NDARRAY: The negated minor units.
+    """
+    if (units == INT64_MIN).any():
+        raise OverflowError(overflow_msg)
+
+    return -units
+
+
+def multiply(
+    units: Vector, ratios: tuple[int, int] | Sequence[tuple[int, int]]
+) -> Vector:
+    """
+    Multiply minor units by one factor, or by one factor per element, given as
+    exact ratios. Results are rounded half to even.
+
+    Args:
+        units (ndarray): Minor units.
+        ratios (tuple, sequence): Numerator and positive denominator of the factor,
+            or one pair per element.
+
+    Raises:
+        OverflowError: A result doesn't fit in 64 bits.
+
+    Returns:
+        NDARRAY: The products in minor units.
+    """
+    if isinstance(ratios, tuple):
+        numerator, denominator = ratios
+        return _scale(units, numerator, denominator)
+
+    numerators, denominators = zip(*ratios) if len(ratios) else ((), ())
+    return _scale_each(units, numerators, denominators)
+
+
+def divide(
+    units: Vector, ratios: tuple[int, int] | Sequence[tuple[int, int]]
+) -> Vector:
+    """
+    Divide minor units by one divisor, or by one divisor per element, given as
+    exact ratios. Results are rounded half to even.
+
+    Args:
+        units (ndarray): Minor units.
+        ratios (tuple, sequence): Numerator and positive denominator of the divisor,
+            or one pair per element.
+
+    Raises:
+        OverflowError: A result doesn't fit in 64 bits.
+        ZeroDivisionError: A divisor is zero.
+
+    Returns:
+        NDARRAY: The quotients in minor units.
+    """
+    if isinstance(ratios, tuple):
+        ratios = [ratios]
+        single = True
+    else:
+        single = False
+
+    inverted = []
+    for numerator, denominator in ratios:
+        if numerator == 0:
+            raise ZeroDivisionError("division by zero")
+        if numerator < 0:
+            numerator, denominator = -numerator, -denominator
+        inverted.append((denominator, numerator))
+
+    if single:
+        return _scale(units, *inverted[0])
+
+    numerators, denominators = zip(*inverted) if inverted else ((), ())
+    return _scale_each(units, numerators, denominators)
+
+
+def total(units: Vector) -> int:
+    """
+    Exact sum of a vector as a Python int, which can exceed 64 bits.
+
+    The values are split in their high and low 32 bits, so the partial sums of a
+    chunk can't overflow.
+
+    Args:
+        units (ndarray): Minor units.
+
+    Returns:
+        INT: The sum in minor units.
+    """
+    result = 0
+    for start in range(0, len(units), _SUM_CHUNK):
+        chunk = units[start : start + _SUM_CHUNK]
+        high = int(np.sum(chunk >> 32, dtype=np.int64))
+        low = int(np.sum(chunk & 0xFFFFFFFF, dtype=np.int64))
+        result += (high << 32) + low
+
+    return result
+
+
+def minimum(units: Vector) -> int:
+    return int(units.min())
+
+
+def maximum(units: Vector) -> int:
+    return int(units.max())
+
+
+def allocate(units: Vector, weights: Sequence[int]) -> list[Vector]:
+    """
+    Split every element in shares proportional to the weights, with the same
+    largest remainder rounding as `allocate_minor_units`.
+
+    Args:
+        units (ndarray): Minor units.
+        weights (sequence): Non-negative integer weights, at least one positive.
+
+    Returns:
+        LIST: One vector of shares per weight, adding up to `units` elementwise.
+    """
+    total_weight = sum(weights)
+    if total_weight >= _MAX_TERM:
+        return _allocate_exact(units, weights)
+
+    # |units| * weight must fit in 64 bits, larger amounts are split exactly below.
+    limit = INT64_MAX // max(weights)
+    safe = (units <= limit) & (units >= -limit)
+
+    magnitudes = np.abs(units)[:, np.newaxis]
+    products = magnitudes * np.asarray(weights, dtype=np.int64)
+    shares, remainders = np.divmod(products, np.int64(total_weight))
+    leftover = magnitudes[:, 0] - shares.sum(axis=1)
+
+    # rank the remainders of each row, largest first and the earliest on ties, and
+    # give one more unit to as many shares as units are left over.
+    order = np.argsort(-remainders, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(len(weights)), axis=1)
+    shares += ranks < leftover[:, np.newaxis]
+    shares *= np.where(units < 0, -1, 1)[:, np.newaxis]
+
+    if not safe.all():
+        unsafe = np.flatnonzero(~safe)
+        shares[unsafe] = np.stack(_allocate_exact(units[unsafe], weights), axis=1)
+
+    return [np.ascontiguousarray(column) for column in shares.T]
+
+
+def _allocate_exact(units: Vector, weights: Sequence[int]) -> list[Vector]:
+    """Allocate with Python ints, for products beyond 64 bits."""
+    rows = [allocate_minor_units(int(unit), weights) for unit in units]
+    shares = np.array(rows, dtype=np.int64).reshape(len(units), len(weights))
+    return list(shares.T)
+
+
+def _round_half_even(products: Vector, denominators: Vector | int) -> Vector:
+    quotients = np.floor_divide(products, denominators)
+    remainders = products - quotients * denominators
+    complements = denominators - remainders
+    round_up = (remainders > complements) | (
+        (remainders == complements) & (quotients & 1 == 1)
+    )
+    return quotients + round_up
+
+
+def _scale(units: Vector, numerator: int, denominator: int) -> Vector:
+    """Return units * numerator / denominator, rounded half to even."""
+    if abs(numerator) >= _MAX_TERM or denominator >= _MAX_TERM:
+        everything = np.ones(len(units), dtype=bool)
+        return _scale_exact(units, everything, numerator, denominator)
+
+    limit = INT64_MAX // max(abs(numerator), 1)
+    safe = (units <= limit) & (units >= -limit)
+    products = units * np.int64(numerator)
+    result = products if denominator == 1 else _round_half_even(products, denominator)
+
+    if not safe.all():
+        result[~safe] = _scale_exact(units, ~safe, numerator, denominator)
+
+    return result
+
+
+def _scale_each(
+    units: Vector, numerators: Sequence[int], denominators: Sequence[int]
+) -> Vector:
+    """Return units * numerators / denominators elementwise, rounded half to even."""
+    if any(abs(n) >= _MAX_TERM for n in numerators) or any(
+        d >= _MAX_TERM for d in denominators
+    ):
+        result = np.empty(len(units), dtype=np.int64)
+        for index, (unit, n, d) in enumerate(zip(units, numerators, denominators)):
+            result[index] = _checked(divide_half_even(int(unit) * n, d))
+        return result
+
+    n_vector = np.asarray(numerators, dtype=np.int64)
+    d_vector = np.asarray(denominators, dtype=np.int64)
+
+    limits = INT64_MAX // np.maximum(np.abs(n_vector), 1)
+    safe = (units <= limits) & (units >= -limits)
+    result = _round_half_even(units * n_vector, d_vector)
+
+    if not safe.all():
+        for position in np.flatnonzero(~safe):
+            product = int(units[position]) * int(n_vector[position])
+            exact = divide_half_even(product, int(d_vector[position]))
+            result[position] = _checked(exact)
+
+    return result
+
+
+def _scale_exact(
+    units: Vector, mask: NDArray[np.bool_], numerator: int, denominator: int
+) -> Vector:
+    """Scale the masked elements with Python ints, for products beyond 64 bits."""
+    values = [
+        _checked(divide_half_even(int(unit) * numerator, denominator))
+        for unit in units[mask]
+    ]
+    return np.array(values, dtype=np.int64)
+
+
+def _checked(value: int) -> int:
+    if not INT64_MIN <= value <= INT64_MAX:
+        raise OverflowError(overflow_msg)
+    return value
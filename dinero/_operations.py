@@ -1,9 +1,12 @@
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from typing_extensions import Self
+
 from ._base import Base
+from ._utils import divide_minor_units, multiply_minor_units, to_ratio
 from ._validators import Validators
-from .types import Currency, OperationType
+from .types import OperationType
 from .exceptions import InvalidOperationError
 
 if TYPE_CHECKING:
@@ -16,75 +19,86 @@ validate = Validators()
 class Operations(Base):
     """All the operations supported between Dinero objects."""
 
-    def __init__(self, amount: int | float | str | Decimal, currency: Currency):
-        from ._dinero import Dinero
-
-        super().__init__(amount, currency)
-        self.dinero = Dinero
+    __slots__ = ()
 
-    def __add__(self, addend: "OperationType | Dinero") -> "Dinero":
+    def __add__(self, addend: "OperationType | Dinero") -> Self:
         validate.addition_and_subtraction_amount(addend)
         addend_obj = self._get_instance(addend)
-        total = self._normalize() + addend_obj._normalize()
-        return self.dinero(total, self.currency)
+        total = self._minor_units + addend_obj._minor_units
+        return self._from_minor_units(total, self.currency)
 
-    def __radd__(self, obj):
-        return self
+    def __radd__(self, addend: "OperationType | Dinero") -> Self:
+        # addition is commutative, `0 + amount` is how the built-in sum() starts
+        return self.__add__(addend)
 
-    def __sub__(self, subtrahend: "OperationType | Dinero") -> "Dinero":
+    def __sub__(self, subtrahend: "OperationType | Dinero") -> Self:
         validate.addition_and_subtraction_amount(subtrahend)
         subtrahend_obj = self._get_instance(subtrahend)
-        total = self._normalize() - subtrahend_obj._normalize()
-        return self.dinero(total, self.currency)
+        total = self._minor_units - subtrahend_obj._minor_units
+        return self._from_minor_units(total, self.currency)
 
-    def __mul__(self, multiplicand: int | float | Decimal) -> "Dinero":
+    def __mul__(self, multiplicand: int | float | Decimal) -> Self:
         validate.multiplication_and_division_amount(multiplicand)
-        multiplicand_obj = self._get_instance(multiplicand)
-        total = self._normalize() * multiplicand_obj._normalize()
-        return self.dinero(total, self.currency)
+        total = multiply_minor_units(self._minor_units, *to_ratio(multiplicand))
+        return self._from_minor_units(total, self.currency)
 
-    def __truediv__(self, divisor: int | float | Decimal) -> "Dinero":
+    def __truediv__(self, divisor: int | float | Decimal) -> Self:
         validate.multiplication_and_division_amount(divisor)
-        divisor_obj = self._get_instance(divisor)
-        total = self._normalize() / divisor_obj._normalize()
-        return self.dinero(total, self.currency)
+        total = divide_minor_units(self._minor_units, *to_ratio(divisor))
+        return self._from_minor_units(total, self.currency)
+
+    # Comparisons between amounts of the same type and the same interned currency,
+    # the common case, compare the minor units directly. Everything else goes
+    # through `_compared_units` for the type and currency checks.
 
     def __eq__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
-            raise InvalidOperationError(InvalidOperationError.comparison_msg)
+        if type(amount) is type(self) and amount._currency is self._currency:
+            return self._minor_units == amount._minor_units
 
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        num_1 = self._normalize(quantize=True)
-        return bool(num_1 == num_2)
+        # Unlike ordering, equality is defined for any operand so amounts can be
+        # looked up in sets, dictionaries and mixed containers.
+        if not isinstance(amount, Operations):
+            return NotImplemented
 
-    def __lt__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
-            raise InvalidOperationError(InvalidOperationError.comparison_msg)
+        return (
+            self._currency.unit == amount._currency.unit
+            and self._minor_units == amount._minor_units
+        )
 
-        num_1 = self._normalize(quantize=True)
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        return bool(num_1 < num_2)
+    def __hash__(self) -> int:
+        # Consistent with __eq__, which compares the currency code, base, exponent
+        # and minor units.
+        return hash((self._currency.unit, self._minor_units))
 
-    def __le__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
-            raise InvalidOperationError(InvalidOperationError.comparison_msg)
+    def __lt__(self, amount: object) -> bool:
+        if type(amount) is type(self) and amount._currency is self._currency:
+            return self._minor_units < amount._minor_units
+        return self._minor_units < self._compared_units(amount)
 
-        num_1 = self._normalize(quantize=True)
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        return bool(num_1 <= num_2)
+    def __le__(self, amount: object) -> bool:
+        if type(amount) is type(self) and amount._currency is self._currency:
+            return self._minor_units <= amount._minor_units
+        return self._minor_units <= self._compared_units(amount)
 
     def __gt__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
-            raise InvalidOperationError(InvalidOperationError.comparison_msg)
-
-        num_1 = self._normalize(quantize=True)
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        return bool(num_1 > num_2)
+        if type(amount) is type(self) and amount._currency is self._currency:
+            return self._minor_units > amount._minor_units
+        return self._minor_units > self._compared_units(amount)
 
     def __ge__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
+        if type(amount) is type(self) and amount._currency is self._currency:
+            return self._minor_units >= amount._minor_units
+        return self._minor_units >= self._compared_units(amount)
+
+    def _compared_units(self, amount: object) -> int:
+        """
+        Return the minor units of the other side of a comparison.
+
+        Raises:
+            DifferentCurrencyError: Different currencies where used.
+            InvalidOperationError: The other side is not a Dinero object.
+        """
+        if not isinstance(amount, Operations):
             raise InvalidOperationError(InvalidOperationError.comparison_msg)
 
-        num_1 = self._normalize(quantize=True)
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        return bool(num_1 >= num_2)
+        return self._get_instance(amount)._minor_units
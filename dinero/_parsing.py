@@ -0,0 +1,291 @@
+"""
+Parsing of formatted amounts, like the output of `Dinero.format`.
+
+An amount can have a currency symbol or code before or after it, digits grouped
+in threes and a sign before or after the symbol, a trailing minus or parentheses
+for negative amounts. The pattern of a currency is compiled once
+per decimal separator and cached, so every string is read with a single regular
+expression match.
+
+- parse_amount:: Returns the minor units and the currency of a formatted amount.
+- parse_many:: Returns Dinero objects from many formatted amounts.
+"""
+
+import re
+from decimal import Decimal
+from functools import lru_cache
+from typing import Iterable
+
+from ._dinero import Dinero
+from ._utils import check_digits, to_minor_units
+from .currencies import get_codes_by_symbol, get_currency
+from .types import Currency, CurrencyDict
+
+# Hyphen-minus, minus sign and plus sign.
+SIGNS = "-\u2212+"
+NEGATIVE = "-\u2212"
+NEGATIVE_MARKS = ("(", *NEGATIVE)
+
+# Separators of the groups of three digits, except the one used as the decimal
+# separator: comma, dot, space, apostrophe, no-break space, narrow no-break space
+# and underscore.
+SEPARATORS = ",. '\u00a0\u202f_"
+
+DECIMAL_SEPARATORS = (".", ",")
+
+CODE = "[A-Z]{3}"
+
+
+def parse_amount(
+    text: str, currency: Currency | CurrencyDict | None = None, decimal: str = "."
+) -> tuple[int, Currency]:
+    """
+    Return the minor units and the currency of a formatted amount, see
+    `Dinero.parse`.
+
+    Raises:
+        InvalidOperationError: The amount has more than 28 digits in its major
+            units.
+        TypeError: The text is not a string.
+        UnknownCurrencyError: The currency code of the text is not registered.
+        ValueError: The text is not an amount of the currency, or its currency
+            can't be told from it.
+    """
+    if currency is not None:
+        currency = Currency.from_dict(currency)
+        pattern = currency_pattern(currency, decimal)
+        match = pattern.fullmatch(text.strip()) if isinstance(text, str) else None
+        if match is None:
+            raise invalid(text, currency)
+        return to_units(match, currency.exponent), currency
+
+    pattern = symbols_pattern(tuple(get_codes_by_symbol()), decimal)
+    match = pattern.fullmatch(text.strip()) if isinstance(text, str) else None
+    if match is None:
+        raise invalid(text, None)
+
+    currency = resolve(*currency_key(match))
+    return to_units(match, currency.exponent), currency
+
+
+def parse_many(
+    texts: Iterable[str],
+    currency: Currency | CurrencyDict | None = None,
+    decimal: str = ".",
+) -> list[Dinero]:
+    """
+    Returns Dinero objects from formatted amounts, the same as calling
+    `Dinero.parse` on each of them. The pattern of the currency is looked up once,
+    and without a currency every distinct symbol and code is resolved once.
+
+    Examples:
+        >>> dinero.parse_many(["$2.32", "(1,000.00)", "-0.50 USD"], USD)
+        [Dinero(amount=2.32, ...), Dinero(amount=-1000.00, ...), Dinero(...-0.50...)]
+
+        >>> dinero.parse_many(["€2,32", "1.000,50 EUR"], decimal=",")
+        [Dinero(amount=2.32, ...EUR...), Dinero(amount=1000.50, ...EUR...)]
+
+    Args:
+        texts (iterable): The formatted amounts.
+        currency (dict, optional): The currency of the amounts. Defaults to the
+            currency of the symbol or code of each amount.
+        decimal (str): The decimal separator, "." or ",". Defaults to ".".
+
+    Raises:
+        InvalidOperationError: The amount has more than 28 digits in its major
+            units.
+        TypeError: An amount is not a string.
+        UnknownCurrencyError: A currency code is not registered.
+        ValueError: An amount is not valid, or its currency can't be told from it.
+
+    Returns:
+        LIST: List of Dinero objects.
+    """
+    new = Dinero._from_minor_units
+    result = []
+
+    if currency is not None:
+        currency = Currency.from_dict(currency)
+        fullmatch = currency_pattern(currency, decimal).fullmatch
+        exponent = currency.exponent
+
+        for text in texts:
+            match = fullmatch(text.strip()) if isinstance(text, str) else None
+            if match is None:
+                raise invalid(text, currency)
+            result.append(new(to_units(match, exponent), currency))
+
+        return result
+
+    fullmatch = symbols_pattern(tuple(get_codes_by_symbol()), decimal).fullmatch
+    currencies: dict[tuple[str | None, str | None], Currency] = {}
+
+    for text in texts:
+        match = fullmatch(text.strip()) if isinstance(text, str) else None
+        if match is None:
+            raise invalid(text, None)
+
+        key = currency_key(match)
+        found = currencies.get(key)
+        if found is None:
+            found = currencies[key] = resolve(*key)
+        result.append(new(to_units(match, found.exponent), found))
+
+    return result
+
+
+@lru_cache(maxsize=None)
+def currency_pattern(currency: Currency, decimal: str) -> "re.Pattern[str]":
+    """
+    Return the pattern of the amounts of a currency, with its symbol or code.
+
+    Raises:
+        ValueError: The decimal separator is not "." or ",".
+    """
+    symbol, code = re.escape(currency.symbol), re.escape(currency.code)
+    return compile_pattern(f"(?:{symbol}|{code})", f"(?:{code}|{symbol})", decimal)
+
+
+@lru_cache(maxsize=None)
+def symbols_pattern(symbols: tuple[str, ...], decimal: str) -> "re.Pattern[str]":
+    """
+    Return the pattern of the amounts of any currency, capturing the symbol or
+    code before it, and the code or symbol after it.
+
+    Raises:
+        ValueError: The decimal separator is not "." or ",".
+    """
+    # longest first, so "R$" is not read as "R" followed by "$"
+    alternatives = "|".join(map(re.escape, sorted(symbols, key=len, reverse=True)))
+    return compile_pattern(
+        f"(?P<symbol>{alternatives}|{CODE})",
+        f"(?:(?P<code>{CODE})|(?P<after>{alternatives}))",
+        decimal,
+    )
+
+
+def compile_pattern(prefix: str, suffix: str, decimal: str) -> "re.Pattern[str]":
+    """
+    Return the pattern of an amount with an optional prefix and suffix.
+
+    Raises:
+        ValueError: The decimal separator is not "." or ",".
+    """
+    if decimal not in DECIMAL_SEPARATORS:
+        raise ValueError('The decimal separator must be "." or ","')
+
+    point = re.escape(decimal)
+    separators = re.escape(SEPARATORS.replace(decimal, ""))
+    signs = re.escape(SIGNS)
+    # digits grouped in threes with a single kind of separator, or not grouped
+    whole = (
+        rf"[0-9]{{1,3}}(?:(?P<separator>[{separators}])[0-9]{{3}})"
+        rf"(?:(?P=separator)[0-9]{{3}})*|[0-9]+"
+    )
+
+    # The text is stripped before matching, and every token takes the whitespace
+    # after it, so a run of whitespace can only be matched one way and a failed
+    # match doesn't backtrack over every way of splitting it.
+    return re.compile(
+        rf"(?:(?P<open>\()\s*)?(?:(?P<sign>[{signs}])\s*)?"
+        rf"(?:{prefix}\s*(?:(?P<inner>[{signs}])\s*)?)?"
+        rf"(?:(?P<whole>{whole})(?:{point}(?P<fraction>[0-9]*))?|{point}(?P<only>[0-9]+))"
+        rf"\s*(?:(?P<trailing>[{re.escape(NEGATIVE)}])\s*)?(?:(?P<close>\))\s*)?"
+        rf"(?:{suffix})?"
+    )
+
+
+def to_units(match: "re.Match[str]", exponent: int) -> int:
+    """
+    Return the minor units of a matched amount, rounded half to even when it has
+    more decimal places than the currency exponent.
+
+    Raises:
+        InvalidOperationError: The amount has more than MAX_DIGITS digits in its
+            major units.
+        ValueError: The amount has more than one sign, or unbalanced parentheses.
+    """
+    opening, sign, inner, trailing, closing = match.group(
+        "open", "sign", "inner", "trailing", "close"
+    )
+
+    if (opening is None) != (closing is None):
+        raise ValueError(f"{match.string!r} has unbalanced parentheses")
+
+    marks = [opening, sign, inner, trailing]
+    if marks.count(None) < 3:
+        raise ValueError(f"{match.string!r} has more than one sign")
+
+    whole, separator, fraction = match.group("whole", "separator", "fraction")
+    if whole is None:
+        whole, fraction = "0", match["only"]
+    elif separator is not None:
+        whole = whole.replace(separator, "")
+    check_digits(whole)
+
+    if not fraction:
+        units = int(whole) * 10**exponent
+    elif len(fraction) <= exponent:
+        units = int(whole + fraction.ljust(exponent, "0"))
+    else:
+        units = to_minor_units(Decimal(f"{whole}.{fraction}"), exponent)
+
+    mark = opening or sign or inner or trailing
+    return -units if mark is not None and mark in NEGATIVE_MARKS else units
+
+
+def invalid(text: object, currency: Currency | None) -> Exception:
+    """Return the error for a text that doesn't match the amount pattern."""
+    if not isinstance(text, str):
+        return TypeError("The text must be a string")
+    if currency is None:
+        return ValueError(f"{text!r} is not an amount")
+    return ValueError(f"{text!r} is not an amount in {currency.code}")
+
+
+def currency_key(match: "re.Match[str]") -> tuple[str | None, str | None]:
+    """
+    Return the symbol and the code of a matched amount.
+
+    Raises:
+        ValueError: The amount has a symbol before and after it.
+    """
+    symbol, code, after = match.group("symbol", "code", "after")
+    if after is None:
+        return symbol, code
+    if symbol is not None:
+        raise ValueError(f"{match.string!r} has more than one currency symbol")
+    return after, None
+
+
+def resolve(symbol: str | None, code: str | None) -> Currency:
+    """
+    Return the currency of a symbol, or a code written before the amount, and a
+    code written after it.
+
+    Raises:
+        UnknownCurrencyError: The code is not registered.
+        ValueError: There is no currency, the symbol is used by several currencies,
+            or the symbol and the code don't match.
+    """
+    codes = get_codes_by_symbol()
+
+    if code is not None:
+        currency = get_currency(code)
+        if symbol is not None and symbol != code and code not in codes.get(symbol, ()):
+            raise ValueError(f"The symbol {symbol!r} is not the symbol of {code}")
+        return currency
+
+    if symbol is None:
+        raise ValueError("The amount has no currency symbol or code")
+
+    if symbol not in codes:
+        return get_currency(symbol)
+
+    if len(codes[symbol]) > 1:
+        raise ValueError(
+            f"The symbol {symbol!r} is used by {len(codes[symbol])} currencies, "
+            "give the currency or its code"
+        )
+
+    return get_currency(codes[symbol][0])
@@ -0,0 +1,349 @@
+"""
+Streaming readers that turn CSV and JSON Lines files into Dinero objects.
+
+Rows are read one at a time, so files of any size are read in constant memory.
+Every distinct currency is resolved once, and amount strings are parsed directly
+into minor units instead of going through the validation of the Dinero
+constructor. Rows that can't be read are skipped and recorded in `errors`.
+
+- CSVReader:: Reads amounts and currencies from the columns of a CSV file.
+- JSONLinesReader:: Reads amounts and currencies from the fields of JSON Lines.
+- RowError:: A row that was skipped, with its line number and the error.
+"""
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple
+
+from ._array import TYPECODE, DineroArray
+from ._dinero import Dinero
+from ._utils import exact_amount_pattern, parse_minor_units, to_minor_units
+from ._validators import Validators
+from .currencies import get_currency, resolve_currency
+from .types import Currency, CurrencyDict
+
+validate = Validators()
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+# Errors that skip a row: invalid amounts and JSON, unknown currencies, missing
+# columns or fields and amounts that don't fit in a DineroArray.
+ROW_ERRORS = (ArithmeticError, LookupError, TypeError, ValueError)
+
+# A currency and the matcher of the amounts whose minor units are their digits.
+Resolved = tuple[Currency, Callable[[str], Any]]
+
+
+class RowError(NamedTuple):
+    """
+    A row that was skipped.
+
+    Args:
+        line (int): The line number where the row ends, starting at 1.
+        row (list, str): The fields of the CSV row, or the JSON line.
+        error (Exception): The reason the row was skipped.
+    """
+
+    line: int
+    row: Any
+    error: Exception
+
+
+class Reader(ABC):
+    """The base reader with the currency lookups and the output forms."""
+
+    errors: list[RowError]
+
+    def __init__(self, currency: Currency | CurrencyDict | None, key: Any):
+        self.errors = []
+        self._fixed = None if currency is None else self._with_matcher(currency)
+        self._currencies: dict[Any, Resolved] = {}
+        self._key = key
+
+    def __iter__(self) -> Iterator[Dinero]:
+        new = Dinero._from_minor_units
+        for units, currency, _ in self._rows(bounded=False):
+            yield new(units, currency)
+
+    def arrays(self, size: int = 65_536) -> Iterator[DineroArray]:
+        """
+        Yields the amounts as DineroArray objects of up to `size` amounts each. Every
+        array holds a single currency, so amounts of different currencies are
+        buffered separately and the arrays of a currency keep the order of the file.
+        The last, partial arrays are yielded at the end, in the order their
+        currencies first appeared.
+
+        Examples:
+            >>> reader = CSVReader(open("settlements.csv"), "amount", "currency")
+            >>> for prices in reader.arrays(100_000):
+            ...     bag.add(prices)
+
+        Args:
+            size (int): The maximum number of amounts of each array.
+
+        Raises:
+            ValueError: The size is not a positive integer.
+
+        Returns:
+            ITERATOR: DineroArray objects.
+        """
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("The size must be a positive integer")
+
+        # Currency objects are interned, so their id identifies them.
+        buffers: dict[int, tuple[Currency, array]] = {}
+
+        for units, currency, _ in self._rows(bounded=True):
+            entry = buffers.get(id(currency))
+            if entry is None:
+                entry = buffers[id(currency)] = (currency, array(TYPECODE))
+
+            buffer = entry[1]
+            buffer.append(units)
+            if len(buffer) == size:
+                yield DineroArray._from_array(buffer, currency)
+                buffers[id(currency)] = (currency, array(TYPECODE))
+
+        for currency, buffer in buffers.values():
+            if buffer:
+                yield DineroArray._from_array(buffer, currency)
+
+    @abstractmethod
+    def _rows(self, bounded: bool) -> Iterator[tuple[int, Currency, Any]]:
+        """
+        Yield the minor units, the currency and the group of every valid row. The
+        group is the value of the key column or field, None without a key.
+        """
+
+    def _resolve(self, currency: Any) -> Resolved:
+        """
+        Return the currency of a code or a currency dictionary and its amount
+        matcher, looked up once per distinct value.
+
+        Raises:
+            UnknownCurrencyError: No currency is registered with the code.
+            TypeError: The value is not a code or a valid currency dictionary.
+        """
+        if isinstance(currency, str):
+            key: Any = currency
+        elif isinstance(currency, dict):
+            key = tuple(currency.items())
+        else:
+            raise TypeError("The currency must be a code or a currency dictionary")
+
+        result = self._currencies.get(key)
+        if result is None:
+            if isinstance(currency, str):
+                result = self._with_matcher(get_currency(currency.strip()))
+            else:
+                result = self._with_matcher(resolve_currency(currency))
+            self._currencies[key] = result
+
+        return result
+
+    @staticmethod
+    def _with_matcher(currency: Currency | CurrencyDict) -> Resolved:
+        currency = Currency.from_dict(currency)
+        return currency, exact_amount_pattern(currency.exponent).fullmatch
+
+    @staticmethod
+    def _check_bounds(units: int) -> None:
+        if not INT64_MIN <= units <= INT64_MAX:
+            raise OverflowError("The amount doesn't fit in a DineroArray")
+
+
+class CSVReader(Reader):
+    """
+    Reads Dinero objects from the rows of a CSV file, one row at a time.
+
+    Columns are given by their header name or by their index. The currency is read
+    from a column of currency codes, or fixed for every row. Amounts are plain
+    decimal strings like `to_dict` writes them, grouping commas included. Blank rows
+    are ignored and invalid rows are skipped and recorded in `errors`.
+
+    Examples:
+        >>> reader = CSVReader(open("settlements.csv"), "amount", "currency")
+        >>> total = MoneyBag(reader)
+        >>> reader.errors
+        [RowError(line=12, row=['', 'USD'], error=InvalidOperationError(...))]
+
+        >>> list(CSVReader(["2.32", "10"], amount=0, currency=USD, header=False))
+        [Dinero(amount=2.32, ...), Dinero(amount=10.00, ...)]
+
+    Args:
+        lines (iterable): The CSV lines, like an open file.
+        amount (str, int): The amount column. Defaults to "amount".
+        currency (str, int, dict): The currency column, or the currency of every
+            amount. Defaults to "currency".
+        header (bool): If the first row is a header. Defaults to True.
+        key (str, int, optional): The column that groups the amounts in
+            `sum_file`. Rows without it are skipped.
+        fmtparams: Formatting parameters of `csv.reader`, like `delimiter`.
+
+    Raises:
+        ValueError: A column is named but there is no header.
+    """
+
+    def __init__(
+        self,
+        lines: Iterable[str],
+        amount: str | int = "amount",
+        currency: str | int | Currency | CurrencyDict = "currency",
+        header: bool = True,
+        *,
+        key: str | int | None = None,
+        **fmtparams: Any,
+    ):
+        fixed = currency if isinstance(currency, Mapping) else None
+        super().__init__(fixed, key)
+
+        columns = [amount] if fixed is not None else [amount, currency]
+        if key is not None:
+            columns.append(key)
+        if not header and not all(isinstance(column, int) for column in columns):
+            raise ValueError("Columns can only be named when the file has a header")
+
+        self._lines = lines
+        self._amount = amount
+        self._column = None if isinstance(currency, Mapping) else currency
+        self._header = header
+        self._fmtparams = fmtparams
+
+    def _rows(self, bounded: bool) -> Iterator[tuple[int, Currency, Any]]:
+        rows = csv.reader(self._lines, **self._fmtparams)
+        amount_index, currency_index, key = self._indexes(rows)
+        fixed = self._fixed
+        currencies = self._currencies
+        errors = self.errors
+        group = None
+
+        for row in rows:
+            if not row:
+                continue
+
+            try:
+                if fixed is not None:
+                    currency, exact = fixed
+                else:
+                    code = row[currency_index]
+                    currency, exact = currencies.get(code) or self._resolve(code)
+
+                amount = row[amount_index]
+                if exact(amount):
+                    units = int(amount.replace(".", ""))
+                else:
+                    units = parse_minor_units(amount, currency.exponent)
+
+                if bounded:
+                    self._check_bounds(units)
+                if key is not None:
+                    group = row[key]
+            except ROW_ERRORS as error:
+                errors.append(RowError(rows.line_num, row, error))
+                continue
+
+            yield units, currency, group
+
+    def _indexes(self, rows: Iterator[list[str]]) -> tuple[int, int, int | None]:
+        """
+        Return the indexes of the amount, currency and key columns.
+
+        Raises:
+            ValueError: A column is not in the header.
+        """
+        names: list[str] = next(rows, []) if self._header else []
+
+        amount = self._index(names, self._amount)
+        currency = -1 if self._column is None else self._index(names, self._column)
+        key = None if self._key is None else self._index(names, self._key)
+        return amount, currency, key
+
+    @staticmethod
+    def _index(names: list[str], column: str | int) -> int:
+        if isinstance(column, int):
+            return column
+        if column not in names:
+            raise ValueError(f"The column {column!r} is not in the header")
+        return names.index(column)
+
+
+class JSONLinesReader(Reader):
+    """
+    Reads Dinero objects from JSON Lines, one JSON object per line, like the output
+    of `to_json` for each amount.
+
+    The currency field holds a currency code or a currency dictionary, or the
+    currency is fixed for every line. Amounts are strings, like `to_json` writes
+    them, or JSON numbers. Blank lines are ignored and invalid lines are skipped
+    and recorded in `errors`.
+
+    Examples:
+        >>> reader = JSONLinesReader(open("settlements.jsonl"))
+        >>> dinero.sum(reader, currency=USD)
+        Dinero(amount=1523.40, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+        >>> list(JSONLinesReader(['{"price": "2.32", "code": "EUR"}'], "price", "code"))
+        [Dinero(amount=2.32, currency={'code': 'EUR', 'base': 10, 'exponent': 2...)]
+
+    Args:
+        lines (iterable): The JSON lines, like an open file.
+        amount (str): The amount field. Defaults to "amount".
+        currency (str, dict): The currency field, or the currency of every amount.
+            Defaults to "currency".
+        key (str, optional): The field that groups the amounts in `sum_file`.
+            Lines without it are skipped.
+    """
+
+    def __init__(
+        self,
+        lines: Iterable[str | bytes],
+        amount: str = "amount",
+        currency: str | Currency | CurrencyDict = "currency",
+        *,
+        key: str | None = None,
+    ):
+        fixed = currency if isinstance(currency, Mapping) else None
+        super().__init__(fixed, key)
+
+        self._lines = lines
+        self._amount = amount
+        self._field = None if fixed is not None else currency
+
+    def _rows(self, bounded: bool) -> Iterator[tuple[int, Currency, Any]]:
+        fixed = self._fixed
+        field = self._field
+        errors = self.errors
+        decode = json.JSONDecoder().decode
+        key = self._key
+        group = None
+
+        for line, text in enumerate(self._lines, start=1):
+            if not text.strip():
+                continue
+
+            try:
+                row = decode(text) if isinstance(text, str) else json.loads(text)
+                currency, exact = fixed or self._resolve(row[field])
+                amount = row[self._amount]
+
+                if type(amount) is str and exact(amount):
+                    units = int(amount.replace(".", ""))
+                elif isinstance(amount, str):
+                    units = parse_minor_units(amount, currency.exponent)
+                else:
+                    validate.dinero_amount(amount)
+                    units = to_minor_units(amount, currency.exponent)
+
+                if bounded:
+                    self._check_bounds(units)
+                if key is not None:
+                    group = row[key]
+                    hash(group)
+            except ROW_ERRORS as error:
+                errors.append(RowError(line, text, error))
+                continue
+
+            yield units, currency, group
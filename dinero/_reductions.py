@@ -0,0 +1,262 @@
+"""
+Reductions over many Dinero objects, computed on exact integer minor units.
+
+Amounts are read in a single pass without creating intermediate Dinero objects,
+and a DineroArray is reduced directly on its buffer.
+
+- sum:: Returns the exact total of the amounts.
+- min:: Returns the smallest amount.
+- max:: Returns the largest amount.
+- mean:: Returns the mean amount, rounded half to even.
+- median:: Returns the median amount, rounded half to even.
+"""
+
+import builtins
+from typing import Iterable
+
+from ._array import DineroArray
+from ._dinero import Dinero
+from ._utils import divide_half_even
+from .exceptions import DifferentCurrencyError, InvalidOperationError
+from .types import Currency, CurrencyDict
+
+Amounts = DineroArray | Iterable[Dinero]
+
+empty_msg = "There are no amounts to reduce."
+
+
+def sum(amounts: Amounts, currency: Currency | CurrencyDict | None = None) -> Dinero:
+    """
+    Returns the exact total of the amounts.
+
+    Examples:
+        >>> dinero.sum([Dinero("2.32", USD), Dinero("10", USD)])
+        Dinero(amount=12.32, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+        >>> dinero.sum([], currency=USD)
+        Dinero(amount=0.00, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+    Args:
+        amounts (DineroArray, iterable): Dinero objects, or a DineroArray.
+        currency (dict, optional): The currency of the amounts. Defaults to the
+            currency of the first amount.
+
+    Raises:
+        DifferentCurrencyError: Different currencies where used.
+        InvalidOperationError: An amount is not a Dinero object.
+        ValueError: There are no amounts and no currency was given.
+
+    Returns:
+        DINERO: Dinero object.
+    """
+    if isinstance(amounts, DineroArray):
+        _check_currency(amounts.currency, currency)
+        return amounts.sum()
+
+    units, result_currency = _minor_units(amounts, currency)
+    return Dinero._from_minor_units(builtins.sum(units), result_currency)
+
+
+def min(amounts: Amounts, currency: Currency | CurrencyDict | None = None) -> Dinero:
+    """
+    Returns the smallest amount.
+
+    Examples:
+        >>> dinero.min([Dinero("2.32", USD), Dinero("10", USD)])
+        Dinero(amount=2.32, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+    Args:
+        amounts (DineroArray, iterable): Dinero objects, or a DineroArray.
+        currency (dict, optional): The currency of the amounts. Defaults to the
+            currency of the first amount.
+
+    Raises:
+        DifferentCurrencyError: Different currencies where used.
+        InvalidOperationError: An amount is not a Dinero object.
+        ValueError: There are no amounts.
+
+    Returns:
+        DINERO: Dinero object.
+    """
+    if isinstance(amounts, DineroArray):
+        _check_currency(amounts.currency, currency)
+        return amounts.min()
+
+    units, result_currency = _minor_units(amounts, currency)
+    result = _non_empty(builtins.min(units, default=None))
+    return Dinero._from_minor_units(result, result_currency)
+
+
+def max(amounts: Amounts, currency: Currency | CurrencyDict | None = None) -> Dinero:
+    """
+    Returns the largest amount.
+
+    Examples:
+        >>> dinero.max([Dinero("2.32", USD), Dinero("10", USD)])
+        Dinero(amount=10.00, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+    Args:
+        amounts (DineroArray, iterable): Dinero objects, or a DineroArray.
+        currency (dict, optional): The currency of the amounts. Defaults to the
+            currency of the first amount.
+
+    Raises:
+        DifferentCurrencyError: Different currencies where used.
+        InvalidOperationError: An amount is not a Dinero object.
+        ValueError: There are no amounts.
+
+    Returns:
+        DINERO: Dinero object.
+    """
+    if isinstance(amounts, DineroArray):
+        _check_currency(amounts.currency, currency)
+        return amounts.max()
+
+    units, result_currency = _minor_units(amounts, currency)
+    result = _non_empty(builtins.max(units, default=None))
+    return Dinero._from_minor_units(result, result_currency)
+
+
+def mean(amounts: Amounts, currency: Currency | CurrencyDict | None = None) -> Dinero:
+    """
+    Returns the mean amount, rounded half to even to the currency exponent.
+
+    Examples:
+        >>> dinero.mean([Dinero("1", USD), Dinero("1", USD), Dinero("2", USD)])
+        Dinero(amount=1.33, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+    Args:
+        amounts (DineroArray, iterable): Dinero objects, or a DineroArray.
+        currency (dict, optional): The currency of the amounts. Defaults to the
+            currency of the first amount.
+
+    Raises:
+        DifferentCurrencyError: Different currencies where used.
+        InvalidOperationError: An amount is not a Dinero object.
+        ValueError: There are no amounts.
+
+    Returns:
+        DINERO: Dinero object.
+    """
+    if isinstance(amounts, DineroArray):
+        _check_currency(amounts.currency, currency)
+        total, count = amounts.sum().minor_units, len(amounts)
+        result_currency = amounts.currency
+    else:
+        units, result_currency = _minor_units(amounts, currency)
+        total = count = 0
+        for value in units:
+            total += value
+            count += 1
+
+    if not count:
+        raise ValueError(empty_msg)
+    return Dinero._from_minor_units(divide_half_even(total, count), result_currency)
+
+
+def median(amounts: Amounts, currency: Currency | CurrencyDict | None = None) -> Dinero:
+    """
+    Returns the median amount. With an even number of amounts it's the mean of the
+    two middle amounts, rounded half to even to the currency exponent.
+
+    Examples:
+        >>> dinero.median([Dinero("1", USD), Dinero("5", USD), Dinero("2", USD)])
+        Dinero(amount=2.00, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+    Args:
+        amounts (DineroArray, iterable): Dinero objects, or a DineroArray.
+        currency (dict, optional): The currency of the amounts. Defaults to the
+            currency of the first amount.
+
+    Raises:
+        DifferentCurrencyError: Different currencies where used.
+        InvalidOperationError: An amount is not a Dinero object.
+        ValueError: There are no amounts.
+
+    Returns:
+        DINERO: Dinero object.
+    """
+    if isinstance(amounts, DineroArray):
+        _check_currency(amounts.currency, currency)
+        values = sorted(amounts.minor_units)
+        result_currency = amounts.currency
+    else:
+        units, result_currency = _minor_units(amounts, currency)
+        values = sorted(units)
+
+    if not values:
+        raise ValueError(empty_msg)
+
+    middle = len(values) // 2
+    if len(values) % 2:
+        result = values[middle]
+    else:
+        result = divide_half_even(values[middle - 1] + values[middle], 2)
+
+    return Dinero._from_minor_units(result, result_currency)
+
+
+def _minor_units(
+    amounts: Iterable[Dinero], currency: Currency | CurrencyDict | None
+) -> tuple[Iterable[int], Currency]:
+    """
+    Return a lazy iterator over the minor units of the amounts and their currency.
+    The currency of every amount is checked as the iterator is consumed.
+
+    Raises:
+        ValueError: There are no amounts and no currency was given.
+    """
+    iterator = iter(amounts)
+
+    if currency is None:
+        first = next(iterator, None)
+        if first is None:
+            raise ValueError(empty_msg)
+        _check_amount(first)
+        result_currency = first._currency
+        return _iter_minor_units(iterator, result_currency, first), result_currency
+
+    result_currency = Currency.from_dict(currency)
+    return _iter_minor_units(iterator, result_currency, None), result_currency
+
+
+def _iter_minor_units(
+    iterator: Iterable[Dinero], currency: Currency, first: Dinero | None
+) -> Iterable[int]:
+    if first is not None:
+        yield first._minor_units
+
+    unit = currency.unit
+    for amount in iterator:
+        try:
+            amount_currency = amount._currency
+            units = amount._minor_units
+        except AttributeError:
+            raise InvalidOperationError(InvalidOperationError.operation_msg) from None
+
+        if amount_currency is not currency and amount_currency.unit != unit:
+            raise DifferentCurrencyError("Currencies can not be different")
+
+        yield units
+
+
+def _check_amount(amount: object) -> None:
+    if not isinstance(amount, Dinero):
+        raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+
+def _check_currency(
+    currency: Currency, expected: Currency | CurrencyDict | None
+) -> None:
+    if expected is None:
+        return
+
+    expected = Currency.from_dict(expected)
+    if expected is not currency and expected.unit != currency.unit:
+        raise DifferentCurrencyError("Currencies can not be different")
+
+
+def _non_empty(units: int | None) -> int:
+    if units is None:
+        raise ValueError(empty_msg)
+    return units
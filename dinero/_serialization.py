@@ -0,0 +1,172 @@
+"""
+Serialization of many Dinero objects at once.
+
+The output of every amount is the same as its `to_dict` or `to_json`. The currency
+is serialized once per currency instead of once per amount, and a DineroArray is
+read directly from its minor units. Deserializing resolves every distinct currency
+dictionary once, so all the amounts of a currency share one Currency object.
+
+- to_dicts:: Returns the amounts as a list of Python Dictionaries.
+- dumps_many:: Returns the amounts as a JSON array.
+- from_dicts:: Returns Dinero objects from a list of Python Dictionaries.
+- loads_many:: Returns Dinero objects from a JSON array.
+"""
+
+import json
+from typing import Any, Iterable, Iterator, Mapping
+
+from ._array import DineroArray
+from ._dinero import Dinero
+from ._utils import format_minor_units, parse_minor_units
+from .currencies import resolve_currency
+from .exceptions import InvalidOperationError
+from .types import Currency
+
+Amounts = DineroArray | Iterable[Dinero]
+
+
+def to_dicts(amounts: Amounts, amount_with_format: bool = False) -> list[dict[str, Any]]:
+    """
+    Returns the amounts as a list of Python Dictionaries, the same as calling
+    `to_dict` on each of them.
+
+    Examples:
+        >>> dinero.to_dicts([Dinero("2.32", USD), Dinero("10", EUR)])
+        [{'amount': '2.32', 'currency': {...USD...}}, {'amount': '10.00', ...}]
+
+    Args:
+        amounts (DineroArray, iterable): Dinero objects, or a DineroArray.
+        amount_with_format (bool): If the amounts are formatted. Defaults to False.
+
+    Raises:
+        InvalidOperationError: An amount is not a Dinero object.
+
+    Returns:
+        LIST: One dictionary per amount.
+    """
+    return [
+        {"amount": amount, "currency": dict(currency.serialized)}
+        for amount, currency in _serialized(amounts, amount_with_format)
+    ]
+
+
+def dumps_many(amounts: Amounts, amount_with_format: bool = False) -> str:
+    """
+    Returns the amounts as a JSON array, the same as `json.dumps(to_dicts(amounts))`.
+
+    Examples:
+        >>> dinero.dumps_many([Dinero("2.32", USD)])
+        '[{"amount": "2.32", "currency": {"code": "USD", "base": 10, ...}}]'
+
+    Args:
+        amounts (DineroArray, iterable): Dinero objects, or a DineroArray.
+        amount_with_format (bool): If the amounts are formatted. Defaults to False.
+
+    Raises:
+        InvalidOperationError: An amount is not a Dinero object.
+
+    Returns:
+        STR: The amounts as JSON.
+    """
+    items = [
+        f'{{"amount": "{amount}", "currency": {currency.serialized_json}}}'
+        for amount, currency in _serialized(amounts, amount_with_format)
+    ]
+    return f"[{', '.join(items)}]"
+
+
+def from_dicts(data: Iterable[Mapping[str, Any]]) -> list[Dinero]:
+    """
+    Returns Dinero objects from dictionaries with the format of `to_dict`, the same
+    as calling `Dinero.from_dict` on each of them.
+
+    Examples:
+        >>> dinero.from_dicts(dinero.to_dicts([Dinero("2.32", USD)]))
+        [Dinero(amount=2.32, currency={'code': 'USD', 'base': 10, 'exponent': 2})]
+
+    Args:
+        data (iterable): Mappings with an amount and a currency.
+
+    Raises:
+        InvalidOperationError: An amount is not a finite number.
+        TypeError: A mapping doesn't have a valid amount and currency.
+
+    Returns:
+        LIST: List of Dinero objects.
+    """
+    currencies: dict[tuple[Any, ...], Currency] = {}
+    new = Dinero._from_minor_units
+    result = []
+
+    for row in data:
+        try:
+            amount = row["amount"]
+            mapping = row["currency"]
+            key = (
+                mapping["code"],
+                mapping["base"],
+                mapping["exponent"],
+                mapping.get("symbol"),
+            )
+            currency = currencies.get(key)
+        except (KeyError, TypeError, AttributeError):
+            # leave the error message to the single amount path
+            result.append(Dinero.from_dict(row))
+            continue
+
+        if currency is None:
+            currency = currencies[key] = resolve_currency(mapping)
+
+        if isinstance(amount, str):
+            result.append(new(parse_minor_units(amount, currency.exponent), currency))
+        else:
+            result.append(Dinero.from_dict({"amount": amount, "currency": currency}))
+
+    return result
+
+
+def loads_many(data: str | bytes) -> list[Dinero]:
+    """
+    Returns Dinero objects from a JSON array with the format of `dumps_many`.
+
+    Examples:
+        >>> dinero.loads_many('[{"amount": "2.32", "currency": {"code": "USD", ...}}]')
+        [Dinero(amount=2.32, currency={'code': 'USD', 'base': 10, 'exponent': 2})]
+
+    Args:
+        data (str, bytes): The JSON document.
+
+    Raises:
+        InvalidOperationError: An amount is not a finite number.
+        TypeError: The document is not an array of amounts and currencies.
+        ValueError: The document is not valid JSON.
+
+    Returns:
+        LIST: List of Dinero objects.
+    """
+    rows = json.loads(data)
+    if not isinstance(rows, list):
+        raise TypeError("The data must be a JSON array")
+
+    return from_dicts(rows)
+
+
+def _serialized(
+    amounts: Amounts, amount_with_format: bool
+) -> Iterator[tuple[str, Currency]]:
+    """Yield the serialized amount and the currency of every amount."""
+    if isinstance(amounts, DineroArray):
+        currency = amounts.currency
+        if amount_with_format:
+            for amount in amounts:
+                yield amount._formatted_amount, currency
+        else:
+            exponent = currency.exponent
+            for units in amounts.minor_units:
+                yield format_minor_units(units, exponent), currency
+        return
+
+    for amount in amounts:
+        if not isinstance(amount, Dinero):
+            raise InvalidOperationError(InvalidOperationError.operation_msg)
+        yield amount._serialized_amount(amount_with_format), amount._currency
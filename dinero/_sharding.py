@@ -0,0 +1,260 @@
+"""
+Totals of large CSV and JSON Lines files, computed by several processes.
+
+The file is split into byte ranges that end at line boundaries and every range is
+read by a worker process with the streaming readers. Each worker reduces its rows
+to exact integer totals per currency, and per key, and the parent merges the
+partial totals in file order. Integer sums don't depend on the order they are
+added in, so the totals, and the skipped rows, are identical to reading the file
+in a single process with any number of workers.
+
+- sum_file:: Returns the totals per currency, and per key, of a CSV or JSON Lines file.
+- FileTotals:: The totals and the skipped rows of a file.
+"""
+
+import csv
+import os
+from typing import Any, Mapping, NamedTuple
+
+from ._bag import MoneyBag
+from ._dinero import Dinero
+from ._readers import CSVReader, JSONLinesReader, Reader, RowError
+from .types import Currency, CurrencyDict
+
+# Bytes read by a worker at a time, large enough to hide the cost of sending the
+# partial totals back to the parent.
+CHUNK_SIZE = 16 * 1024 * 1024
+
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+
+class FileTotals(NamedTuple):
+    """
+    The totals of a file.
+
+    Args:
+        totals (MoneyBag): The total of every currency.
+        groups (dict): The totals of every value of the key column or field, empty
+            when no key was given.
+        errors (list): The rows that were skipped, with their line in the file.
+    """
+
+    totals: MoneyBag
+    groups: dict[Any, MoneyBag]
+    errors: list[RowError]
+
+
+class Chunk(NamedTuple):
+    """A byte range of a file and the options to read it in a worker."""
+
+    path: str
+    start: int
+    end: int
+    # offset of the first row, a range starting there is already at a line start
+    first: int
+    json_lines: bool
+    amount: str | int
+    currency: str | int | Currency
+    key: str | int | None
+    encoding: str
+    fmtparams: dict[str, Any]
+
+
+def sum_file(
+    path: str | os.PathLike[str],
+    amount: str | int = "amount",
+    currency: str | int | Currency | CurrencyDict = "currency",
+    *,
+    key: str | int | None = None,
+    json_lines: bool | None = None,
+    header: bool = True,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    encoding: str = "utf-8",
+    **fmtparams: Any,
+) -> FileTotals:
+    """
+    Returns the exact totals per currency of the amounts of a CSV or JSON Lines
+    file, and per value of a key column or field when one is given, reading the
+    file with several processes.
+
+    Columns, fields and skipped rows work the same as in `CSVReader` and
+    `JSONLinesReader`, but CSV rows can't have line breaks inside quoted fields,
+    since the file is split at line breaks.
+
+    Examples:
+        >>> result = sum_file("settlements.csv", "amount", "currency", key="merchant")
+        >>> result.totals
+        MoneyBag(USD=152340.75, EUR=98211.10)
+
+        >>> result.groups["acme"].get(USD)
+        Dinero(amount=1523.40, currency={'code': 'USD', 'base': 10, 'exponent': 2})
+
+    Args:
+        path (str, PathLike): The CSV or JSON Lines file.
+        amount (str, int): The amount column or field. Defaults to "amount".
+        currency (str, int, dict): The currency column or field, or the currency of
+            every amount. Defaults to "currency".
+        key (str, int, optional): The column or field that groups the amounts.
+        json_lines (bool, optional): If the file is JSON Lines. Defaults to True for
+            the .jsonl and .ndjson extensions.
+        header (bool): If the first row of a CSV file is a header. Defaults to True.
+        workers (int, optional): The number of processes. Defaults to the number of
+            CPUs, 1 reads the file in this process.
+        chunk_size (int): The bytes of the file read by a worker at a time.
+        encoding (str): The encoding of the file, compatible with ASCII. Defaults
+            to "utf-8".
+        fmtparams: Formatting parameters of `csv.reader`, like `delimiter`.
+
+    Raises:
+        DifferentCurrencyError: Amounts in currencies with the same code have a
+            different base or exponent.
+        ValueError: A column is not in the header, or the chunk size is not a
+            positive integer.
+
+    Returns:
+        FILETOTALS: The totals, the totals of every key and the skipped rows.
+    """
+    path = os.fspath(path)
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("The chunk size must be a positive integer")
+
+    if json_lines is None:
+        json_lines = path.endswith(JSON_LINES_SUFFIXES)
+
+    source: str | int | Currency = (
+        Currency.from_dict(currency) if isinstance(currency, Mapping) else currency
+    )
+    first = 0
+
+    if not json_lines:
+        with open(path, "rb") as file:
+            names = file.readline() if header else b""
+            first = len(names)
+        columns = next(csv.reader([names.decode(encoding)], **fmtparams), [])
+        amount = _index(columns, amount)
+        key = None if key is None else _index(columns, key)
+        if not isinstance(source, Currency):
+            source = _index(columns, source)
+
+    size = os.path.getsize(path)
+    chunks = [
+        Chunk(
+            path,
+            start,
+            min(start + chunk_size, size),
+            first,
+            json_lines,
+            amount,
+            source,
+            key,
+            encoding,
+            fmtparams,
+        )
+        for start in range(first, size, chunk_size)
+    ]
+
+    if workers == 1 or len(chunks) < 2:
+        partials = list(map(_sum_chunk, chunks))
+    else:
+        # imported here, so `import dinero` doesn't load multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as executor:
+            partials = list(executor.map(_sum_chunk, chunks))
+
+    return _merge(partials, 1 if first else 0, key is not None)
+
+
+def _index(columns: list[str], column: str | int) -> int:
+    """
+    Return the index of a CSV column.
+
+    Raises:
+        ValueError: The column is named and not in the header.
+    """
+    if isinstance(column, int):
+        return column
+    if column not in columns:
+        raise ValueError(f"The column {column!r} is not in the header")
+    return columns.index(column)
+
+
+def _sum_chunk(chunk: Chunk) -> tuple[dict[Any, MoneyBag], list[RowError], int]:
+    """
+    Return the totals per key of the rows that start in a byte range, the rows
+    that were skipped, with their line in the range, and the number of lines.
+    """
+    with open(chunk.path, "rb") as file:
+        start = chunk.start
+        file.seek(start)
+        if start > chunk.first:
+            # the line that started in the previous range belongs to it
+            file.seek(start - 1)
+            start += len(file.readline()) - 1
+
+        data = file.read(max(chunk.end - start, 0))
+        if data and not data.endswith(b"\n"):
+            data += file.readline()
+
+    text = data.decode(chunk.encoding)
+    lines = text.split("\n")
+    if not text or text.endswith("\n"):
+        lines.pop()
+
+    reader: Reader
+    if chunk.json_lines:
+        reader = JSONLinesReader(
+            lines, chunk.amount, chunk.currency, key=chunk.key  # type: ignore
+        )
+    else:
+        reader = CSVReader(
+            lines,
+            chunk.amount,
+            chunk.currency,
+            header=False,
+            key=chunk.key,
+            **chunk.fmtparams,
+        )
+
+    # Currency objects are interned, so their id identifies them.
+    sums: dict[tuple[Any, int], int] = {}
+    currencies: dict[int, Currency] = {}
+    for units, currency, group in reader._rows(bounded=False):
+        index = (group, id(currency))
+        if index in sums:
+            sums[index] += units
+        else:
+            sums[index] = units
+            currencies[id(currency)] = currency
+
+    groups: dict[Any, MoneyBag] = {}
+    for (group, currency_id), units in sums.items():
+        if group not in groups:
+            groups[group] = MoneyBag()
+        groups[group].add(Dinero._from_minor_units(units, currencies[currency_id]))
+
+    return groups, reader.errors, len(lines)
+
+
+def _merge(
+    partials: list[tuple[dict[Any, MoneyBag], list[RowError], int]],
+    line: int,
+    keyed: bool,
+) -> FileTotals:
+    """Merge the partial totals of the chunks, in the order of the file."""
+    groups: dict[Any, MoneyBag] = {}
+    errors: list[RowError] = []
+
+    for partial, chunk_errors, lines in partials:
+        for group, bag in partial.items():
+            if group not in groups:
+                groups[group] = MoneyBag()
+            groups[group].merge(bag)
+
+        errors.extend(error._replace(line=error.line + line) for error in chunk_errors)
+        line += lines
+
+    totals = MoneyBag()
+    totals.merge(*groups.values())
+    return FileTotals(totals, groups if keyed else {}, errors)
@@ -1,5 +1,30 @@
 import json
-from decimal import Decimal
+import re
+from decimal import (
+    ROUND_HALF_EVEN,
+    Context,
+    Decimal,
+    DivisionByZero,
+    InvalidOperation,
+    Overflow,
+)
+from functools import lru_cache
+from math import lcm
+from typing import Sequence
+
+from .exceptions import InvalidOperationError
+
+# Amounts as written by `to_dict`, with optional thousands separators.
+FIXED_POINT = re.compile(r"(-?)([0-9]{1,3}(?:,[0-9]{3})+|[0-9]+)(?:\.([0-9]*))?")
+
+# Significant digits kept for the major units of an amount, the currency exponent
+# adds the digits needed for its minor units on top of it.
+MAX_DIGITS = 28
+
+# Amounts are converted to minor units only below this bound, checked before any
+# integer arithmetic so an amount like "1e10000000" is rejected at once.
+MAX_AMOUNT = 10**MAX_DIGITS
+too_large_msg = f"Amounts can't have more than {MAX_DIGITS} digits in their major units."
 
 
 class DecimalEncoder(json.JSONEncoder):
@@ -12,3 +37,373 @@ class DecimalEncoder(json.JSONEncoder):
             if isinstance(obj, Decimal)
             else json.JSONEncoder.default(self, obj)
         )
+
+
+def to_decimal(amount: int | float | str | Decimal) -> Decimal:
+    """
+    Return an exact Decimal for the given amount.
+
+    Floats are converted through their shortest repr, so `2.675` becomes
+    `Decimal("2.675")` instead of its binary expansion.
+
+    Args:
+        amount (str, int, float, Decimal): The amount to convert.
+
+    Returns:
+        DECIMAL: Decimal object.
+    """
+    if isinstance(amount, Decimal):
+        return amount
+
+    if isinstance(amount, float):
+        return Decimal(repr(amount))
+
+    return Decimal(amount)
+
+
+def divide_half_even(numerator: int, denominator: int) -> int:
+    """
+    Integer division rounded half to even, the same rounding used by
+    `Decimal.quantize` with the default context.
+
+    Args:
+        numerator (int): The dividend.
+        denominator (int): The divisor, must be positive.
+
+    Returns:
+        INT: The rounded quotient.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    doubled = remainder * 2
+
+    if doubled > denominator or (doubled == denominator and quotient & 1):
+        quotient += 1
+
+    return quotient
+
+
+def to_ratio(number: int | float | Decimal) -> tuple[int, int]:
+    """
+    Return a factor as an exact pair of integers, numerator and a positive
+    denominator, so it can be applied to minor units without rounding.
+
+    Examples:
+        >>> to_ratio(2.5)
+        (5, 2)
+
+    Args:
+        number (int, float, Decimal): The factor.
+
+    Raises:
+        InvalidOperationError: The number is not finite.
+
+    Returns:
+        TUPLE: Numerator and denominator.
+    """
+    if isinstance(number, int):
+        return number, 1
+
+    try:
+        return to_decimal(number).as_integer_ratio()
+    except (ValueError, OverflowError):
+        raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+
+def multiply_minor_units(units: int, numerator: int, denominator: int) -> int:
+    """
+    Multiply minor units by a factor given as a ratio, rounding the exact product
+    half to even.
+
+    Args:
+        units (int): The amount in minor units.
+        numerator (int): The factor numerator.
+        denominator (int): The factor denominator, must be positive.
+
+    Returns:
+        INT: The product in minor units.
+    """
+    if denominator == 1:
+        return units * numerator
+
+    return divide_half_even(units * numerator, denominator)
+
+
+def divide_minor_units(units: int, numerator: int, denominator: int) -> int:
+    """
+    Divide minor units by a divisor given as a ratio, rounding the exact quotient
+    half to even.
+
+    Args:
+        units (int): The amount in minor units.
+        numerator (int): The divisor numerator.
+        denominator (int): The divisor denominator, must be positive.
+
+    Raises:
+        ZeroDivisionError: The divisor is zero.
+
+    Returns:
+        INT: The quotient in minor units.
+    """
+    if numerator == 0:
+        raise ZeroDivisionError("division by zero")
+
+    if numerator < 0:
+        numerator, denominator = -numerator, -denominator
+
+    return divide_half_even(units * denominator, numerator)
+
+
+def to_weights(ratios: Sequence[int | float | Decimal]) -> list[int]:
+    """
+    Return allocation ratios as integer weights with the same proportions.
+
+    Examples:
+        >>> to_weights([1, Decimal("0.5")])
+        [2, 1]
+
+    Args:
+        ratios (sequence): The ratios, int, float or Decimal.
+
+    Raises:
+        InvalidOperationError: A ratio is not finite.
+        ValueError: There are no ratios, a ratio is negative or all of them are zero.
+
+    Returns:
+        LIST: One integer weight per ratio.
+    """
+    if not ratios:
+        raise ValueError("At least one ratio is required")
+
+    pairs = [to_ratio(ratio) for ratio in ratios]
+    if any(numerator < 0 for numerator, _ in pairs):
+        raise ValueError("Ratios cannot be negative")
+
+    common = lcm(*(denominator for _, denominator in pairs))
+    weights = [numerator * (common // denominator) for numerator, denominator in pairs]
+    if not any(weights):
+        raise ValueError("At least one ratio must be greater than zero")
+
+    return weights
+
+
+def allocate_minor_units(units: int, weights: Sequence[int]) -> list[int]:
+    """
+    Split minor units in shares proportional to the weights, without losing or
+    creating any unit.
+
+    Every share is first rounded towards zero, then the units left over are given
+    one by one to the shares with the largest remainders. Ties go to the earliest
+    share, so the result only depends on the inputs. A negative amount is split
+    like its absolute value, with the signs of the shares reversed.
+
+    Examples:
+        >>> allocate_minor_units(100, [1, 1, 1])
+        [34, 33, 33]
+
+    Args:
+        units (int): The amount in minor units.
+        weights (sequence): Non-negative integer weights, see `to_weights`.
+
+    Returns:
+        LIST: One share in minor units per weight, adding up to `units`.
+    """
+    sign = -1 if units < 0 else 1
+    units = abs(units)
+    total = sum(weights)
+
+    shares = []
+    remainders = []
+    for weight in weights:
+        share, remainder = divmod(units * weight, total)
+        shares.append(share)
+        remainders.append(remainder)
+
+    leftover = units - sum(shares)
+    order = sorted(range(len(weights)), key=lambda index: -remainders[index])
+    for index in order[:leftover]:
+        shares[index] += 1
+
+    return [sign * share for share in shares]
+
+
+def to_minor_units(amount: int | float | str | Decimal, exponent: int) -> int:
+    """
+    Return the amount as an exact integer count of minor units, rounded half to
+    even when it has more decimal places than the currency exponent.
+
+    Examples:
+        >>> to_minor_units("2.32", 2)
+        232
+
+        >>> to_minor_units("2.325", 2)
+        232
+
+    Args:
+        amount (str, int, float, Decimal): The amount to convert.
+        exponent (int): The currency exponent.
+
+    Raises:
+        InvalidOperationError: The amount has more than MAX_DIGITS digits in its
+            major units.
+
+    Returns:
+        INT: The amount in minor units.
+    """
+    if isinstance(amount, int):
+        if not -MAX_AMOUNT < amount < MAX_AMOUNT:
+            raise InvalidOperationError(too_large_msg)
+        return amount * 10**exponent
+
+    decimal = to_decimal(amount)
+    magnitude = decimal.adjusted()
+    if magnitude >= MAX_DIGITS:
+        raise InvalidOperationError(too_large_msg)
+    if magnitude < -exponent - 1:
+        # less than a tenth of a minor unit, without building a huge denominator
+        return 0
+
+    numerator, denominator = decimal.as_integer_ratio()
+    return divide_half_even(numerator * 10**exponent, denominator)
+
+
+def from_minor_units(units: int, exponent: int) -> Decimal:
+    """
+    Return the exact Decimal represented by an integer count of minor units.
+
+    Examples:
+        >>> from_minor_units(232, 2)
+        Decimal('2.32')
+
+    Args:
+        units (int): The amount in minor units.
+        exponent (int): The currency exponent.
+
+    Returns:
+        DECIMAL: Decimal object quantized to the currency exponent.
+    """
+    return Decimal(f"{units}E-{exponent}")
+
+
+def parse_minor_units(amount: str, exponent: int) -> int:
+    """
+    Return the minor units of an amount string as written by `to_dict`, with or
+    without format. Other strings accepted by Decimal, or with more decimal places
+    than the currency exponent, are converted with `to_minor_units`.
+
+    Examples:
+        >>> parse_minor_units("3,333.26", 2)
+        333326
+
+    Args:
+        amount (str): The amount.
+        exponent (int): The currency exponent.
+
+    Raises:
+        InvalidOperationError: The string is not a finite number, or it has more
+            than MAX_DIGITS digits in its major units.
+
+    Returns:
+        INT: The amount in minor units.
+    """
+    match = FIXED_POINT.fullmatch(amount)
+
+    if match is None or len(match[3] or "") > exponent:
+        try:
+            decimal = Decimal(amount)
+        except (ValueError, InvalidOperation):
+            raise InvalidOperationError(InvalidOperationError.operation_msg) from None
+        if not decimal.is_finite():
+            raise InvalidOperationError(InvalidOperationError.operation_msg)
+        return to_minor_units(decimal, exponent)
+
+    sign, whole, fraction = match.groups()
+    whole = whole.replace(",", "")
+    check_digits(whole)
+    units = int(whole + (fraction or "").ljust(exponent, "0"))
+    return -units if sign else units
+
+
+def check_digits(whole: str) -> None:
+    """
+    Check the digits of the major units of an amount before converting them.
+
+    Args:
+        whole (str): The digits before the decimal point.
+
+    Raises:
+        InvalidOperationError: There are more than MAX_DIGITS significant digits.
+    """
+    if len(whole) > MAX_DIGITS and len(whole.lstrip("0")) > MAX_DIGITS:
+        raise InvalidOperationError(too_large_msg)
+
+
+@lru_cache(maxsize=None)
+def exact_amount_pattern(exponent: int) -> "re.Pattern[str]":
+    """
+    Return the pattern of amounts written with exactly `exponent` decimal places and
+    no separators, like "-2.32". The minor units of a matching amount are its digits,
+    so they are read with `int(amount.replace(".", ""))` and no rounding. Amounts
+    with more than MAX_DIGITS digits in their major units don't match, and are left
+    to `parse_minor_units`.
+
+    Examples:
+        >>> exact_amount_pattern(2).fullmatch("-2.32") is not None
+        True
+
+    Args:
+        exponent (int): The currency exponent.
+
+    Returns:
+        PATTERN: Compiled regular expression, cached per exponent.
+    """
+    fraction = rf"\.[0-9]{{{exponent}}}" if exponent else ""
+    return re.compile(rf"-?[0-9]{{1,{MAX_DIGITS}}}{fraction}")
+
+
+def format_minor_units(units: int, exponent: int) -> str:
+    """
+    Return the amount represented by an integer count of minor units as a fixed
+    point string with exactly `exponent` decimal places, the same digits as
+    `str(from_minor_units(units, exponent))` but never in scientific notation.
+
+    Examples:
+        >>> format_minor_units(-232, 2)
+        '-2.32'
+
+        >>> format_minor_units(1, 8)
+        '0.00000001'
+
+    Args:
+        units (int): The amount in minor units.
+        exponent (int): The currency exponent.
+
+    Returns:
+        STR: The amount as a string.
+    """
+    if not exponent:
+        return str(units)
+
+    digits = str(abs(units)).rjust(exponent + 1, "0")
+    sign = "-" if units < 0 else ""
+    return f"{sign}{digits[:-exponent]}.{digits[-exponent:]}"
+
+
+@lru_cache(maxsize=None)
+def currency_context(exponent: int) -> Context:
+    """
+    Return the Decimal context used for the arithmetic of a currency.
+
+    Contexts are cached per exponent and passed explicitly to the Decimal
+    operations, so the thread's global context is never read or modified.
+
+    Args:
+        exponent (int): The currency exponent.
+
+    Returns:
+        CONTEXT: Decimal context with enough precision for the currency.
+    """
+    return Context(
+        prec=MAX_DIGITS + exponent,
+        rounding=ROUND_HALF_EVEN,
+        traps=[InvalidOperation, DivisionByZero, Overflow],
+    )
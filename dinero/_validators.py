@@ -1,4 +1,5 @@
 from decimal import Decimal, InvalidOperation
+from typing import Sequence
 
 from .exceptions import InvalidOperationError
 from .types import OperationType
@@ -43,6 +44,24 @@ class Validators:
         except (ValueError, InvalidOperation):
             raise InvalidOperationError(InvalidOperationError.operation_msg)
 
+    @staticmethod
+    def allocation_ratios(ratios: Sequence[int | float | Decimal]) -> None:
+        """
+        Validate that the ratios passed to an allocation are a sequence of numbers.
+
+        Args:
+            ratios (list, tuple)
+
+        Raises:
+            InvalidOperationError: An operation between unsupported types was executed.
+        """
+        if not isinstance(ratios, (list, tuple)):
+            raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+        for ratio in ratios:
+            if isinstance(ratio, bool) or not isinstance(ratio, (int, float, Decimal)):
+                raise InvalidOperationError(InvalidOperationError.operation_msg)
+
     @staticmethod
     def dinero_amount(amount: int | float | str | Decimal) -> None:
         """
@@ -60,7 +79,8 @@ class Validators:
             if not isinstance(amount, (int, float, str, Decimal, Dinero)):
                 raise InvalidOperationError(InvalidOperationError.operation_msg)
 
-            Decimal(amount)
+            if not Decimal(amount).is_finite():
+                raise InvalidOperationError(InvalidOperationError.operation_msg)
 
         except (ValueError, InvalidOperation):
             raise InvalidOperationError(InvalidOperationError.operation_msg)
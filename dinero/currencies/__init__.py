@@ -1,245 +1,404 @@
-from ._aed import AED
-from ._afn import AFN
-from ._amd import AMD
-from ._aoa import AOA
-from ._ars import ARS
-from ._aud import AUD
-from ._awg import AWG
-from ._azn import AZN
-from ._bbd import BBD
-from ._bdt import BDT
-from ._bgn import BGN
-from ._bhd import BHD
-from ._bif import BIF
-from ._bmd import BMD
-from ._bnd import BND
-from ._bov import BOV
-from ._brl import BRL
-from ._bwp import BWP
-from ._byn import BYN
-from ._bzd import BZD
-from ._cdf import CDF
-from ._che import CHE
-from ._chf import CHF
-from ._chw import CHW
-from ._clp import CLP
-from ._cny import CNY
-from ._cop import COP
-from ._cou import COU
-from ._crc import CRC
-from ._cuc import CUC
-from ._cve import CVE
-from ._czk import CZK
-from ._djf import DJF
-from ._dkk import DKK
-from ._dop import DOP
-from ._dzd import DZD
-from ._egp import EGP
-from ._etb import ETB
-from ._eur import EUR
-from ._fjd import FJD
-from ._fkp import FKP
-from ._gbp import GBP
-from ._gtq import GTQ
-from ._hrk import HRK
-from ._htg import HTG
-from ._idr import IDR
-from ._ils import ILS
-from ._inr import INR
-from ._iqd import IQD
-from ._irr import IRR
-from ._isk import ISK
-from ._jmd import JMD
-from ._jpy import JPY
-from ._kes import KES
-from ._kgs import KGS
-from ._khr import KHR
-from ._kmf import KMF
-from ._krw import KRW
-from ._kwd import KWD
-from ._kzt import KZT
-from ._lak import LAK
-from ._lkr import LKR
-from ._lrd import LRD
-from ._lsl import LSL
-from ._mad import MAD
-from ._mdl import MDL
-from ._mga import MGA
-from ._mmk import MMK
-from ._mnt import MNT
-from ._mop import MOP
-from ._mur import MUR
-from ._mvr import MVR
-from ._mxv import MXV
-from ._mzn import MZN
-from ._nio import NIO
-from ._npr import NPR
-from ._nzd import NZD
-from ._omr import OMR
-from ._pab import PAB
-from ._pen import PEN
-from ._pgk import PGK
-from ._php import PHP
-from ._pln import PLN
-from ._pyg import PYG
-from ._ron import RON
-from ._rsd import RSD
-from ._rub import RUB
-from ._sar import SAR
-from ._sbd import SBD
-from ._scr import SCR
-from ._sdg import SDG
-from ._sek import SEK
-from ._sgd import SGD
-from ._sll import SLL
-from ._sos import SOS
-from ._ssp import SSP
-from ._stn import STN
-from ._svc import SVC
-from ._syp import SYP
-from ._szl import SZL
-from ._thb import THB
-from ._tjs import TJS
-from ._tmt import TMT
-from ._tnd import TND
-from ._ttd import TTD
-from ._twd import TWD
-from ._tzs import TZS
-from ._ugx import UGX
-from ._usd import USD
-from ._usn import USN
-from ._uyi import UYI
-from ._vnd import VND
-from ._vuv import VUV
-from ._wst import WST
-from ._xcd import XCD
-from ._xof import XOF
-from ._xpf import XPF
-from ._yer import YER
-from ._zar import ZAR
-from ._zmw import ZMW
-from ._zwl import ZWL
+"""
+ISO 4217 currencies and the currency registry.
+
+Currencies are stored in a single table and each `Currency` object is created the
+first time it's accessed, so importing this package doesn't load one module per
+currency.
+
+- get_currency:: Returns the currency registered for an alphabetic code.
+- get_currency_by_numeric:: Returns the currency registered for an ISO 4217 numeric code.
+- get_numeric_code:: Returns the ISO 4217 numeric code registered for a currency code.
+- get_codes_by_symbol:: Returns the codes of the registered currencies using each symbol.
+- is_iso_currency:: Checks whether a currency is the built-in ISO 4217 currency.
+- register_currency:: Registers a custom currency so it can be looked up by its codes.
+- resolve_currency:: Returns the registered currency matching a currency dictionary.
+
+Examples:
+    >>> from dinero.currencies import USD
+    >>> USD.exponent
+    2
+
+    >>> get_currency("USD") is USD
+    True
+"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from ..exceptions import UnknownCurrencyError
+from ..types import Currency, CurrencyDict
+
+# code: (numeric code, base, exponent, symbol)
+_CURRENCIES: dict[str, tuple[int, int, int, str | None]] = {
+    "AED": (784, 10, 2, "Dhs"),  # United Arab Emirates dirham peso
+    "AFN": (971, 10, 2, "Af"),  # Afghan afghani
+    "AMD": (51, 10, 2, None),  # Armenian dram
+    "AOA": (973, 10, 2, "Kz"),  # Angolan kwanza
+    "ARS": (32, 10, 2, None),  # Argentine peso
+    "AUD": (36, 10, 2, None),  # Australian dollar
+    "AWG": (533, 10, 2, "Afl"),  # Aruban florin
+    "AZN": (944, 10, 2, "m."),  # Azerbaijani manat
+    "BBD": (52, 10, 2, None),  # Barbados dollar
+    "BDT": (50, 10, 2, "Tk"),  # Bangladeshi taka
+    "BGN": (975, 10, 2, "лв"),  # Bulgarian lev
+    "BHD": (48, 10, 3, None),  # Bahraini dinar
+    "BIF": (108, 10, 0, None),  # Burundian franc
+    "BMD": (60, 10, 2, None),  # Bermudian dollar
+    "BND": (96, 10, 2, None),  # Brunei dollar
+    "BOV": (984, 10, 2, None),  # Bolivian Mvdol
+    "BRL": (986, 10, 2, "R$"),  # Brazilian real
+    "BWP": (72, 10, 2, "P"),  # Botswana pula
+    "BYN": (933, 10, 2, None),  # Belarusian ruble
+    "BZD": (84, 10, 2, "BZ$"),  # Belize dollar
+    "CDF": (976, 10, 2, None),  # Congolese franc
+    "CHE": (947, 10, 2, None),  # WIR Euro
+    "CHF": (756, 10, 2, "SFr"),  # Swiss franc
+    "CHW": (948, 10, 2, None),  # WIR Franc
+    "CLP": (152, 10, 0, None),  # chilean peso
+    "CNY": (156, 10, 2, "¥"),  # Chinese Yuan
+    "COP": (170, 10, 2, None),  # Colombian peso
+    "COU": (970, 10, 2, None),  # Unidad de Valor Real
+    "CRC": (188, 10, 2, "₡"),  # Costa Rica
+    "CUC": (931, 10, 2, None),  # Cuban convertible peso
+    "CVE": (132, 10, 2, None),  # Cape Verdean escudo
+    "CZK": (203, 10, 2, "Kč"),  # Czech koruna
+    "DJF": (262, 10, 0, None),  # Djiboutian franc
+    "DKK": (208, 10, 2, "kr."),  # Danish krone
+    "DOP": (214, 10, 2, "RD$"),  # Dominican peso
+    "DZD": (12, 10, 2, "DA"),  # Algerian dinar
+    "EGP": (818, 10, 2, "LE"),  # Egyptian pound
+    "ETB": (230, 10, 2, "Br"),  # Ethiopian birr
+    "EUR": (978, 10, 2, "€"),  # Euro
+    "FJD": (242, 10, 2, None),  # Fiji dollar
+    "FKP": (238, 10, 2, None),  # Falkland Islands pound
+    "GBP": (826, 10, 2, "£"),  # Pound sterling
+    "GTQ": (320, 10, 2, "Q"),  # Guatemalan quetzal
+    "HRK": (191, 10, 2, None),  # Croatian kuna
+    "HTG": (332, 10, 2, None),  # Haitian gourde
+    "IDR": (360, 10, 2, "Rp"),  # Indonesian rupiah
+    "ILS": (376, 10, 2, None),  # Israeli new shekel
+    "INR": (356, 10, 2, "₹"),  # Indian rupee
+    "IQD": (368, 10, 3, None),  # Iraqi dinar
+    "IRR": (364, 10, 2, None),  # Iranian rial
+    "ISK": (352, 10, 0, None),  # Icelandic króna
+    "JMD": (388, 10, 2, None),  # Jamaican dollar
+    "JPY": (392, 10, 0, "¥"),  # Japanese Yen
+    "KES": (404, 10, 2, "KSh"),  # Kenyan shilling
+    "KGS": (417, 10, 2, "лв"),  # Kyrgyzstani som
+    "KHR": (116, 10, 2, "KHR"),  # Cambodian riel
+    "KMF": (174, 10, 0, None),  # Comoro franc
+    "KRW": (410, 10, 0, "₩"),  # South Korean won
+    "KWD": (414, 10, 3, None),  # Kuwaiti dinar
+    "KZT": (398, 10, 2, None),  # Kazakhstani tenge
+    "LAK": (418, 10, 2, None),  # Lao kip
+    "LKR": (144, 10, 2, "Rs"),  # Sri Lankan rupee
+    "LRD": (430, 10, 2, None),  # Liberian dollar
+    "LSL": (426, 10, 2, None),  # Lesotho loti
+    "MAD": (504, 10, 2, "Dh"),  # Moroccan dirham
+    "MDL": (498, 10, 2, None),  # Moldovan leu
+    "MGA": (969, 5, 1, "Ar"),  # Malagasy ariary
+    "MMK": (104, 10, 2, "K"),  # Myanmar kyat
+    "MNT": (496, 10, 2, "₮"),  # Mongolian tögrög
+    "MOP": (446, 10, 2, "MOP$"),  # Macanese pataca
+    "MUR": (480, 10, 2, "Rs"),  # Mauritian rupee
+    "MVR": (462, 10, 2, "Rf"),  # Maldivian rufiyaa
+    "MXV": (979, 10, 2, None),  # Mexican Unidad de Inversion
+    "MZN": (943, 10, 2, "Mt"),  # Mozambican metical
+    "NIO": (558, 10, 2, "C$"),  # Nicaraguan córdoba
+    "NPR": (524, 10, 2, "Rs"),  # Nepalese rupee
+    "NZD": (554, 10, 2, None),  # New Zealand dollar
+    "OMR": (512, 10, 3, None),  # Omani rial
+    "PAB": (590, 10, 2, None),  # Panamanian balboa
+    "PEN": (604, 10, 2, "S/."),  # Peruvian sol
+    "PGK": (598, 10, 2, "K"),  # Papua New Guinean kina
+    "PHP": (608, 10, 2, "₱"),  # Philippine peso
+    "PLN": (985, 10, 2, None),  # Polish złoty
+    "PYG": (600, 10, 0, "Gs"),  # Paraguayan guaraní
+    "RON": (946, 10, 2, None),  # Romanian leu
+    "RSD": (941, 10, 2, None),  # Serbian dinar
+    "RUB": (643, 10, 2, "py6"),  # Russian RUBle
+    "SAR": (682, 10, 2, None),  # Saudi riyal
+    "SBD": (90, 10, 2, None),  # Solomon Islands dollar
+    "SCR": (690, 10, 2, "Rs"),  # Seychelles rupee
+    "SDG": (938, 10, 2, None),  # Sudanese pound
+    "SEK": (752, 10, 2, None),  # Swedish krona
+    "SGD": (702, 10, 2, None),  # Singapore dollar
+    "SLL": (694, 10, 2, None),  # Sierra Leonean leone
+    "SOS": (706, 10, 2, None),  # Somali shilling
+    "SSP": (728, 10, 2, None),  # South Sudanese pound
+    "STN": (930, 10, 2, None),  # São Tomé and Príncipe dobra
+    "SVC": (222, 10, 2, None),  # Salvadoran colón
+    "SYP": (760, 10, 2, "S£"),  # Syrian pound
+    "SZL": (748, 10, 2, None),  # Swazi lilangeni
+    "THB": (764, 10, 2, None),  # Thai baht
+    "TJS": (972, 10, 2, None),  # Tajikistani somoni
+    "TMT": (934, 10, 2, None),  # Turkmenistan manat
+    "TND": (788, 10, 3, None),  # Tunisian dinar
+    "TTD": (780, 10, 2, None),  # Trinidad and Tobago dollar
+    "TWD": (901, 10, 2, None),  # New Taiwan dollar
+    "TZS": (834, 10, 2, None),  # Tanzanian shilling
+    "UGX": (800, 10, 0, "Ush"),  # Ugandan shilling
+    "USD": (840, 10, 2, None),  # United States dollar
+    "USN": (997, 10, 2, None),  # United States dollar (next day)
+    "UYI": (940, 10, 0, None),  # Uruguay Peso en Unidades Indexadas
+    "VND": (704, 10, 0, None),  # Vietnamese đồng
+    "VUV": (548, 10, 0, None),  # Vanuatu vatu
+    "WST": (882, 10, 2, "WS$"),  # Samoan tālā
+    "XCD": (951, 10, 2, "EC$"),  # East Caribbean dollar
+    "XOF": (952, 10, 0, "CFA"),  # West African CFA franc
+    "XPF": (953, 10, 0, None),  # CFP franc
+    "YER": (886, 10, 2, None),  # Yemeni rial
+    "ZAR": (710, 10, 2, "R"),  # South African rand
+    "ZMW": (967, 10, 2, "ZMW"),  # Zambian kwacha
+    "ZWL": (932, 10, 2, None),  # Zimbabwean dollar
+}
 
 __all__ = [
-    "MZN",
-    "VND",
-    "DZD",
-    "KWD",
-    "WST",
-    "ISK",
-    "KMF",
-    "AZN",
-    "SBD",
-    "VUV",
-    "RSD",
-    "KGS",
-    "LKR",
-    "DKK",
-    "LRD",
-    "CVE",
-    "INR",
-    "ZWL",
-    "BHD",
-    "TZS",
-    "ZMW",
-    "UGX",
-    "PAB",
-    "CHE",
-    "HRK",
-    "RON",
-    "FKP",
-    "CUC",
-    "USD",
-    "SGD",
-    "STN",
-    "COP",
-    "FJD",
-    "SSP",
-    "CLP",
-    "SYP",
-    "KHR",
-    "BOV",
-    "MGA",
-    "NIO",
-    "TJS",
-    "BND",
-    "YER",
-    "CDF",
-    "KRW",
-    "MUR",
-    "LAK",
-    "USN",
-    "PYG",
-    "PLN",
-    "BDT",
-    "XPF",
-    "KZT",
-    "AUD",
-    "MXV",
-    "CHF",
-    "DOP",
-    "THB",
-    "SOS",
-    "ETB",
-    "COU",
-    "BIF",
-    "BRL",
-    "ZAR",
-    "BBD",
-    "SDG",
-    "AFN",
-    "BWP",
-    "MDL",
-    "CZK",
-    "BGN",
-    "SVC",
-    "MVR",
-    "XCD",
-    "IRR",
-    "EUR",
-    "RUB",
-    "IQD",
-    "NPR",
-    "SAR",
-    "UYI",
-    "IDR",
-    "MMK",
-    "PGK",
-    "NZD",
-    "AED",
-    "CHW",
-    "XOF",
-    "MAD",
-    "ILS",
-    "DJF",
-    "GTQ",
-    "BYN",
-    "MNT",
-    "SZL",
-    "EGP",
-    "KES",
-    "SCR",
-    "HTG",
-    "TND",
-    "SLL",
-    "TTD",
-    "ARS",
-    "JMD",
-    "AOA",
-    "AMD",
-    "SEK",
-    "LSL",
-    "BZD",
-    "MOP",
-    "OMR",
-    "AWG",
-    "PHP",
-    "TMT",
-    "TWD",
-    "BMD",
-    "PEN",
-    "GBP",
-    "CNY",
-    "CRC",
-    "JPY",
+    *_CURRENCIES,
+    "get_currency",
+    "get_currency_by_numeric",
+    "get_codes_by_symbol",
+    "get_numeric_code",
+    "is_iso_currency",
+    "register_currency",
+    "resolve_currency",
 ]
+
+# Currencies created so far by code, and every known numeric code to its code.
+_registry: dict[str, Currency] = {}
+_numeric_codes: dict[int, str] = {row[0]: code for code, row in _CURRENCIES.items()}
+_alphabetic_codes: dict[str, int] = {code: row[0] for code, row in _CURRENCIES.items()}
+
+# Numeric codes are encoded as unsigned 16 bit integers, see `dinero._codec`.
+MAX_NUMERIC_CODE = 0xFFFF
+
+# Codes of the currencies using each symbol, built on first use and after every
+# registration.
+_symbols: dict[str, tuple[str, ...]] = {}
+
+
+def _load(code: str) -> Currency | None:
+    row = _CURRENCIES.get(code)
+    if row is None:
+        return None
+
+    _, base, exponent, symbol = row
+    currency = _registry.setdefault(code, Currency(code, base, exponent, symbol))
+    return currency
+
+
+def get_currency(code: str) -> Currency:
+    """
+    Returns the currency registered for an alphabetic code.
+
+    Examples:
+        >>> get_currency("EUR")
+        {'code': 'EUR', 'base': 10, 'exponent': 2, 'symbol': '€'}
+
+    Args:
+        code (str): The alphabetic currency code, like "USD".
+
+    Raises:
+        UnknownCurrencyError: No currency is registered with that code.
+
+    Returns:
+        CURRENCY: Currency object.
+    """
+    currency = _registry.get(code) or _load(code)
+    if currency is None:
+        raise UnknownCurrencyError(f"Unknown currency code: {code!r}")
+
+    return currency
+
+
+def get_currency_by_numeric(numeric: int | str) -> Currency:
+    """
+    Returns the currency registered for an ISO 4217 numeric code.
+
+    Examples:
+        >>> get_currency_by_numeric(840)
+        {'code': 'USD', 'base': 10, 'exponent': 2}
+
+        >>> get_currency_by_numeric("036")
+        {'code': 'AUD', 'base': 10, 'exponent': 2}
+
+    Args:
+        numeric (int, str): The numeric currency code.
+
+    Raises:
+        UnknownCurrencyError: No currency is registered with that code.
+
+    Returns:
+        CURRENCY: Currency object.
+    """
+    try:
+        code = _numeric_codes[int(numeric)]
+    except (KeyError, ValueError):
+        raise UnknownCurrencyError(f"Unknown numeric currency code: {numeric!r}")
+
+    return get_currency(code)
+
+
+def get_numeric_code(code: str) -> int:
+    """
+    Returns the ISO 4217 numeric code registered for an alphabetic code.
+
+    Examples:
+        >>> get_numeric_code("USD")
+        840
+
+    Args:
+        code (str): The alphabetic currency code, like "USD".
+
+    Raises:
+        UnknownCurrencyError: No numeric code is registered for that code.
+
+    Returns:
+        INT: The numeric currency code.
+    """
+    try:
+        return _alphabetic_codes[code]
+    except KeyError:
+        raise UnknownCurrencyError(f"No numeric code for currency: {code!r}") from None
+
+
+def get_codes_by_symbol() -> Mapping[str, tuple[str, ...]]:
+    """
+    Returns the codes of the registered currencies that use each symbol, in
+    alphabetical order. Currencies without a symbol use the default "$".
+
+    Examples:
+        >>> get_codes_by_symbol()["€"]
+        ('EUR',)
+
+        >>> get_codes_by_symbol()["¥"]
+        ('CNY', 'JPY')
+
+    Returns:
+        MAPPING: Read-only mapping of symbols to currency codes.
+    """
+    if not _symbols:
+        symbols = {code: row[3] for code, row in _CURRENCIES.items()}
+        symbols.update((code, currency.symbol) for code, currency in _registry.items())
+
+        codes: dict[str, list[str]] = {}
+        for code in sorted(symbols):
+            codes.setdefault(symbols[code] or "$", []).append(code)
+        _symbols.update((symbol, tuple(group)) for symbol, group in codes.items())
+
+    return MappingProxyType(_symbols)
+
+
+def is_iso_currency(currency: Currency) -> bool:
+    """
+    Checks whether a currency is the built-in ISO 4217 currency of its code. Those
+    can't be replaced, so they are the same in every process.
+
+    Examples:
+        >>> is_iso_currency(USD)
+        True
+
+        >>> is_iso_currency(Currency("USD", 10, 2, "US$"))
+        False
+
+    Args:
+        currency (Currency): The currency to check.
+
+    Returns:
+        BOOL: Whether the currency is the built-in one.
+    """
+    code = currency.code
+    return code in _CURRENCIES and (_registry.get(code) or _load(code)) is currency
+
+
+def register_currency(
+    currency: Currency | CurrencyDict, numeric: int | None = None
+) -> Currency:
+    """
+    Registers a custom currency, like an in-house unit or a cryptocurrency, so it can
+    be looked up by its alphabetic and numeric codes.
+
+    Registering the same currency again is a no-op.
+
+    Examples:
+        >>> BTC = register_currency(Currency("BTC", 10, 8, "₿"))
+        >>> get_currency("BTC") is BTC
+        True
+
+    Args:
+        currency (Currency, dict): The currency to register.
+        numeric (int, optional): Its numeric code, from 0 to 65535. Defaults to None.
+
+    Raises:
+        TypeError: The currency is not valid.
+        ValueError: The code or the numeric code is already used by other currency, or
+            the numeric code is out of range.
+
+    Returns:
+        CURRENCY: The registered Currency object.
+    """
+    currency = Currency.from_dict(currency)
+    code = currency.code
+
+    registered = _registry.get(code) or _load(code)
+    if registered is not None and registered is not currency:
+        # an equal currency that was not interned, see `dinero.types.MAX_INTERNED`
+        if registered != currency:
+            raise ValueError(f"A different currency is already registered as {code!r}")
+        currency = registered
+
+    if numeric is not None and not 0 <= numeric <= MAX_NUMERIC_CODE:
+        raise ValueError(f"The numeric code {numeric} is not between 0 and 65535")
+
+    if numeric is not None and _numeric_codes.get(numeric, code) != code:
+        raise ValueError(f"The numeric code {numeric} is already registered")
+
+    _registry[code] = currency
+    _symbols.clear()
+    if numeric is not None:
+        _numeric_codes[numeric] = code
+        _alphabetic_codes[code] = numeric
+
+    return currency
+
+
+def resolve_currency(currency: Mapping[str, Any]) -> Currency:
+    """
+    Returns the registered currency when it has the same values as the currency
+    dictionary, the interned Currency object for those values otherwise. A missing
+    symbol and the default "$" symbol are the same, so the output of `to_dict`
+    always resolves to the currency the amount was created with.
+
+    Examples:
+        >>> resolve_currency({"code": "USD", "base": 10, "exponent": 2, "symbol": "$"})
+        {'code': 'USD', 'base': 10, 'exponent': 2}
+
+    Args:
+        currency (dict): A mapping with code, base, exponent and optional symbol.
+
+    Raises:
+        TypeError: The mapping is not a valid currency.
+
+    Returns:
+        CURRENCY: Currency object.
+    """
+    interned = Currency.from_dict(currency)
+    registered = _registry.get(interned.code) or _load(interned.code)
+
+    if registered is not None and registered.serialized == interned.serialized:
+        return registered
+
+    return interned
+
+
+def __getattr__(name: str) -> Any:
+    currency = _load(name)
+    if currency is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = currency
+    return currency
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_CURRENCIES})
@@ -1,9 +0,0 @@
-""" United Arab Emirates dirham peso """
-from ..types import Currency
-
-AED: Currency = {
-    "code": "AED",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Dhs",
-}
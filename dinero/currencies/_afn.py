@@ -1,9 +0,0 @@
-""" Afghan afghani. """
-from ..types import Currency
-
-AFN: Currency = {
-    "code": "AFN",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Af",
-}
@@ -1,8 +0,0 @@
-""" Armenian dram. """
-from ..types import Currency
-
-AMD: Currency = {
-    "code": "AMD",
-    "base": 10,
-    "exponent": 2,
-}
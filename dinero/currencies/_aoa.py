@@ -1,9 +0,0 @@
-""" Angolan kwanza. """
-from ..types import Currency
-
-AOA: Currency = {
-    "code": "AOA",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Kz",
-}
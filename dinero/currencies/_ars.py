@@ -1,8 +0,0 @@
-""" Argentine peso. """
-from ..types import Currency
-
-ARS: Currency = {
-    "code": "ARS",
-    "base": 10,
-    "exponent": 2,
-}
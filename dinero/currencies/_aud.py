@@ -1,8 +0,0 @@
-""" Australian dollar. """
-from ..types import Currency
-
-AUD: Currency = {
-    "code": "AUD",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Aruban florin. """
-from ..types import Currency
-
-AWG: Currency = {
-    "code": "AWG",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Afl",
-}
@@ -1,9 +0,0 @@
-""" Azerbaijani manat. """
-from ..types import Currency
-
-AZN: Currency = {
-    "code": "AZN",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "m.",
-}
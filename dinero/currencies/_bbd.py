@@ -1,8 +0,0 @@
-""" Barbados dollar. """
-from ..types import Currency
-
-BBD: Currency = {
-    "code": "BBD",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Bangladeshi taka. """
-from ..types import Currency
-
-BDT: Currency = {
-    "code": "BDT",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Tk",
-}
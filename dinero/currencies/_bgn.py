@@ -1,9 +0,0 @@
-""" Bulgarian lev. """
-from ..types import Currency
-
-BGN: Currency = {
-    "code": "BGN",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "лв",
-}
@@ -1,8 +0,0 @@
-""" Bahraini dinar. """
-from ..types import Currency
-
-BHD: Currency = {
-    "code": "BHD",
-    "base": 10,
-    "exponent": 3,
-}
@@ -1,8 +0,0 @@
-""" Burundian franc. """
-from ..types import Currency
-
-BIF: Currency = {
-    "code": "BIF",
-    "base": 10,
-    "exponent": 0,
-}
@@ -1,8 +0,0 @@
-""" Bermudian dollar. """
-from ..types import Currency
-
-BMD: Currency = {
-    "code": "BMD",
-    "base": 10,
-    "exponent": 2,
-}
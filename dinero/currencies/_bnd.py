@@ -1,8 +0,0 @@
-""" Brunei dollar. """
-from ..types import Currency
-
-BND: Currency = {
-    "code": "BND",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Bolivian Mvdol. """
-from ..types import Currency
-
-BOV: Currency = {
-    "code": "BOV",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Brazilian real. """
-from ..types import Currency
-
-BRL: Currency = {
-    "code": "BRL",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "R$",
-}
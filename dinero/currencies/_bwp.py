@@ -1,9 +0,0 @@
-""" Botswana pula. """
-from ..types import Currency
-
-BWP: Currency = {
-    "code": "BWP",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "P",
-}
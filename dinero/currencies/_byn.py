@@ -1,8 +0,0 @@
-""" Belarusian ruble. """
-from ..types import Currency
-
-BYN: Currency = {
-    "code": "BYN",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Belize dollar. """
-from ..types import Currency
-
-BZD: Currency = {
-    "code": "BZD",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "BZ$",
-}
@@ -1,8 +0,0 @@
-""" Congolese franc. """
-from ..types import Currency
-
-CDF: Currency = {
-    "code": "CDF",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" WIR Euro. """
-from ..types import Currency
-
-CHE: Currency = {
-    "code": "CHE",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Swiss franc. """
-from ..types import Currency
-
-CHF: Currency = {
-    "code": "CHF",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "SFr",
-}
@@ -1,8 +0,0 @@
-""" WIR Franc. """
-from ..types import Currency
-
-CHW: Currency = {
-    "code": "CHW",
-    "base": 10,
-    "exponent": 2,
-}
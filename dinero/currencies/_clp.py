@@ -1,8 +0,0 @@
-""" chilean peso """
-from ..types import Currency
-
-CLP: Currency = {
-    "code": "CLP",
-    "base": 10,
-    "exponent": 0,
-}
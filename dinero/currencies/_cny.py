@@ -1,9 +0,0 @@
-""" Chinese Yuan """
-from ..types import Currency
-
-CNY: Currency = {
-    "code": "CNY",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "¥",
-}
@@ -1,8 +0,0 @@
-""" Colombian peso. """
-from ..types import Currency
-
-COP: Currency = {
-    "code": "COP",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Unidad de Valor Real. """
-from ..types import Currency
-
-COU: Currency = {
-    "code": "COU",
-    "base": 10,
-    "exponent": 2,
-}
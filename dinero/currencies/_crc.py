@@ -1,9 +0,0 @@
-""" Costa Rica """
-from ..types import Currency
-
-CRC: Currency = {
-    "code": "CRC",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "₡",
-}
@@ -1,8 +0,0 @@
-""" Cuban convertible peso. """
-from ..types import Currency
-
-CUC: Currency = {
-    "code": "CUC",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Cape Verdean escudo. """
-from ..types import Currency
-
-CVE: Currency = {
-    "code": "CVE",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Czech koruna. """
-from ..types import Currency
-
-CZK: Currency = {
-    "code": "CZK",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Kč",
-}
@@ -1,8 +0,0 @@
-""" Djiboutian franc. """
-from ..types import Currency
-
-DJF: Currency = {
-    "code": "DJF",
-    "base": 10,
-    "exponent": 0,
-}
@@ -1,9 +0,0 @@
-""" Danish krone. """
-from ..types import Currency
-
-DKK: Currency = {
-    "code": "DKK",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "kr.",
-}
@@ -1,9 +0,0 @@
-""" Dominican peso. """
-from ..types import Currency
-
-DOP: Currency = {
-    "code": "DOP",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "RD$",
-}
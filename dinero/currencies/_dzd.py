@@ -1,9 +0,0 @@
-""" Algerian dinar. """
-from ..types import Currency
-
-DZD: Currency = {
-    "code": "DZD",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "DA",
-}
@@ -1,9 +0,0 @@
-""" Egyptian pound. """
-from ..types import Currency
-
-EGP: Currency = {
-    "code": "EGP",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "LE",
-}
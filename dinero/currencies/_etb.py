@@ -1,9 +0,0 @@
-""" Ethiopian birr. """
-from ..types import Currency
-
-ETB: Currency = {
-    "code": "ETB",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Br",
-}
@@ -1,9 +0,0 @@
-""" Euro. """
-from ..types import Currency
-
-EUR: Currency = {
-    "code": "EUR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "€",
-}
@@ -1,8 +0,0 @@
-""" Fiji dollar. """
-from ..types import Currency
-
-FJD: Currency = {
-    "code": "FJD",
-    "base": 10,
-    "exponent": 2,
-}
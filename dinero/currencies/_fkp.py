@@ -1,8 +0,0 @@
-""" Falkland Islands pound. """
-from ..types import Currency
-
-FKP: Currency = {
-    "code": "FKP",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Pound sterling. """
-from ..types import Currency
-
-GBP: Currency = {
-    "code": "GBP",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "£",
-}
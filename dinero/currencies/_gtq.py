@@ -1,9 +0,0 @@
-""" Guatemalan quetzal. """
-from ..types import Currency
-
-GTQ: Currency = {
-    "code": "GTQ",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Q",
-}
@@ -1,8 +0,0 @@
-""" Croatian kuna. """
-from ..types import Currency
-
-HRK: Currency = {
-    "code": "HRK",
-    "base": 10,
-    "exponent": 2,
-}
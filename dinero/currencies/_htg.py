@@ -1,8 +0,0 @@
-""" Haitian gourde. """
-from ..types import Currency
-
-HTG: Currency = {
-    "code": "HTG",
-    "base": 10,
-    "exponent": 2,
-}
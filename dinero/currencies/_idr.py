@@ -1,9 +0,0 @@
-""" Indonesian rupiah. """
-from ..types import Currency
-
-IDR: Currency = {
-    "code": "IDR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Rp",
-}
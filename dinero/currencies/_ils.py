@@ -1,8 +0,0 @@
-""" Israeli new shekel. """
-from ..types import Currency
-
-ILS: Currency = {
-    "code": "ILS",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Indian rupee. """
-from ..types import Currency
-
-INR: Currency = {
-    "code": "INR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "₹",
-}
@@ -1,8 +0,0 @@
-""" Iraqi dinar. """
-from ..types import Currency
-
-IQD: Currency = {
-    "code": "IQD",
-    "base": 10,
-    "exponent": 3,
-}
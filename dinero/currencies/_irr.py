@@ -1,8 +0,0 @@
-""" Iranian rial. """
-from ..types import Currency
-
-IRR: Currency = {
-    "code": "IRR",
-    "base": 10,
-    "exponent": 2,
-}
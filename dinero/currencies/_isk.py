@@ -1,8 +0,0 @@
-""" Icelandic króna. """
-from ..types import Currency
-
-ISK: Currency = {
-    "code": "ISK",
-    "base": 10,
-    "exponent": 0,
-}
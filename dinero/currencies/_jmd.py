@@ -1,8 +0,0 @@
-""" Jamaican dollar. """
-from ..types import Currency
-
-JMD: Currency = {
-    "code": "JMD",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Japanese Yen """
-from ..types import Currency
-
-JPY: Currency = {
-    "code": "JPY",
-    "base": 10,
-    "exponent": 0,
-    "symbol": "¥",
-}
@@ -1,9 +0,0 @@
-""" Kenyan shilling. """
-from ..types import Currency
-
-KES: Currency = {
-    "code": "KES",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "KSh",
-}
@@ -1,9 +0,0 @@
-""" Kyrgyzstani som. """
-from ..types import Currency
-
-KGS: Currency = {
-    "code": "KGS",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "лв",
-}
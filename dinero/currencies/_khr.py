@@ -1,9 +0,0 @@
-""" Cambodian riel. """
-from ..types import Currency
-
-KHR: Currency = {
-    "code": "KHR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "KHR",
-}
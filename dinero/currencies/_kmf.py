@@ -1,8 +0,0 @@
-""" Comoro franc. """
-from ..types import Currency
-
-KMF: Currency = {
-    "code": "KMF",
-    "base": 10,
-    "exponent": 0,
-}
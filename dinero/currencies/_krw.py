@@ -1,9 +0,0 @@
-""" South Korean won. """
-from ..types import Currency
-
-KRW: Currency = {
-    "code": "KRW",
-    "base": 10,
-    "exponent": 0,
-    "symbol": "₩",
-}
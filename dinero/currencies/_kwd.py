@@ -1,8 +0,0 @@
-""" Kuwaiti dinar. """
-from ..types import Currency
-
-KWD: Currency = {
-    "code": "KWD",
-    "base": 10,
-    "exponent": 3,
-}
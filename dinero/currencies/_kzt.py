@@ -1,8 +0,0 @@
-""" Kazakhstani tenge. """
-from ..types import Currency
-
-KZT: Currency = {
-    "code": "KZT",
-    "base": 10,
-    "exponent": 2,
-}
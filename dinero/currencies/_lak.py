@@ -1,8 +0,0 @@
-""" Lao kip. """
-from ..types import Currency
-
-LAK: Currency = {
-    "code": "LAK",
-    "base": 10,
-    "exponent": 2,
-}
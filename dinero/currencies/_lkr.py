@@ -1,9 +0,0 @@
-""" Sri Lankan rupee. """
-from ..types import Currency
-
-LKR: Currency = {
-    "code": "LKR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Rs",
-}
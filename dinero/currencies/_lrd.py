@@ -1,8 +0,0 @@
-""" Liberian dollar. """
-from ..types import Currency
-
-LRD: Currency = {
-    "code": "LRD",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Lesotho loti. """
-from ..types import Currency
-
-LSL: Currency = {
-    "code": "LSL",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Moroccan dirham. """
-from ..types import Currency
-
-MAD: Currency = {
-    "code": "MAD",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Dh",
-}
@@ -1,8 +0,0 @@
-""" Moldovan leu. """
-from ..types import Currency
-
-MDL: Currency = {
-    "code": "MDL",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Malagasy ariary. """
-from ..types import Currency
-
-MGA: Currency = {
-    "code": "MGA",
-    "base": 5,
-    "exponent": 1,
-    "symbol": "Ar",
-}
@@ -1,9 +0,0 @@
-""" Myanmar kyat. """
-from ..types import Currency
-
-MMK: Currency = {
-    "code": "MMK",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "K",
-}
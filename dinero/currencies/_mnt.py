@@ -1,9 +0,0 @@
-""" Mongolian tögrög. """
-from ..types import Currency
-
-MNT: Currency = {
-    "code": "MNT",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "₮",
-}
@@ -1,9 +0,0 @@
-""" Macanese pataca. """
-from ..types import Currency
-
-MOP: Currency = {
-    "code": "MOP",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "MOP$",
-}
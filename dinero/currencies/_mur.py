@@ -1,9 +0,0 @@
-""" Mauritian rupee. """
-from ..types import Currency
-
-MUR: Currency = {
-    "code": "MUR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Rs",
-}
@@ -1,9 +0,0 @@
-""" Maldivian rufiyaa. """
-from ..types import Currency
-
-MVR: Currency = {
-    "code": "MVR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Rf",
-}
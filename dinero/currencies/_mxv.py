@@ -1,8 +0,0 @@
-""" Mexican Unidad de Inversion. """
-from ..types import Currency
-
-MXV: Currency = {
-    "code": "MXV",
-    "base": 10,
-    "exponent": 2,
-}
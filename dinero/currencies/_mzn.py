@@ -1,9 +0,0 @@
-""" Mozambican metical. """
-from ..types import Currency
-
-MZN: Currency = {
-    "code": "MZN",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Mt",
-}
@@ -1,9 +0,0 @@
-""" Nicaraguan córdoba. """
-from ..types import Currency
-
-NIO: Currency = {
-    "code": "NIO",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "C$",
-}
@@ -1,9 +0,0 @@
-""" Nepalese rupee. """
-from ..types import Currency
-
-NPR: Currency = {
-    "code": "NPR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Rs",
-}
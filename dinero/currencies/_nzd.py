@@ -1,8 +0,0 @@
-""" New Zealand dollar. """
-from ..types import Currency
-
-NZD: Currency = {
-    "code": "NZD",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Omani rial. """
-from ..types import Currency
-
-OMR: Currency = {
-    "code": "OMR",
-    "base": 10,
-    "exponent": 3,
-}
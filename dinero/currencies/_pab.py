@@ -1,8 +0,0 @@
-""" Panamanian balboa. """
-from ..types import Currency
-
-PAB: Currency = {
-    "code": "PAB",
-    "base": 10,
-    "exponent": 2,
-}
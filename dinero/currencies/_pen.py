@@ -1,9 +0,0 @@
-""" Peruvian sol. """
-from ..types import Currency
-
-PEN: Currency = {
-    "code": "PEN",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "S/.",
-}
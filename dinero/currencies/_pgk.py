@@ -1,9 +0,0 @@
-""" Papua New Guinean kina. """
-from ..types import Currency
-
-PGK: Currency = {
-    "code": "PGK",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "K",
-}
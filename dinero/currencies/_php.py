@@ -1,9 +0,0 @@
-""" Philippine peso. """
-from ..types import Currency
-
-PHP: Currency = {
-    "code": "PHP",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "₱",
-}
@@ -1,8 +0,0 @@
-""" Polish złoty. """
-from ..types import Currency
-
-PLN: Currency = {
-    "code": "PLN",
-    "base": 10,
-    "exponent": 2,
-}
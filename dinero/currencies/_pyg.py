@@ -1,9 +0,0 @@
-""" Paraguayan guaraní. """
-from ..types import Currency
-
-PYG: Currency = {
-    "code": "PYG",
-    "base": 10,
-    "exponent": 0,
-    "symbol": "Gs",
-}
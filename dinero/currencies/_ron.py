@@ -1,8 +0,0 @@
-""" Romanian leu. """
-from ..types import Currency
-
-RON: Currency = {
-    "code": "RON",
-    "base": 10,
-    "exponent": 2,
-}
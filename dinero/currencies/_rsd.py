@@ -1,8 +0,0 @@
-""" Serbian dinar. """
-from ..types import Currency
-
-RSD: Currency = {
-    "code": "RSD",
-    "base": 10,
-    "exponent": 2,
-}
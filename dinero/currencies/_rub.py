@@ -1,9 +0,0 @@
-""" Russian RUBle. """
-from ..types import Currency
-
-RUB: Currency = {
-    "code": "RUB",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "py6",
-}
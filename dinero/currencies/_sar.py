@@ -1,8 +0,0 @@
-""" Saudi riyal. """
-from ..types import Currency
-
-SAR: Currency = {
-    "code": "SAR",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Solomon Islands dollar. """
-from ..types import Currency
-
-SBD: Currency = {
-    "code": "SBD",
-    "base": 10,
-    "exponent": 2,
-}
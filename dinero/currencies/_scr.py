@@ -1,9 +0,0 @@
-""" Seychelles rupee. """
-from ..types import Currency
-
-SCR: Currency = {
-    "code": "SCR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "Rs",
-}
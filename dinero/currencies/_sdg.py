@@ -1,8 +0,0 @@
-""" Sudanese pound. """
-from ..types import Currency
-
-SDG: Currency = {
-    "code": "SDG",
-    "base": 10,
-    "exponent": 2,
-}
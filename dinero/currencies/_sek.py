@@ -1,8 +0,0 @@
-""" Swedish krona. """
-from ..types import Currency
-
-SEK: Currency = {
-    "code": "SEK",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Singapore dollar. """
-from ..types import Currency
-
-SGD: Currency = {
-    "code": "SGD",
-    "base": 10,
-    "exponent": 2,
-}
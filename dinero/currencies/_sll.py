@@ -1,8 +0,0 @@
-""" Sierra Leonean leone. """
-from ..types import Currency
-
-SLL: Currency = {
-    "code": "SLL",
-    "base": 10,
-    "exponent": 2,
-}
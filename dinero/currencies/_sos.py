@@ -1,8 +0,0 @@
-""" Somali shilling. """
-from ..types import Currency
-
-SOS: Currency = {
-    "code": "SOS",
-    "base": 10,
-    "exponent": 2,
-}
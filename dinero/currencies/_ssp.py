@@ -1,8 +0,0 @@
-""" South Sudanese pound. """
-from ..types import Currency
-
-SSP: Currency = {
-    "code": "SSP",
-    "base": 10,
-    "exponent": 2,
-}
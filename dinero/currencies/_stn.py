@@ -1,8 +0,0 @@
-""" São Tomé and Príncipe dobra. """
-from ..types import Currency
-
-STN: Currency = {
-    "code": "STN",
-    "base": 10,
-    "exponent": 2,
-}
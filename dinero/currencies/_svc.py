@@ -1,8 +0,0 @@
-""" Salvadoran colón. """
-from ..types import Currency
-
-SVC: Currency = {
-    "code": "SVC",
-    "base": 10,
-    "exponent": 2,
-}
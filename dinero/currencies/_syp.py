@@ -1,9 +0,0 @@
-""" Syrian pound. """
-from ..types import Currency
-
-SYP: Currency = {
-    "code": "SYP",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "S£",
-}
@@ -1,8 +0,0 @@
-""" Swazi lilangeni. """
-from ..types import Currency
-
-SZL: Currency = {
-    "code": "SZL",
-    "base": 10,
-    "exponent": 2,
-}
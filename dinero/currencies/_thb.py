@@ -1,8 +0,0 @@
-""" Thai baht. """
-from ..types import Currency
-
-THB: Currency = {
-    "code": "THB",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Tajikistani somoni. """
-from ..types import Currency
-
-TJS: Currency = {
-    "code": "TJS",
-    "base": 10,
-    "exponent": 2,
-}
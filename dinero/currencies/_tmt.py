@@ -1,8 +0,0 @@
-""" Turkmenistan manat. """
-from ..types import Currency
-
-TMT: Currency = {
-    "code": "TMT",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Tunisian dinar. """
-from ..types import Currency
-
-TND: Currency = {
-    "code": "TND",
-    "base": 10,
-    "exponent": 3,
-}
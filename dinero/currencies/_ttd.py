@@ -1,8 +0,0 @@
-""" Trinidad and Tobago dollar. """
-from ..types import Currency
-
-TTD: Currency = {
-    "code": "TTD",
-    "base": 10,
-    "exponent": 2,
-}
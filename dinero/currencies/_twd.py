@@ -1,8 +0,0 @@
-""" New Taiwan dollar. """
-from ..types import Currency
-
-TWD: Currency = {
-    "code": "TWD",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,8 +0,0 @@
-""" Tanzanian shilling. """
-from ..types import Currency
-
-TZS: Currency = {
-    "code": "TZS",
-    "base": 10,
-    "exponent": 2,
-}
@@ -1,9 +0,0 @@
-""" Ugandan shilling. """
-from ..types import Currency
-
-UGX: Currency = {
-    "code": "UGX",
-    "base": 10,
-    "exponent": 0,
-    "symbol": "Ush",
-}
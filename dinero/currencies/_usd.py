@@ -1,8 +0,0 @@
-""" United States dollar """
-from ..types import Currency
-
-USD: Currency = {
-    "code": "USD",
-    "base": 10,
-    "exponent": 2,
-}
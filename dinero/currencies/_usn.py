@@ -1,8 +0,0 @@
-""" United States dollar (next day). """
-from ..types import Currency
-
-USN: Currency = {
-    "code": "USN",
-    "base": 10,
-    "exponent": 2,
-}
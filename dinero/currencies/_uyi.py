@@ -1,8 +0,0 @@
-""" Uruguay Peso en Unidades Indexadas. """
-from ..types import Currency
-
-UYI: Currency = {
-    "code": "UYI",
-    "base": 10,
-    "exponent": 0,
-}
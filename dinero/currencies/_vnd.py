@@ -1,8 +0,0 @@
-""" Vietnamese đồng. """
-from ..types import Currency
-
-VND: Currency = {
-    "code": "VND",
-    "base": 10,
-    "exponent": 0,
-}
@@ -1,8 +0,0 @@
-""" Vanuatu vatu. """
-from ..types import Currency
-
-VUV: Currency = {
-    "code": "VUV",
-    "base": 10,
-    "exponent": 0,
-}
@@ -1,9 +0,0 @@
-""" Samoan tālā. """
-from ..types import Currency
-
-WST: Currency = {
-    "code": "WST",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "WS$",
-}
@@ -1,9 +0,0 @@
-""" East Caribbean dollar. """
-from ..types import Currency
-
-XCD: Currency = {
-    "code": "XCD",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "EC$",
-}
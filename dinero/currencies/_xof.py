@@ -1,9 +0,0 @@
-""" West African CFA franc. """
-from ..types import Currency
-
-XOF: Currency = {
-    "code": "XOF",
-    "base": 10,
-    "exponent": 0,
-    "symbol": "CFA",
-}
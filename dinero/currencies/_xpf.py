@@ -1,8 +0,0 @@
-""" CFP franc. """
-from ..types import Currency
-
-XPF: Currency = {
-    "code": "XPF",
-    "base": 10,
-    "exponent": 0,
-}
@@ -1,8 +0,0 @@
-""" Yemeni rial. """
-from ..types import Currency
-
-YER: Currency = {
-    "code": "YER",
-    "base": 10,
-    "exponent": 2,
-}
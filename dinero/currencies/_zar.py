@@ -1,9 +0,0 @@
-""" South African rand. """
-from ..types import Currency
-
-ZAR: Currency = {
-    "code": "ZAR",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "R",
-}
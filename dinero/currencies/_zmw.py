@@ -1,9 +0,0 @@
-""" Zambian kwacha. """
-from ..types import Currency
-
-ZMW: Currency = {
-    "code": "ZMW",
-    "base": 10,
-    "exponent": 2,
-    "symbol": "ZMW",
-}
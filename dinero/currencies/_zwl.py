@@ -1,8 +0,0 @@
-""" Zimbabwean dollar. """
-from ..types import Currency
-
-ZWL: Currency = {
-    "code": "ZWL",
-    "base": 10,
-    "exponent": 2,
-}
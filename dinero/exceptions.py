@@ -5,6 +5,10 @@ class DifferentCurrencyError(Exception):
     """Different currencies where used."""
 
 
+class UnknownCurrencyError(LookupError):
+    """No currency is registered with the given code."""
+
+
 class InvalidOperationError(InvalidOperation):
     """An operation between unsupported types was executed."""
 
@@ -0,0 +1,616 @@
+"""
+pandas extension type for Dinero columns, stored as int64 minor units.
+
+This module imports pandas and is never imported by `dinero` itself. Importing it
+registers the `dinero[<code>]` dtype, so columns can be created with
+`dtype="dinero[USD]"` for any currency in the registry.
+
+- DineroDtype:: The pandas dtype of the amounts of a single currency.
+- DineroExtensionArray:: The pandas array backing a column of amounts.
+"""
+
+import math
+import re
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Sequence, Type
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    take,
+)
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import is_integer, is_list_like, is_scalar
+
+from . import _numpy as engine
+from ._array import DineroArray
+from ._dinero import Dinero
+from ._utils import divide_half_even, to_minor_units, to_ratio
+from ._validators import Validators
+from .currencies import get_currency
+from .exceptions import DifferentCurrencyError, InvalidOperationError
+from .exceptions import UnknownCurrencyError
+from .types import Currency, CurrencyDict
+
+validate = Validators()
+
+_PANDAS_OBJECTS = (pd.Series, pd.Index, pd.DataFrame)
+
+
+@register_extension_dtype
+class DineroDtype(ExtensionDtype):
+    """
+    The pandas dtype of amounts in a single currency, named `dinero[<code>]`.
+
+    Examples:
+        >>> pd.Series(["2.32", "10"], dtype="dinero[USD]")
+        0     2.32
+        1    10.00
+        dtype: dinero[USD]
+
+    Args:
+        currency (dict, str): The currency, or the code of a registered currency.
+    """
+
+    _metadata = ("currency",)
+    _match = re.compile(r"^dinero\[(?P<code>\w+)\]$")
+
+    type = Dinero
+    kind = "O"
+    na_value = pd.NA
+
+    def __init__(self, currency: Currency | CurrencyDict | str):
+        if isinstance(currency, str):
+            self.currency = get_currency(currency)
+        else:
+            self.currency = Currency.from_dict(currency)
+
+    @property
+    def name(self) -> str:
+        return f"dinero[{self.currency.code}]"
+
+    @property
+    def _is_numeric(self) -> bool:
+        return True
+
+    @classmethod
+    def construct_array_type(cls) -> Type["DineroExtensionArray"]:
+        return DineroExtensionArray
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> "DineroDtype":
+        if not isinstance(string, str):
+            raise TypeError(f"Expected a string, got {string!r}")
+
+        error_msg = f"Cannot construct a '{cls.__name__}' from '{string}'"
+        match = cls._match.match(string)
+        if match is None:
+            raise TypeError(error_msg)
+
+        try:
+            return cls(match["code"])
+        except UnknownCurrencyError as error:
+            raise TypeError(error_msg) from error
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.currency))
+
+    def __repr__(self) -> str:
+        return f"DineroDtype({self.currency.code!r})"
+
+
+class DineroExtensionArray(ExtensionArray):
+    """
+    A pandas array of amounts in a single currency, stored as an int64 NumPy array
+    of minor units and a boolean mask of missing values. Arithmetic, reductions
+    and group sums run on the integers with the NumPy engine of DineroArray, so the
+    results are the same as with Dinero objects.
+
+    Columns are usually created through pandas with a `dinero[<code>]` dtype.
+
+    Examples:
+        >>> prices = pd.array(["2.32", "10"], dtype="dinero[USD]")
+        >>> (prices * 2).tolist()
+        [Dinero(amount=4.64, ...), Dinero(amount=20.00, ...)]
+
+    Args:
+        units (array-like): The amounts in minor units.
+        currency (dict, str): The currency of the amounts.
+        mask (array-like, optional): True where the value is missing.
+    """
+
+    _units: np.ndarray
+    _mask: np.ndarray
+    _dtype: DineroDtype
+
+    def __init__(
+        self,
+        units: Iterable[int],
+        currency: Currency | CurrencyDict | str | DineroDtype,
+        mask: Iterable[bool] | None = None,
+    ):
+        self._units = np.asarray(units, dtype=np.int64)
+        if mask is None:
+            self._mask = np.zeros(len(self._units), dtype=bool)
+        else:
+            self._mask = np.asarray(mask, dtype=bool)
+
+        if self._units.ndim != 1 or self._units.shape != self._mask.shape:
+            raise ValueError("units and mask must be one dimensional of the same length")
+
+        if isinstance(currency, DineroDtype):
+            self._dtype = currency
+        else:
+            self._dtype = DineroDtype(currency)
+
+    @classmethod
+    def _from_sequence(
+        cls,
+        scalars: Iterable[Any],
+        *,
+        dtype: DineroDtype | str | None = None,
+        copy: bool = False,
+    ) -> "DineroExtensionArray":
+        """
+        Build an array from Dinero objects, amounts or missing values.
+
+        Args:
+            scalars (iterable): Dinero objects, amounts as str, int, float or
+                Decimal, or None and pd.NA for missing values.
+            dtype (DineroDtype, str, optional): Defaults to the currency of the
+                first Dinero object.
+            copy (bool): Unused, the values are always copied.
+
+        Raises:
+            DifferentCurrencyError: Different currencies where used.
+            InvalidOperationError: An operation between unsupported types was executed.
+            ValueError: No currency was given and can not be inferred.
+
+        Returns:
+            DINEROEXTENSIONARRAY: DineroExtensionArray object.
+        """
+        if isinstance(scalars, cls):
+            result = scalars if dtype is None else scalars._to_dtype(_as_dtype(dtype))
+            return result.copy()
+
+        if isinstance(scalars, DineroArray):
+            result_dtype = _as_dtype(dtype or scalars.currency)
+            _check_currency(result_dtype.currency, scalars.currency)
+            return cls(np.array(scalars.minor_units), result_dtype)
+
+        scalars = list(scalars)
+
+        if dtype is None:
+            first = next((value for value in scalars if isinstance(value, Dinero)), None)
+            if first is None:
+                raise ValueError("A dtype is required for DineroExtensionArray")
+            result_dtype = DineroDtype(first.currency)
+        else:
+            result_dtype = _as_dtype(dtype)
+
+        currency = result_dtype.currency
+        units = np.zeros(len(scalars), dtype=np.int64)
+        mask = np.zeros(len(scalars), dtype=bool)
+
+        for index, value in enumerate(scalars):
+            minor_units = _to_minor_units(value, currency)
+            if minor_units is None:
+                mask[index] = True
+            else:
+                units[index] = minor_units
+
+        return cls(units, result_dtype, mask)
+
+    @classmethod
+    def _from_sequence_of_strings(
+        cls, strings: Iterable[str], *, dtype: DineroDtype | str, copy: bool = False
+    ) -> "DineroExtensionArray":
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(
+        cls, values: np.ndarray, original: "DineroExtensionArray"
+    ) -> "DineroExtensionArray":
+        mask = np.array([units is None for units in values], dtype=bool)
+        units = np.array([0 if units is None else units for units in values])
+        return cls(units, original.dtype, mask)
+
+    @property
+    def dtype(self) -> DineroDtype:
+        return self._dtype
+
+    @property
+    def currency(self) -> Currency:
+        return self._dtype.currency
+
+    @property
+    def minor_units(self) -> np.ndarray:
+        """Read-only int64 view of the minor units, zero where the value is missing."""
+        units = self._units.view()
+        units.flags.writeable = False
+        return units
+
+    @property
+    def nbytes(self) -> int:
+        return self._units.nbytes + self._mask.nbytes
+
+    def to_dinero_array(self) -> DineroArray:
+        """
+        Returns the amounts as a DineroArray.
+
+        Raises:
+            ValueError: The array has missing values.
+
+        Returns:
+            DINEROARRAY: DineroArray object.
+        """
+        if self._mask.any():
+            raise ValueError("Missing values can not be stored in a DineroArray")
+        return DineroArray._from_array(engine.to_array(self._units), self.currency)
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, tuple):
+            item = _unpack_tuple(item)
+
+        if is_integer(item):
+            if self._mask[item]:
+                return pd.NA
+            return Dinero._from_minor_units(int(self._units[item]), self.currency)
+
+        item = check_array_indexer(self, item)
+        return type(self)(self._units[item], self._dtype, self._mask[item])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = check_array_indexer(self, key)
+
+        if isinstance(value, Dinero) or is_scalar(value):
+            minor_units = _to_minor_units(value, self.currency)
+            self._units[key] = 0 if minor_units is None else minor_units
+            self._mask[key] = minor_units is None
+            return
+
+        values = self._from_sequence(value, dtype=self._dtype)
+        self._units[key] = values._units
+        self._mask[key] = values._mask
+
+    def __iter__(self) -> Any:
+        currency = self.currency
+        new = Dinero._from_minor_units
+        for units, missing in zip(self._units.tolist(), self._mask.tolist()):
+            yield pd.NA if missing else new(units, currency)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        return np.array(list(self), dtype=object if dtype is None else dtype)
+
+    def isna(self) -> np.ndarray:
+        return self._mask.copy()
+
+    def copy(self) -> "DineroExtensionArray":
+        return type(self)(self._units.copy(), self._dtype, self._mask.copy())
+
+    def take(
+        self, indices: Sequence[int], *, allow_fill: bool = False, fill_value: Any = None
+    ) -> "DineroExtensionArray":
+        fill_units = 0
+        fill_mask = True
+        if allow_fill and fill_value is not None:
+            minor_units = _to_minor_units(fill_value, self.currency)
+            if minor_units is not None:
+                fill_units, fill_mask = minor_units, False
+
+        units = take(self._units, indices, allow_fill=allow_fill, fill_value=fill_units)
+        mask = take(self._mask, indices, allow_fill=allow_fill, fill_value=fill_mask)
+        return type(self)(units, self._dtype, mask)
+
+    @classmethod
+    def _concat_same_type(
+        cls, to_concat: Sequence["DineroExtensionArray"]
+    ) -> "DineroExtensionArray":
+        dtype = to_concat[0].dtype
+        for array in to_concat:
+            _check_currency(dtype.currency, array.currency)
+
+        units = np.concatenate([array._units for array in to_concat])
+        mask = np.concatenate([array._mask for array in to_concat])
+        return cls(units, dtype, mask)
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._units
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, Any]:
+        values = self._units.astype(object)
+        values[self._mask] = None
+        return values, None
+
+    def factorize(
+        self, use_na_sentinel: bool = True
+    ) -> tuple[np.ndarray, "DineroExtensionArray"]:
+        codes = np.full(len(self), -1, dtype=np.intp)
+        valid = ~self._mask
+        valid_codes, uniques = pd.factorize(self._units[valid])
+        codes[valid] = valid_codes
+
+        uniques_mask = np.zeros(len(uniques), dtype=bool)
+        if not use_na_sentinel and self._mask.any():
+            codes[self._mask] = len(uniques)
+            uniques = np.append(uniques, 0)
+            uniques_mask = np.append(uniques_mask, True)
+
+        return codes, type(self)(uniques, self._dtype, uniques_mask)
+
+    def isin(self, values: Any) -> np.ndarray:
+        amounts = [value for value in values if isinstance(value, Dinero)]
+        for amount in amounts:
+            _check_currency(self.currency, amount.currency)
+
+        result = np.isin(self._units, [amount._minor_units for amount in amounts])
+        result &= ~self._mask
+        if any(value is None or value is pd.NA for value in values):
+            result |= self._mask
+        return result
+
+    def unique(self) -> "DineroExtensionArray":
+        return self.factorize(use_na_sentinel=False)[1]
+
+    def _reduce(
+        self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs: Any
+    ) -> Any:
+        if name not in ("sum", "min", "max", "mean"):
+            raise TypeError(f"'{self.dtype}' does not support reduction '{name}'")
+
+        if not skipna and self._mask.any():
+            result: Any = pd.NA
+        else:
+            units = self._units[~self._mask]
+            count = len(units)
+
+            if name == "sum" and count >= kwargs.get("min_count", 0):
+                result = Dinero._from_minor_units(engine.total(units), self.currency)
+            elif name == "mean" and count:
+                mean = divide_half_even(engine.total(units), count)
+                result = Dinero._from_minor_units(mean, self.currency)
+            elif name in ("min", "max") and count:
+                reduce = engine.minimum if name == "min" else engine.maximum
+                result = Dinero._from_minor_units(reduce(units), self.currency)
+            else:
+                result = pd.NA
+
+        if keepdims:
+            return self._from_sequence([result], dtype=self._dtype)
+        return result
+
+    def _groupby_op(
+        self,
+        *,
+        how: str,
+        has_dropped_na: bool,
+        min_count: int,
+        ngroups: int,
+        ids: np.ndarray,
+        **kwargs: Any,
+    ) -> Any:
+        if how not in ("sum", "min", "max", "mean"):
+            return super()._groupby_op(
+                how=how,
+                has_dropped_na=has_dropped_na,
+                min_count=min_count,
+                ngroups=ngroups,
+                ids=ids,
+                **kwargs,
+            )
+
+        valid = (ids >= 0) & ~self._mask
+        groups = ids[valid]
+        units = self._units[valid]
+        counts = np.bincount(groups, minlength=ngroups)
+
+        if how in ("sum", "mean"):
+            # Exact sums: the high and low 32 bits are accumulated separately.
+            high = np.zeros(ngroups, dtype=np.int64)
+            low = np.zeros(ngroups, dtype=np.int64)
+            np.add.at(high, groups, units >> 32)
+            np.add.at(low, groups, units & 0xFFFFFFFF)
+            totals = [(h << 32) + lo for h, lo in zip(high.tolist(), low.tolist())]
+            if how == "mean":
+                totals = [
+                    divide_half_even(total, count) if count else 0
+                    for total, count in zip(totals, counts.tolist())
+                ]
+            result = _checked_vector(totals)
+        else:
+            initial = engine.INT64_MAX if how == "min" else engine.INT64_MIN
+            result = np.full(ngroups, initial, dtype=np.int64)
+            reduce = np.minimum if how == "min" else np.maximum
+            reduce.at(result, groups, units)
+
+        mask = counts < (min_count if how == "sum" else max(min_count, 1))
+        if not kwargs.get("skipna", True):
+            missing = (ids >= 0) & self._mask
+            mask |= np.bincount(ids[missing], minlength=ngroups) > 0
+
+        result[mask] = 0
+        return type(self)(result, self._dtype, mask)
+
+    def _to_dtype(self, dtype: DineroDtype) -> "DineroExtensionArray":
+        _check_currency(dtype.currency, self.currency)
+        return type(self)(self._units, dtype, self._mask)
+
+    def _operand(self, other: Any) -> tuple[np.ndarray | int, np.ndarray | bool]:
+        """
+        Return the minor units and missing mask to add or subtract elementwise: the
+        other array's, or those of a single amount.
+        """
+        if isinstance(other, DineroExtensionArray):
+            _check_currency(self.currency, other.currency)
+        elif isinstance(other, DineroArray) or (
+            is_list_like(other) and not isinstance(other, str)
+        ):
+            other = self._from_sequence(other, dtype=self._dtype)
+        else:
+            if other is not pd.NA and other is not None:
+                validate.addition_and_subtraction_amount(other)
+            minor_units = _to_minor_units(other, self.currency)
+            return (0, True) if minor_units is None else (minor_units, False)
+
+        if len(other) != len(self):
+            raise ValueError("The arrays must have the same length")
+        return other._units, other._mask
+
+    def _ratios(self, factor: Any) -> tuple[int, int] | list[tuple[int, int]]:
+        """Return the exact ratio of a factor, or one per element for a sequence."""
+        if is_list_like(factor):
+            factors = factor.tolist() if isinstance(factor, np.ndarray) else list(factor)
+            if len(factors) != len(self):
+                raise ValueError("The factors must have the same length as the array")
+            for number in factors:
+                validate.multiplication_and_division_amount(number)
+            return [to_ratio(number) for number in factors]
+
+        if isinstance(factor, np.generic):
+            factor = factor.item()
+        validate.multiplication_and_division_amount(factor)
+        return to_ratio(factor)
+
+    def _combine(
+        self,
+        func: Callable[..., np.ndarray],
+        operand: Any,
+        mask: np.ndarray | bool = False,
+    ) -> "DineroExtensionArray":
+        mask = self._mask | mask
+        units = func(np.where(mask, 0, self._units), operand)
+        units[mask] = 0
+        return type(self)(units, self._dtype, mask)
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, _PANDAS_OBJECTS):
+            return NotImplemented
+        units, mask = self._operand(other)
+        return self._combine(engine.add, units, mask)
+
+    def __radd__(self, other: Any) -> Any:
+        return self.__add__(other)
+
+    def __sub__(self, other: Any) -> Any:
+        if isinstance(other, _PANDAS_OBJECTS):
+            return NotImplemented
+        units, mask = self._operand(other)
+        return self._combine(engine.subtract, units, mask)
+
+    def __rsub__(self, other: Any) -> Any:
+        if isinstance(other, _PANDAS_OBJECTS):
+            return NotImplemented
+        return -self.__sub__(other)
+
+    def __mul__(self, factor: Any) -> Any:
+        if isinstance(factor, _PANDAS_OBJECTS):
+            return NotImplemented
+        return self._combine(engine.multiply, self._ratios(factor))
+
+    def __rmul__(self, factor: Any) -> Any:
+        return self.__mul__(factor)
+
+    def __truediv__(self, divisor: Any) -> Any:
+        if isinstance(divisor, _PANDAS_OBJECTS):
+            return NotImplemented
+        return self._combine(engine.divide, self._ratios(divisor))
+
+    def __neg__(self) -> "DineroExtensionArray":
+        return self._combine(lambda units, _: engine.negate(units), None)
+
+    def __pos__(self) -> "DineroExtensionArray":
+        return self.copy()
+
+    def __abs__(self) -> "DineroExtensionArray":
+        return self._combine(
+            lambda units, _: np.where(units < 0, engine.negate(units), units), None
+        )
+
+    def _compare(self, other: Any, func: Callable[..., np.ndarray]) -> Any:
+        if isinstance(other, _PANDAS_OBJECTS):
+            return NotImplemented
+
+        if not isinstance(other, (Dinero, DineroArray, DineroExtensionArray)) and not (
+            is_list_like(other) and not isinstance(other, str)
+        ):
+            raise InvalidOperationError(InvalidOperationError.comparison_msg)
+
+        units, mask = self._operand(other)
+        return pd.arrays.BooleanArray(func(self._units, units), self._mask | mask)
+
+    def __eq__(self, other: Any) -> Any:  # type: ignore[override]
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other: Any) -> Any:  # type: ignore[override]
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other: Any) -> Any:
+        return self._compare(other, np.less)
+
+    def __le__(self, other: Any) -> Any:
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other: Any) -> Any:
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other: Any) -> Any:
+        return self._compare(other, np.greater_equal)
+
+
+def _as_dtype(dtype: DineroDtype | Currency | CurrencyDict | str) -> DineroDtype:
+    if isinstance(dtype, DineroDtype):
+        return dtype
+    if isinstance(dtype, str):
+        return DineroDtype.construct_from_string(dtype)
+    return DineroDtype(dtype)
+
+
+def _check_currency(currency: Currency, other: Currency) -> None:
+    # the same interned currency, or one that only differs in its symbol
+    if currency is not other and currency.unit != other.unit:
+        raise DifferentCurrencyError("Currencies can not be different")
+
+
+def _to_minor_units(value: Any, currency: Currency) -> int | None:
+    """Return the minor units of an amount in the currency, or None if missing."""
+    if isinstance(value, Dinero):
+        _check_currency(currency, value.currency)
+        return value._minor_units
+
+    if value is None or value is pd.NA:
+        return None
+
+    if isinstance(value, float) and math.isnan(value):
+        return None
+
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, Decimal) and value.is_nan():
+        return None
+
+    validate.dinero_amount(value)
+    return to_minor_units(value, currency.exponent)
+
+
+def _checked_vector(units: list[int]) -> np.ndarray:
+    try:
+        return np.array(units, dtype=np.int64)
+    except OverflowError:
+        raise OverflowError(engine.overflow_msg) from None
+
+
+def _unpack_tuple(key: tuple[Any, ...]) -> Any:
+    if len(key) == 1:
+        return key[0]
+    if len(key) == 2 and key[1] is Ellipsis:
+        return key[0]
+    if len(key) == 2 and key[0] is Ellipsis:
+        return key[1]
+    raise IndexError("too many indices for DineroExtensionArray")
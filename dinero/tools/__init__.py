@@ -1,17 +1,35 @@
-from .conversion import convert
-from .interest import calculate_compound_interest, calculate_simple_interest
+from .conversion import convert, convert_many
+from .interest import (
+    calculate_compound_interest,
+    calculate_compound_interest_many,
+    calculate_simple_interest,
+    calculate_simple_interest_many,
+)
 from .margin import (
     calculate_cost_amount,
+    calculate_cost_amount_many,
     calculate_margin_portion,
+    calculate_margin_portion_many,
     calculate_selling_price,
+    calculate_selling_price_many,
 )
 from .markup import (
     calculate_base_amount,
+    calculate_base_amount_many,
     calculate_marked_up_amount,
+    calculate_marked_up_amount_many,
     calculate_markup_portion,
+    calculate_markup_portion_many,
+)
+from .percentage import calculate_percentage, calculate_percentage_many
+from .vat import (
+    calculate_gross_amount,
+    calculate_gross_amount_many,
+    calculate_net_amount,
+    calculate_net_amount_many,
+    calculate_vat_portion,
+    calculate_vat_portion_many,
 )
-from .percentage import calculate_percentage
-from .vat import calculate_gross_amount, calculate_net_amount, calculate_vat_portion
 
 __all__ = [
     "calculate_gross_amount",
@@ -27,4 +45,17 @@ __all__ = [
     "calculate_margin_portion",
     "calculate_selling_price",
     "convert",
+    "calculate_gross_amount_many",
+    "calculate_net_amount_many",
+    "calculate_vat_portion_many",
+    "calculate_percentage_many",
+    "calculate_simple_interest_many",
+    "calculate_compound_interest_many",
+    "calculate_base_amount_many",
+    "calculate_marked_up_amount_many",
+    "calculate_markup_portion_many",
+    "calculate_cost_amount_many",
+    "calculate_margin_portion_many",
+    "calculate_selling_price_many",
+    "convert_many",
 ]
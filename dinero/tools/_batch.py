@@ -0,0 +1,124 @@
+"""
+Helpers shared by the batch variants of the tools.
+
+Batch functions take a DineroArray or an iterable of Dinero objects, and a single
+rate or one rate per amount. Inputs are validated once, the amounts are processed
+as a DineroArray and the results are returned in the same form they were given:
+a DineroArray for a DineroArray, a list of Dinero objects otherwise. Every factor
+is computed with the same expression as the single amount tool, so the results
+are identical.
+"""
+
+from decimal import Decimal
+from typing import Callable, Iterable, Sequence, TypeAlias, TypeVar
+
+from dinero import Dinero, DineroArray
+
+from ._validators import ToolValidators
+
+Amounts: TypeAlias = DineroArray | Iterable[Dinero]
+Rate = TypeVar("Rate")
+Converted = TypeVar("Converted")
+Factor: TypeAlias = int | float | Decimal
+
+validate = ToolValidators()
+
+
+def to_array(amounts: Amounts) -> DineroArray:
+    """
+    Return the amounts as a DineroArray.
+
+    Raises:
+        InvalidOperationError: An amount is not a Dinero object.
+        DifferentCurrencyError: The amounts have different currencies.
+        ValueError: There are no amounts.
+    """
+    if isinstance(amounts, DineroArray):
+        return amounts
+
+    values = list(amounts)
+    for amount in values:
+        validate.amount(amount)
+
+    return DineroArray(values)
+
+
+def to_rates(
+    rates: Rate | Iterable[Rate], length: int, validator: Callable[[Rate], object]
+) -> Rate | list[Rate]:
+    """
+    Validate a single rate, or a sequence of rates with one rate per amount.
+    Every distinct rate is validated once, rates of different types, like `1`,
+    `1.0` and `True`, are validated separately.
+
+    Raises:
+        ValueError: The number of rates and amounts differ.
+    """
+    if _is_single(rates):
+        validator(rates)  # type: ignore[arg-type]
+        return rates  # type: ignore[return-value]
+
+    values = _to_list(rates, length)  # type: ignore[arg-type]
+    for rate in {(type(rate), rate): rate for rate in values}.values():
+        validator(rate)
+
+    return values
+
+
+def convert_rates(
+    rates: Rate | Iterable[Rate], length: int, converter: Callable[[Rate], Converted]
+) -> Converted | list[Converted]:
+    """
+    Validate and convert a single rate, or a sequence of rates with one rate per
+    amount, for rates that are validated by converting them. Every distinct rate
+    and type of rate is converted once.
+
+    Raises:
+        ValueError: The number of rates and amounts differ.
+    """
+    if _is_single(rates):
+        return converter(rates)  # type: ignore[arg-type]
+
+    cache: dict[tuple[type, Rate], Converted] = {}
+    result = []
+    for rate in _to_list(rates, length):  # type: ignore[arg-type]
+        key = (type(rate), rate)
+        if key not in cache:
+            cache[key] = converter(rate)
+        result.append(cache[key])
+
+    return result
+
+
+def factors(
+    rates: Rate | Sequence[Rate], factor: Callable[[Rate], Factor]
+) -> Factor | list[Factor]:
+    """Apply the factor expression once per distinct rate and type of rate."""
+    if not isinstance(rates, list):
+        return factor(rates)  # type: ignore[arg-type]
+
+    cache: dict[tuple[type, Rate], Factor] = {}
+    result = []
+    for rate in rates:
+        key = (type(rate), rate)
+        if key not in cache:
+            cache[key] = factor(rate)
+        result.append(cache[key])
+
+    return result
+
+
+def _is_single(rates: object) -> bool:
+    return isinstance(rates, (str, bytes)) or not isinstance(rates, Iterable)
+
+
+def _to_list(rates: Iterable[Rate], length: int) -> list[Rate]:
+    values = rates.tolist() if hasattr(rates, "tolist") else list(rates)
+    if len(values) != length:
+        raise ValueError("The number of rates must match the number of amounts")
+    return values
+
+
+def to_result(array: DineroArray, amounts: Amounts) -> DineroArray | list[Dinero]:
+    """Return the results in the form the amounts were given."""
+    return array if isinstance(amounts, DineroArray) else array.to_list()
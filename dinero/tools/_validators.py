@@ -4,10 +4,12 @@ from dinero.exceptions import InvalidOperationError
 
 class ToolValidators:
     @staticmethod
-    def percentage_inputs(amount: Dinero, percentage: int | float) -> None:
+    def amount(amount: Dinero) -> None:
         if not isinstance(amount, Dinero):
             raise InvalidOperationError(InvalidOperationError.operation_msg)
 
+    @staticmethod
+    def percentage(percentage: int | float) -> None:
         if not isinstance(percentage, (int, float)):
             raise TypeError("The percentage argument must be a number.")
 
@@ -15,10 +17,7 @@ class ToolValidators:
             raise ValueError("The percentage argument cannot be negative.")
 
     @staticmethod
-    def vat_inputs(amount: Dinero, vat_rate: int | float) -> None:
-        if not isinstance(amount, Dinero):
-            raise InvalidOperationError(InvalidOperationError.operation_msg)
-
+    def vat_rate(vat_rate: int | float) -> None:
         if not isinstance(vat_rate, (int, float)):
             raise TypeError("The vat_rate argument must be a number.")
 
@@ -26,12 +25,47 @@ class ToolValidators:
             raise ValueError("The vat_rate argument cannot be negative.")
 
     @staticmethod
+    def compound_interest_rate(interest_rate: int | float) -> None:
+        if not isinstance(interest_rate, (float, int)) or interest_rate <= 0:
+            raise ValueError("Interest rate must be a positive float.")
+
+    @staticmethod
+    def margin_rate(margin_rate: int | float) -> None:
+        """
+        Validate a margin rate.
+
+        Args:
+            margin_rate (int | float): The margin rate as a percentage.
+
+        Raises:
+            TypeError: If margin_rate is not a number
+            ValueError: If margin_rate is negative or >= 100
+        """
+        if not isinstance(margin_rate, (int, float)):
+            raise TypeError("The margin_rate argument must be a number.")
+
+        if margin_rate < 0:
+            raise ValueError("The margin_rate argument cannot be negative.")
+
+        if margin_rate >= 100:
+            raise ValueError("The margin_rate argument must be less than 100.")
+
+    def percentage_inputs(self, amount: Dinero, percentage: int | float) -> None:
+        self.amount(amount)
+        self.percentage(percentage)
+
+    def vat_inputs(self, amount: Dinero, vat_rate: int | float) -> None:
+        self.amount(amount)
+        self.vat_rate(vat_rate)
+
     def simple_interest_inputs(
-        principal: Dinero, interest_rate: int | float, duration: int
+        self, principal: Dinero, interest_rate: int | float, duration: int
     ) -> None:
-        if not isinstance(principal, Dinero):
-            raise InvalidOperationError(InvalidOperationError.operation_msg)
+        self.amount(principal)
+        self.simple_interest_terms(interest_rate, duration)
 
+    @staticmethod
+    def simple_interest_terms(interest_rate: int | float, duration: int) -> None:
         if not isinstance(interest_rate, (int, float)):
             raise TypeError("The interest rate must be a number.")
 
@@ -44,24 +78,26 @@ class ToolValidators:
         if duration < 0:
             raise ValueError("The duration cannot be negative.")
 
-    @staticmethod
     def compound_interest_inputs(
-        principal: Dinero, interest_rate: float, duration: int, compound_frequency: int
+        self,
+        principal: Dinero,
+        interest_rate: float,
+        duration: int,
+        compound_frequency: int,
     ) -> None:
-        if not isinstance(principal, Dinero):
-            raise InvalidOperationError(InvalidOperationError.operation_msg)
-
-        if not isinstance(interest_rate, (float, int)) or interest_rate <= 0:
-            raise ValueError("Interest rate must be a positive float.")
+        self.amount(principal)
+        self.compound_interest_rate(interest_rate)
+        self.compound_interest_period(duration, compound_frequency)
 
+    @staticmethod
+    def compound_interest_period(duration: int, compound_frequency: int) -> None:
         if not isinstance(duration, int) or duration <= 0:
             raise ValueError("Duration must be a positive integer.")
 
         if not isinstance(compound_frequency, int) or compound_frequency <= 0:
             raise ValueError("Compound frequency must be a positive integer.")
 
-    @staticmethod
-    def margin_inputs(amount: Dinero, margin_rate: int | float) -> None:
+    def margin_inputs(self, amount: Dinero, margin_rate: int | float) -> None:
         """
         Validate margin calculation inputs.
 
@@ -74,14 +110,5 @@ class ToolValidators:
             TypeError: If margin_rate is not a number
             ValueError: If margin_rate is negative or >= 100
         """
-        if not isinstance(amount, Dinero):
-            raise InvalidOperationError(InvalidOperationError.operation_msg)
-
-        if not isinstance(margin_rate, (int, float)):
-            raise TypeError("The margin_rate argument must be a number.")
-
-        if margin_rate < 0:
-            raise ValueError("The margin_rate argument cannot be negative.")
-
-        if margin_rate >= 100:
-            raise ValueError("The margin_rate argument must be less than 100.")
+        self.amount(amount)
+        self.margin_rate(margin_rate)
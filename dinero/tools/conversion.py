@@ -28,12 +28,54 @@ Example:
 """
 
 from decimal import Decimal, InvalidOperation
+from typing import Iterable
 
-from dinero import Dinero
-from dinero.types import Currency
+from dinero import Dinero, DineroArray
+from dinero._utils import multiply_minor_units, to_ratio
+from dinero.types import Currency, CurrencyDict
 
+from . import _batch as batch
+from ._batch import Amounts
 
-def convert(dinero_obj: Dinero, exchange_rate: str | float, currency: Currency) -> Dinero:
+
+def _validate_currency(currency: Currency | CurrencyDict) -> Currency:
+    # Validate the currency is a Currency dict
+    if not isinstance(currency, dict) or not all(
+        key in currency for key in ["code", "base", "exponent"]
+    ):
+        raise TypeError("The currency must be a valid Currency object")
+
+    return Currency.from_dict(currency)
+
+
+def _to_decimal_rate(exchange_rate: str | float) -> Decimal:
+    # Validate and convert the exchange rate
+    try:
+        decimal_rate = Decimal(str(exchange_rate))
+    except (ValueError, InvalidOperation):
+        raise ValueError("Exchange rate must be a valid number")
+
+    # Ensure the exchange rate is positive
+    if not decimal_rate.is_finite() or decimal_rate <= Decimal("0"):
+        raise ValueError("Exchange rate must be a positive non-zero value")
+
+    return decimal_rate
+
+
+def _minor_units_factor(
+    exchange_rate: Decimal, source_exponent: int, target_exponent: int
+) -> Decimal:
+    """
+    Return the exchange rate from source to target minor units, shifting the exponent
+    of the rate without rounding it.
+    """
+    sign, digits, exponent = exchange_rate.as_tuple()
+    return Decimal((sign, digits, int(exponent) + target_exponent - source_exponent))
+
+
+def convert(
+    dinero_obj: Dinero, exchange_rate: str | float, currency: Currency | CurrencyDict
+) -> Dinero:
     """
     Converts a Dinero object to a different currency using the specified exchange rate.
 
@@ -66,25 +108,63 @@ def convert(dinero_obj: Dinero, exchange_rate: str | float, currency: Currency)
     if not isinstance(dinero_obj, Dinero):
         raise TypeError("The first argument must be a Dinero object")
 
-    # Validate the currency is a Currency dict
-    if not isinstance(currency, dict) or not all(
-        key in currency for key in ["code", "base", "exponent"]
-    ):
-        raise TypeError("The currency must be a valid Currency object")
+    target_currency = _validate_currency(currency)
+    decimal_rate = _to_decimal_rate(exchange_rate)
 
-    # Validate and convert the exchange rate
-    try:
-        decimal_rate = Decimal(str(exchange_rate))
-    except (ValueError, InvalidOperation):
-        raise ValueError("Exchange rate must be a valid number")
+    # Multiply the minor units by the exact rate between both minor units, rounding
+    # the result half to even once
+    factor = _minor_units_factor(
+        decimal_rate, dinero_obj.exponent, target_currency.exponent
+    )
+    units = multiply_minor_units(dinero_obj.minor_units, *to_ratio(factor))
+    return Dinero._from_minor_units(units, target_currency)
 
-    # Ensure the exchange rate is positive
-    if decimal_rate <= Decimal("0"):
-        raise ValueError("Exchange rate must be a positive non-zero value")
 
-    # Perform the conversion calculation
-    source_amount = dinero_obj._normalize()
-    target_amount = source_amount * decimal_rate
+def convert_many(
+    amounts: Amounts,
+    exchange_rate: str | float | Iterable[str | float],
+    currency: Currency | CurrencyDict,
+) -> DineroArray | list[Dinero]:
+    """
+    Converts many Dinero objects to a different currency at once, with the same
+    results as `convert`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The amounts to convert, all in the
+            same currency.
+        exchange_rate (str | float | Iterable): The exchange rate to use for
+            conversion, or one rate per amount.
+        currency (Currency): The target currency to convert to.
 
-    # Create a new Dinero object in the target currency
-    return Dinero(target_amount, currency)
+    Returns:
+        DineroArray | list[Dinero]: The amounts in the target currency, as a
+            DineroArray when the amounts are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object.
+        TypeError: If currency is not a Currency obj.
+        DifferentCurrencyError: If the amounts have different currencies.
+        ValueError: If an exchange_rate is negative, zero, or cannot be converted to
+            a number, or the number of rates and amounts differ.
+
+    Examples:
+        >>> usd_amounts = DineroArray(["100", "20"], USD)
+        >>> convert_many(usd_amounts, "0.85", EUR)
+        DineroArray(['85.00', '17.00'], currency='EUR')
+    """
+    if not isinstance(amounts, DineroArray):
+        amounts = list(amounts)
+
+    array = batch.to_array(amounts)
+    target_currency = _validate_currency(currency)
+    rates = batch.convert_rates(
+        exchange_rate, len(array), _to_decimal_rate  # type: ignore[arg-type]
+    )
+
+    def factor(rate: Decimal) -> Decimal:
+        return _minor_units_factor(rate, array.exponent, target_currency.exponent)
+
+    # The minor units are reinterpreted in the target currency and multiplied by
+    # the rate between both minor units
+    source = DineroArray._from_array(array._units, target_currency)
+    return batch.to_result(source * batch.factors(rates, factor), amounts)
@@ -27,10 +27,29 @@ All monetary values are handled as Dinero instances to maintain precision
 and proper decimal handling as per currency specifications.
 """
 
-from dinero import Dinero
+from typing import Iterable
 
+from dinero import Dinero, DineroArray
+
+from . import _batch as batch
+from ._batch import Amounts
 from ._validators import ToolValidators
 
+validate = ToolValidators()
+
+
+def _simple_interest_factor(interest_rate: int | float) -> float:
+    return interest_rate / 100
+
+
+def _compound_interest_factor(
+    interest_rate: int | float, duration: int, compound_frequency: int
+) -> float:
+    n = compound_frequency
+    r = interest_rate / 100
+    t = duration
+    return (1 + r / n) ** (n * t)
+
 
 def calculate_simple_interest(
     principal: Dinero, interest_rate: int | float, duration: int
@@ -60,11 +79,10 @@ def calculate_simple_interest(
         >>> calculate_simple_interest(principal, interest_rate, duration)
         Dinero(100)
     """
-    validate = ToolValidators()
     validate.simple_interest_inputs(principal, interest_rate, duration)
 
     # Calculate the total interest using the formula: I = P * r * t
-    return principal * (interest_rate / 100) * duration
+    return principal * _simple_interest_factor(interest_rate) * duration
 
 
 def calculate_compound_interest(
@@ -95,7 +113,6 @@ def calculate_compound_interest(
         >>> calculate_compound_interest(principal, interest_rate, duration, compound_frequency)  # noqa
         Dinero(648.34)
     """
-    validate = ToolValidators()
     validate.compound_interest_inputs(
         principal, interest_rate, duration, compound_frequency
     )
@@ -103,9 +120,98 @@ def calculate_compound_interest(
     # Calculate using compound interest formula:
     # Total amount (A) = P * (1 + r/n)^(n*t)
     # Interest = A - P
-    n = compound_frequency
-    r = interest_rate / 100
-    t = duration
-
-    total_amount = principal * ((1 + r / n) ** (n * t))
+    factor = _compound_interest_factor(interest_rate, duration, compound_frequency)
+    total_amount = principal * factor
     return total_amount - principal
+
+
+def calculate_simple_interest_many(
+    principals: Amounts,
+    interest_rate: int | float | Iterable[int | float],
+    duration: int,
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the simple interest on many loans at once, with the same results as
+    `calculate_simple_interest`.
+
+    Args:
+        principals (DineroArray | Iterable[Dinero]): The principal amounts of the
+            loans, all in the same currency.
+        interest_rate (int | float | Iterable): The annual interest rate, or one
+            rate per principal.
+        duration (int): The duration of the loans in years.
+
+    Raises:
+        InvalidOperationError: If a principal amount is not a Dinero object.
+        DifferentCurrencyError: If the principals have different currencies.
+        TypeError: If an interest rate is not a number or the duration is not an
+            integer.
+        ValueError: If an interest rate or the duration is negative, or the number
+            of rates and principals differ.
+
+    Returns:
+        DineroArray | list[Dinero]: The total interest on each loan, as a
+            DineroArray when the principals are a DineroArray and as a list
+            otherwise.
+
+    Examples:
+        >>> principals = DineroArray(["1000", "500"], USD)
+        >>> calculate_simple_interest_many(principals, 5, 2)
+        DineroArray(['100.00', '50.00'], currency='USD')
+    """
+    array = batch.to_array(principals)
+
+    # Every rate is checked with the duration, in the order of the single loan tool
+    def validator(rate: int | float) -> None:
+        validate.simple_interest_terms(rate, duration)
+
+    rates = batch.to_rates(interest_rate, len(array), validator)
+
+    # Calculate the total interest using the formula: I = P * r * t
+    interests = array * batch.factors(rates, _simple_interest_factor) * duration
+    return batch.to_result(interests, principals)
+
+
+def calculate_compound_interest_many(
+    principals: Amounts,
+    interest_rate: float | Iterable[float],
+    duration: int,
+    compound_frequency: int,
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the compound interest on many loans at once, with the same results
+    as `calculate_compound_interest`.
+
+    Args:
+        principals (DineroArray | Iterable[Dinero]): The principal amounts of the
+            loans, all in the same currency.
+        interest_rate (float | Iterable): The annual interest rate, or one rate per
+            principal.
+        duration (int): The duration of the loans in years.
+        compound_frequency (int): The number of times interest is compounded per year.
+
+    Returns:
+        DineroArray | list[Dinero]: The total interest on each loan, as a
+            DineroArray when the principals are a DineroArray and as a list
+            otherwise.
+
+    Raises:
+        InvalidOperationError: If a principal is not a Dinero object.
+        DifferentCurrencyError: If the principals have different currencies.
+        ValueError: If an interest rate, the duration or the frequency are not
+            positive, or the number of rates and principals differ.
+
+    Examples:
+        >>> principals = DineroArray(["1000", "2000"], USD)
+        >>> calculate_compound_interest_many(principals, 5.0, 10, 12)
+        DineroArray(['647.01', '1294.02'], currency='USD')
+    """
+    array = batch.to_array(principals)
+    rates = batch.to_rates(interest_rate, len(array), validate.compound_interest_rate)
+    validate.compound_interest_period(duration, compound_frequency)
+
+    def factor(rate: float) -> float:
+        return _compound_interest_factor(rate, duration, compound_frequency)
+
+    total_amounts = array * batch.factors(rates, factor)
+    return batch.to_result(total_amounts - array, principals)
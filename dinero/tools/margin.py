@@ -21,10 +21,24 @@ Common uses:
 - Financial planning
 """
 
-from dinero import Dinero
+from typing import Iterable
 
+from dinero import Dinero, DineroArray
+
+from . import _batch as batch
+from ._batch import Amounts
 from ._validators import ToolValidators
 
+validate = ToolValidators()
+
+
+def _cost_multiplier(margin_rate: int | float) -> float:
+    return 1 - (margin_rate / 100)
+
+
+def _selling_price_multiplier(margin_rate: int | float) -> float:
+    return 1 / (1 - (margin_rate / 100))
+
 
 def calculate_cost_amount(amount: Dinero, margin_rate: int | float) -> Dinero:
     """
@@ -48,10 +62,8 @@ def calculate_cost_amount(amount: Dinero, margin_rate: int | float) -> Dinero:
         >>> cost_amount.format(symbol=True, currency=True)
         '$80.00 USD'
     """
-    validate = ToolValidators()
     validate.margin_inputs(amount, margin_rate)
-    cost_multiplier = 1 - (margin_rate / 100)
-    return amount * cost_multiplier
+    return amount * _cost_multiplier(margin_rate)
 
 
 def calculate_margin_portion(amount: Dinero, margin_rate: int | float) -> Dinero:
@@ -76,7 +88,6 @@ def calculate_margin_portion(amount: Dinero, margin_rate: int | float) -> Dinero
         >>> margin.format(symbol=True, currency=True)
         '$20.00 USD'
     """
-    validate = ToolValidators()
     validate.margin_inputs(amount, margin_rate)
     cost_amount = calculate_cost_amount(amount, margin_rate)
     return amount - cost_amount
@@ -104,7 +115,110 @@ def calculate_selling_price(amount: Dinero, margin_rate: int | float) -> Dinero:
         >>> selling_price.format(symbol=True, currency=True)
         '$100.00 USD'
     """
-    validate = ToolValidators()
     validate.margin_inputs(amount, margin_rate)
-    selling_price_multiplier = 1 / (1 - (margin_rate / 100))
-    return amount * selling_price_multiplier
+    return amount * _selling_price_multiplier(margin_rate)
+
+
+def calculate_cost_amount_many(
+    amounts: Amounts, margin_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the cost amounts of many selling prices at once, with the same
+    results as `calculate_cost_amount`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The selling prices (including margin),
+            all in the same currency.
+        margin_rate (int | float | Iterable): The margin rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The cost amounts, as a DineroArray when the amounts
+            are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a margin_rate is not a number
+        ValueError: If a margin_rate is negative or >= 100, or the number of rates
+            and amounts differ
+
+    Examples:
+        >>> selling_prices = DineroArray(["100", "50"], USD)
+        >>> calculate_cost_amount_many(selling_prices, 20)
+        DineroArray(['80.00', '40.00'], currency='USD')
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(margin_rate, len(array), validate.margin_rate)
+    cost_amounts = array * batch.factors(rates, _cost_multiplier)
+    return batch.to_result(cost_amounts, amounts)
+
+
+def calculate_margin_portion_many(
+    amounts: Amounts, margin_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the margin portions of many selling prices at once, with the same
+    results as `calculate_margin_portion`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The selling prices (including margin),
+            all in the same currency.
+        margin_rate (int | float | Iterable): The margin rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The margin portions, as a DineroArray when the
+            amounts are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a margin_rate is not a number
+        ValueError: If a margin_rate is negative or >= 100, or the number of rates
+            and amounts differ
+
+    Examples:
+        >>> selling_prices = [Dinero(100, USD), Dinero(50, USD)]
+        >>> [m.format() for m in calculate_margin_portion_many(selling_prices, 20)]
+        ['20.00', '10.00']
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(margin_rate, len(array), validate.margin_rate)
+    cost_amounts = array * batch.factors(rates, _cost_multiplier)
+    return batch.to_result(array - cost_amounts, amounts)
+
+
+def calculate_selling_price_many(
+    amounts: Amounts, margin_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the selling prices of many cost amounts at once, with the same
+    results as `calculate_selling_price`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The cost amounts (before margin),
+            all in the same currency.
+        margin_rate (int | float | Iterable): The margin rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The selling prices, as a DineroArray when the
+            amounts are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a margin_rate is not a number
+        ValueError: If a margin_rate is negative or >= 100, or the number of rates
+            and amounts differ
+
+    Examples:
+        >>> cost_amounts = DineroArray(["80", "40"], USD)
+        >>> calculate_selling_price_many(cost_amounts, [20, 50])
+        DineroArray(['100.00', '80.00'], currency='USD')
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(margin_rate, len(array), validate.margin_rate)
+    selling_prices = array * batch.factors(rates, _selling_price_multiplier)
+    return batch.to_result(selling_prices, amounts)
@@ -22,10 +22,20 @@ Common uses:
 - Service pricing
 """
 
-from dinero import Dinero
+from typing import Iterable
 
+from dinero import Dinero, DineroArray
+
+from . import _batch as batch
+from ._batch import Amounts
 from ._validators import ToolValidators
 
+validate = ToolValidators()
+
+
+def _markup_multiplier(markup_rate: int | float) -> float:
+    return 1 + (markup_rate / 100)
+
 
 def calculate_base_amount(amount: Dinero, markup_rate: int | float) -> Dinero:
     """
@@ -49,10 +59,8 @@ def calculate_base_amount(amount: Dinero, markup_rate: int | float) -> Dinero:
         >>> base_amount.format(symbol=True, currency=True)
         '$100.00 USD'
     """
-    validate = ToolValidators()
     validate.vat_inputs(amount, markup_rate)  # We can reuse VAT validation
-    divisor = 1 + (markup_rate / 100)
-    return amount / divisor
+    return amount / _markup_multiplier(markup_rate)
 
 
 def calculate_markup_portion(amount: Dinero, markup_rate: int | float) -> Dinero:
@@ -77,7 +85,6 @@ def calculate_markup_portion(amount: Dinero, markup_rate: int | float) -> Dinero
         >>> markup.format(symbol=True, currency=True)
         '$15.00 USD'
     """
-    validate = ToolValidators()
     validate.vat_inputs(amount, markup_rate)  # We can reuse VAT validation
     base_amount = calculate_base_amount(amount, markup_rate)
     return amount - base_amount
@@ -105,7 +112,110 @@ def calculate_marked_up_amount(amount: Dinero, markup_rate: int | float) -> Dine
         >>> final_amount.format(symbol=True, currency=True)
         '$115.00 USD'
     """
-    validate = ToolValidators()
     validate.vat_inputs(amount, markup_rate)  # We can reuse VAT validation
-    markup_multiplier = 1 + (markup_rate / 100)
-    return amount * markup_multiplier
+    return amount * _markup_multiplier(markup_rate)
+
+
+def calculate_base_amount_many(
+    amounts: Amounts, markup_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the base amounts (excluding markup) of many final amounts at once,
+    with the same results as `calculate_base_amount`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The final amounts (including markup),
+            all in the same currency.
+        markup_rate (int | float | Iterable): The markup rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The base amounts, as a DineroArray when the amounts
+            are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a markup_rate is not a number
+        ValueError: If a markup_rate is negative, or the number of rates and
+            amounts differ
+
+    Examples:
+        >>> final_amounts = DineroArray(["115", "230"], USD)
+        >>> calculate_base_amount_many(final_amounts, 15)
+        DineroArray(['100.00', '200.00'], currency='USD')
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(markup_rate, len(array), validate.vat_rate)
+    base_amounts = array / batch.factors(rates, _markup_multiplier)
+    return batch.to_result(base_amounts, amounts)
+
+
+def calculate_markup_portion_many(
+    amounts: Amounts, markup_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the markup portions of many final amounts at once, with the same
+    results as `calculate_markup_portion`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The final amounts (including markup),
+            all in the same currency.
+        markup_rate (int | float | Iterable): The markup rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The markup portions, as a DineroArray when the
+            amounts are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a markup_rate is not a number
+        ValueError: If a markup_rate is negative, or the number of rates and
+            amounts differ
+
+    Examples:
+        >>> final_amounts = [Dinero(115, USD), Dinero(230, USD)]
+        >>> [m.format() for m in calculate_markup_portion_many(final_amounts, 15)]
+        ['15.00', '30.00']
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(markup_rate, len(array), validate.vat_rate)
+    base_amounts = array / batch.factors(rates, _markup_multiplier)
+    return batch.to_result(array - base_amounts, amounts)
+
+
+def calculate_marked_up_amount_many(
+    amounts: Amounts, markup_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the final amounts (including markup) of many base amounts at once,
+    with the same results as `calculate_marked_up_amount`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The base amounts (excluding markup),
+            all in the same currency.
+        markup_rate (int | float | Iterable): The markup rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The final amounts, as a DineroArray when the amounts
+            are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a markup_rate is not a number
+        ValueError: If a markup_rate is negative, or the number of rates and
+            amounts differ
+
+    Examples:
+        >>> base_amounts = DineroArray(["100", "200"], USD)
+        >>> calculate_marked_up_amount_many(base_amounts, [15, 10])
+        DineroArray(['115.00', '220.00'], currency='USD')
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(markup_rate, len(array), validate.vat_rate)
+    final_amounts = array * batch.factors(rates, _markup_multiplier)
+    return batch.to_result(final_amounts, amounts)
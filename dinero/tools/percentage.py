@@ -1,7 +1,17 @@
-from dinero import Dinero
+from typing import Iterable
 
+from dinero import Dinero, DineroArray
+
+from . import _batch as batch
+from ._batch import Amounts
 from ._validators import ToolValidators
 
+validate = ToolValidators()
+
+
+def _percentage_factor(percentage: int | float) -> float:
+    return percentage / 100
+
 
 def calculate_percentage(amount: Dinero, percentage: int | float) -> Dinero:
     """
@@ -25,6 +35,40 @@ def calculate_percentage(amount: Dinero, percentage: int | float) -> Dinero:
         >>> percentage_amount.format(symbol=True, currency=True)
         '$450.00 USD'
     """
-    validate = ToolValidators()
     validate.percentage_inputs(amount, percentage)
-    return amount * (percentage / 100)
+    return amount * _percentage_factor(percentage)
+
+
+def calculate_percentage_many(
+    amounts: Amounts, percentage: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the percentage of many Dinero objects at once, with the same results
+    as `calculate_percentage`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The amounts to calculate the
+            percentage of, all in the same currency.
+        percentage (int | float | Iterable): The percentage to calculate, or one
+            percentage per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The calculated percentages, as a DineroArray when
+            the amounts are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a percentage is not a number.
+        ValueError: If a percentage is negative, or the number of percentages and
+            amounts differ.
+
+    Examples:
+        >>> amounts = DineroArray(["3000", "100"], USD)
+        >>> calculate_percentage_many(amounts, 15)
+        DineroArray(['450.00', '15.00'], currency='USD')
+    """
+    array = batch.to_array(amounts)
+    percentages = batch.to_rates(percentage, len(array), validate.percentage)
+    results = array * batch.factors(percentages, _percentage_factor)
+    return batch.to_result(results, amounts)
@@ -27,10 +27,20 @@ This module provides tools for all these VAT-related calculations while maintain
 precise decimal arithmetic using the Dinero type system.
 """
 
-from dinero import Dinero
+from typing import Iterable
 
+from dinero import Dinero, DineroArray
+
+from . import _batch as batch
+from ._batch import Amounts
 from ._validators import ToolValidators
 
+validate = ToolValidators()
+
+
+def _vat_multiplier(vat_rate: int | float) -> float:
+    return 1 + (vat_rate / 100)
+
 
 def calculate_net_amount(amount: Dinero, vat_rate: int | float) -> Dinero:
     """
@@ -54,10 +64,8 @@ def calculate_net_amount(amount: Dinero, vat_rate: int | float) -> Dinero:
         >>> net_amount.format(symbol=True, currency=True)
         '$100.00 USD'
     """
-    validate = ToolValidators()
     validate.vat_inputs(amount, vat_rate)
-    divisor = 1 + (vat_rate / 100)
-    return amount / divisor
+    return amount / _vat_multiplier(vat_rate)
 
 
 def calculate_vat_portion(amount: Dinero, vat_rate: int | float) -> Dinero:
@@ -82,7 +90,6 @@ def calculate_vat_portion(amount: Dinero, vat_rate: int | float) -> Dinero:
         >>> vat.format(symbol=True, currency=True)
         '$20.00 USD'
     """
-    validate = ToolValidators()
     validate.vat_inputs(amount, vat_rate)
     net_amount = calculate_net_amount(amount, vat_rate)
     return amount - net_amount
@@ -110,7 +117,110 @@ def calculate_gross_amount(amount: Dinero, vat_rate: int | float) -> Dinero:
         >>> gross_amount.format(symbol=True, currency=True)
         '$120.00 USD'
     """
-    validate = ToolValidators()
     validate.vat_inputs(amount, vat_rate)
-    vat_multiplier = 1 + (vat_rate / 100)
-    return amount * vat_multiplier
+    return amount * _vat_multiplier(vat_rate)
+
+
+def calculate_net_amount_many(
+    amounts: Amounts, vat_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the net amounts (excluding VAT) of many gross amounts at once, with
+    the same results as `calculate_net_amount`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The gross amounts (including VAT),
+            all in the same currency.
+        vat_rate (int | float | Iterable): The VAT rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The net amounts, as a DineroArray when the amounts
+            are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a vat_rate is not a number
+        ValueError: If a vat_rate is negative, or the number of rates and amounts
+            differ
+
+    Examples:
+        >>> gross_amounts = DineroArray(["120", "60"], USD)
+        >>> calculate_net_amount_many(gross_amounts, 20)
+        DineroArray(['100.00', '50.00'], currency='USD')
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(vat_rate, len(array), validate.vat_rate)
+    net_amounts = array / batch.factors(rates, _vat_multiplier)
+    return batch.to_result(net_amounts, amounts)
+
+
+def calculate_vat_portion_many(
+    amounts: Amounts, vat_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the VAT portions of many gross amounts at once, with the same
+    results as `calculate_vat_portion`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The gross amounts (including VAT),
+            all in the same currency.
+        vat_rate (int | float | Iterable): The VAT rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The VAT portions, as a DineroArray when the amounts
+            are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a vat_rate is not a number
+        ValueError: If a vat_rate is negative, or the number of rates and amounts
+            differ
+
+    Examples:
+        >>> gross_amounts = [Dinero(120, USD), Dinero(60, USD)]
+        >>> [vat.format() for vat in calculate_vat_portion_many(gross_amounts, 20)]
+        ['20.00', '10.00']
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(vat_rate, len(array), validate.vat_rate)
+    net_amounts = array / batch.factors(rates, _vat_multiplier)
+    return batch.to_result(array - net_amounts, amounts)
+
+
+def calculate_gross_amount_many(
+    amounts: Amounts, vat_rate: int | float | Iterable[int | float]
+) -> DineroArray | list[Dinero]:
+    """
+    Calculates the gross amounts (including VAT) of many net amounts at once, with
+    the same results as `calculate_gross_amount`.
+
+    Args:
+        amounts (DineroArray | Iterable[Dinero]): The net amounts (excluding VAT),
+            all in the same currency.
+        vat_rate (int | float | Iterable): The VAT rate as a percentage, or one
+            rate per amount.
+
+    Returns:
+        DineroArray | list[Dinero]: The gross amounts, as a DineroArray when the amounts
+            are a DineroArray and as a list otherwise.
+
+    Raises:
+        InvalidOperationError: If an amount is not a Dinero object
+        DifferentCurrencyError: If the amounts have different currencies
+        TypeError: If a vat_rate is not a number
+        ValueError: If a vat_rate is negative, or the number of rates and amounts
+            differ
+
+    Examples:
+        >>> net_amounts = DineroArray(["100", "50"], USD)
+        >>> calculate_gross_amount_many(net_amounts, [20, 10])
+        DineroArray(['120.00', '55.00'], currency='USD')
+    """
+    array = batch.to_array(amounts)
+    rates = batch.to_rates(vat_rate, len(array), validate.vat_rate)
+    gross_amounts = array * batch.factors(rates, _vat_multiplier)
+    return batch.to_result(gross_amounts, amounts)
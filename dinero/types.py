@@ -1,18 +1,195 @@
-from decimal import Decimal
-from typing import TypedDict
+import json
+from decimal import Context, Decimal
+from typing import Any, ClassVar, Mapping, TypedDict
 
-from typing_extensions import NotRequired
+from typing_extensions import NotRequired, Self
+
+from ._utils import MAX_DIGITS, currency_context
 
 OperationType = str | int | float | Decimal
 
+# Currencies interned at most, so currencies read from untrusted input can't grow
+# the table without bound. Currencies created once it's full are not interned.
+MAX_INTERNED = 10_000
+
 
-class Currency(TypedDict):
+class CurrencyDict(TypedDict):
     code: str
     base: int
     exponent: int
     symbol: NotRequired[str]
 
 
+class Currency(dict):
+    """
+    An immutable currency, usable anywhere a currency dictionary is expected.
+
+    Currencies are interned: creating a currency with the same code, base, exponent
+    and symbol returns the same object, so two amounts share a currency when their
+    currencies are identical. Currencies that only differ in their symbol share
+    the same `unit`, their code, base and exponent, and their amounts can be
+    combined. The values needed by every operation (quantizer,
+    format specification, default symbol, Decimal context and serialized forms) are
+    computed once.
+
+    Examples:
+        >>> BTC = Currency("BTC", 10, 8, "₿")
+        >>> BTC["exponent"], BTC.exponent
+        (8, 8)
+
+        >>> Currency("BTC", 10, 8, "₿") is BTC
+        True
+
+    Args:
+        code (str): The currency code.
+        base (int): The currency base, or radix.
+        exponent (int): The number of decimal places of the minor unit.
+        symbol (str, optional): The currency symbol. Defaults to "$".
+
+    Raises:
+        TypeError: The code or symbol is not a string, or the base or exponent is
+            not an integer.
+        ValueError: The base is less than 2, or the exponent is negative or greater
+            than 28.
+    """
+
+    __slots__ = (
+        "code",
+        "base",
+        "exponent",
+        "symbol",
+        "unit",
+        "quantizer",
+        "format_spec",
+        "context",
+        "serialized",
+        "serialized_json",
+    )
+
+    code: str
+    base: int
+    exponent: int
+    symbol: str
+    unit: tuple[str, int, int]
+    quantizer: Decimal
+    format_spec: str
+    context: Context
+    serialized: "CurrencyDict"
+    serialized_json: str
+
+    _interned: ClassVar[dict[tuple[str, int, int, str | None], "Currency"]] = {}
+
+    def __new__(
+        cls, code: str, base: int, exponent: int, symbol: str | None = None
+    ) -> Self:
+        key = (code, base, exponent, symbol)
+        currency = cls._interned.get(key)
+
+        if currency is None:
+            _check_fields(code, base, exponent, symbol)
+
+            currency = super().__new__(cls)
+            fields: dict[str, Any] = {"code": code, "base": base, "exponent": exponent}
+            if symbol is not None:
+                fields["symbol"] = symbol
+            dict.update(currency, fields)
+
+            set_field = object.__setattr__
+            set_field(currency, "code", code)
+            set_field(currency, "base", base)
+            set_field(currency, "exponent", exponent)
+            set_field(currency, "symbol", "$" if symbol is None else symbol)
+            set_field(currency, "unit", (code, base, exponent))
+            set_field(currency, "quantizer", Decimal(f"1e-{exponent}"))
+            set_field(currency, "format_spec", f",.{exponent}f")
+            set_field(currency, "context", currency_context(exponent))
+
+            # The currency as written by `to_dict` and `to_json`, never handed out
+            # directly: `to_dict` returns a copy.
+            serialized = dict(fields, symbol=currency.symbol)
+            set_field(currency, "serialized", serialized)
+            set_field(currency, "serialized_json", json.dumps(serialized))
+
+            if len(cls._interned) < MAX_INTERNED:
+                currency = cls._interned.setdefault(key, currency)
+
+        return currency  # type: ignore[return-value]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    @classmethod
+    def from_dict(cls, currency: "Mapping[str, Any]") -> "Currency":
+        """
+        Return the interned currency for a currency dictionary.
+
+        Args:
+            currency (dict): A mapping with code, base, exponent and optional symbol.
+
+        Raises:
+            TypeError: The mapping is not a valid currency.
+
+        Returns:
+            CURRENCY: Currency object.
+        """
+        if type(currency) is cls:
+            return currency  # type: ignore[return-value]
+
+        try:
+            return cls(
+                currency["code"],
+                currency["base"],
+                currency["exponent"],
+                currency.get("symbol"),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            raise TypeError("The currency must be a valid Currency object") from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Currency objects are immutable")
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Currency objects are immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _immutable  # type: ignore[assignment]
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash((self.code, self.base, self.exponent, self.get("symbol")))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (self.code, self.base, self.exponent, self.get("symbol")))
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+
+def _check_fields(code: Any, base: Any, exponent: Any, symbol: Any) -> None:
+    """
+    Check the fields of a new currency.
+
+    Raises:
+        TypeError: The code or symbol is not a string, or the base or exponent is
+            not an integer.
+        ValueError: The base is less than 2, or the exponent is negative or greater
+            than MAX_DIGITS.
+    """
+    if not isinstance(code, str) or not (symbol is None or isinstance(symbol, str)):
+        raise TypeError("The currency code and symbol must be strings")
+
+    if type(base) is not int or type(exponent) is not int:
+        raise TypeError("The currency base and exponent must be integers")
+
+    if base < 2:
+        raise ValueError("The currency base must be at least 2")
+
+    if not 0 <= exponent <= MAX_DIGITS:
+        raise ValueError(f"The currency exponent must be between 0 and {MAX_DIGITS}")
+
+
 class DineroDictionaryOutput(TypedDict):
     amount: str
-    currency: Currency
+    currency: CurrencyDict
@@ -1,8 +1,15 @@
+from decimal import Decimal
+
 import pytest
 
 from dinero import Dinero
 from dinero.currencies import EUR, USD
 from dinero.exceptions import DifferentCurrencyError, InvalidOperationError
+from dinero.types import Currency
+
+
+USD_3 = Currency("USD", 10, 3)
+USD_BASE_2 = Currency("USD", 2, 2)
 
 
 @pytest.mark.parametrize(
@@ -86,6 +93,8 @@ def test_sum_amount_mixed(amount, addend, total):
         (Dinero(24.5, USD), Dinero("1", EUR)),
         (Dinero("24.5", USD), Dinero("1", EUR)),
         (Dinero("24.5", USD), Dinero(1, EUR)),
+        (Dinero("1.00", USD), Dinero("1.000", USD_3)),
+        (Dinero("1.00", USD), Dinero("1.00", USD_BASE_2)),
     ],
 )
 def test_different_currencies_error(amount, addend):
@@ -110,3 +119,22 @@ def test_invalid_operation_error(amount, addend):
 
     with pytest.raises(InvalidOperationError):
         amount.add(addend)
+
+
+def test_add_currencies_with_different_symbols():
+    dollars = {"code": "USD", "base": 10, "exponent": 2, "symbol": "US$"}
+
+    assert Dinero("1.00", USD) + Dinero("1.00", dollars) == Dinero("2.00", USD)
+
+
+@pytest.mark.parametrize(
+    "left, amount, total",
+    [
+        (0, Dinero("24.5", USD), Dinero("24.50", USD)),
+        (1, Dinero("24.5", USD), Dinero("25.50", USD)),
+        ("0.5", Dinero("24.5", USD), Dinero("25.00", USD)),
+        (Decimal("1.5"), Dinero("24.5", USD), Dinero("26.00", USD)),
+    ],
+)
+def test_reflected_add(left, amount, total):
+    assert left + amount == total
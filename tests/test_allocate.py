@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+import pytest
+
+from dinero import Dinero, DineroArray
+from dinero.currencies import JPY, USD
+from dinero.exceptions import InvalidOperationError
+
+
+@pytest.mark.parametrize(
+    "amount, ratios, shares",
+    [
+        (Dinero("100", USD), [1, 1, 1], ["33.34", "33.33", "33.33"]),
+        (Dinero("0.05", USD), [70, 30], ["0.04", "0.01"]),
+        (Dinero("0.05", USD), [30, 70], ["0.02", "0.03"]),
+        (Dinero("0.03", USD), [1, 1, 1, 1], ["0.01", "0.01", "0.01", "0"]),
+        (Dinero("10", USD), [Decimal("0.5"), Decimal("0.25"), 0.25], ["5", "2.5", "2.5"]),
+        (Dinero("1", USD), [0, 1, 0], ["0", "1", "0"]),
+        (Dinero("-100", USD), [1, 1, 1], ["-33.34", "-33.33", "-33.33"]),
+        (Dinero("1000", JPY), [1, 2], ["333", "667"]),
+        (Dinero("0", USD), [1, 2], ["0", "0"]),
+        (Dinero("1", USD), (1,), ["1"]),
+    ],
+)
+def test_allocate(amount, ratios, shares):
+    result = amount.allocate(ratios)
+
+    assert result == [Dinero(share, amount.currency) for share in shares]
+    assert sum(result) == amount
+
+
+@pytest.mark.parametrize("count", [3, 7, 11, 97])
+def test_allocate_never_loses_units(count):
+    amount = Dinero.from_minor_units(10**20 + 1, USD)
+    shares = amount.allocate(list(range(1, count + 1)))
+
+    assert sum(share.minor_units for share in shares) == amount.minor_units
+
+
+@pytest.mark.parametrize(
+    "ratios, error",
+    [
+        ([], ValueError),
+        ([0, 0], ValueError),
+        ([1, -1], ValueError),
+        ([1, "1"], InvalidOperationError),
+        ([1, True], InvalidOperationError),
+        ([Decimal("NaN")], InvalidOperationError),
+        (3, InvalidOperationError),
+    ],
+)
+def test_allocate_invalid_ratios(ratios, error):
+    with pytest.raises(error):
+        Dinero("1", USD).allocate(ratios)
+
+    with pytest.raises(error):
+        DineroArray(["1"], USD).allocate(ratios)
+
+
+def test_array_allocate_matches_dinero():
+    amounts = [Dinero(value, USD) for value in ["100", "0.05", "-0.07", "0", "19.99"]]
+    ratios = [15, 85, Decimal("0.5")]
+
+    shares = DineroArray(amounts).allocate(ratios)
+
+    assert len(shares) == 3
+    assert [list(row) for row in zip(*shares)] == [a.allocate(ratios) for a in amounts]
+
+
+def test_array_allocate_empty():
+    shares = DineroArray([], USD).allocate([1, 2])
+
+    assert [len(share) for share in shares] == [0, 0]
+    assert all(share.currency is USD for share in shares)
@@ -0,0 +1,183 @@
+from decimal import Decimal
+
+import pytest
+
+from dinero import Dinero, DineroArray
+from dinero.currencies import EUR, JPY, USD
+from dinero.exceptions import DifferentCurrencyError, InvalidOperationError
+from dinero.types import Currency
+
+
+def amounts(values, currency=USD):
+    return [Dinero(value, currency) for value in values]
+
+
+def test_array_from_amounts():
+    prices = DineroArray(["2.32", 10, 0.99, Decimal("-1.005"), Dinero("3", USD)], USD)
+
+    assert len(prices) == 5
+    assert list(prices.minor_units) == [232, 1000, 99, -100, 300]
+    assert prices.to_list() == amounts(["2.32", "10", "0.99", "-1.00", "3"])
+    assert list(prices) == prices.to_list()
+
+
+def test_array_round_trip():
+    values = amounts(["2.32", "10", "0.99"])
+    prices = DineroArray(values)
+
+    assert prices.currency is USD
+    assert prices.to_list() == values
+    assert DineroArray.from_minor_units([232, 1000, 99], USD).to_list() == values
+
+
+@pytest.mark.parametrize(
+    "values, currency, error",
+    [
+        (["1", "2"], None, ValueError),
+        ([], None, ValueError),
+        (["1", []], USD, InvalidOperationError),
+        ([Dinero("1", EUR)], USD, DifferentCurrencyError),
+        ([2**63], JPY, OverflowError),
+    ],
+)
+def test_error_array_constructor(values, currency, error):
+    with pytest.raises(error):
+        DineroArray(values, currency)
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (DineroArray(["1", "0.01", "-5"], USD), ["3.32", "10.01", "-4.01"]),
+        (Dinero("1", USD), ["3.32", "11.00", "1.99"]),
+        ("1", ["3.32", "11.00", "1.99"]),
+        (1, ["3.32", "11.00", "1.99"]),
+    ],
+)
+def test_array_add(other, expected):
+    prices = DineroArray(["2.32", "10", "0.99"], USD)
+
+    assert (prices + other).to_list() == amounts(expected)
+    assert prices.add(other).to_list() == amounts(expected)
+
+
+def test_array_subtract():
+    prices = DineroArray(["2.32", "10", "0.99"], USD)
+
+    assert (prices - "1").to_list() == amounts(["1.32", "9", "-0.01"])
+    assert (prices - prices).to_list() == amounts(["0", "0", "0"])
+    assert (-prices).to_list() == amounts(["-2.32", "-10", "-0.99"])
+
+
+@pytest.mark.parametrize(
+    "factor",
+    [3, 2.5, Decimal("0.335"), Decimal("-1.125"), 1 / 3],
+)
+def test_array_multiply_matches_dinero(factor):
+    values = amounts(["2.32", "10", "0.99", "-0.05", "0.01"])
+    prices = DineroArray(values)
+
+    assert (prices * factor).to_list() == [value * factor for value in values]
+    assert prices.multiply(factor).to_list() == [value * factor for value in values]
+
+
+@pytest.mark.parametrize("divisor", [3, 2.5, Decimal("0.7"), Decimal("-8")])
+def test_array_divide_matches_dinero(divisor):
+    values = amounts(["2.32", "10", "0.99", "-0.05", "0.01"])
+    prices = DineroArray(values)
+
+    assert (prices / divisor).to_list() == [value / divisor for value in values]
+    assert prices.divide(divisor).to_list() == [value / divisor for value in values]
+
+
+def test_array_vector_factors():
+    prices = DineroArray(["2.32", "10"], USD)
+
+    assert (prices * [1, Decimal("0.5")]).to_list() == amounts(["2.32", "5"])
+    assert (prices / [2, 4]).to_list() == amounts(["1.16", "2.50"])
+
+    with pytest.raises(ValueError):
+        prices * [1, 2, 3]
+
+    with pytest.raises(InvalidOperationError):
+        prices * ["1", "2"]
+
+    with pytest.raises(ZeroDivisionError):
+        prices / [1, 0]
+
+
+def test_array_comparison_masks():
+    prices = DineroArray(["2.32", "10", "0.99"], USD)
+    limit = Dinero("2.32", USD)
+
+    assert (prices == limit) == [True, False, False]
+    assert (prices != limit) == [False, True, True]
+    assert (prices < limit) == [False, False, True]
+    assert (prices <= limit) == [True, False, True]
+    assert (prices > limit) == [False, True, False]
+    assert (prices >= limit) == [True, True, False]
+    assert prices.gt(prices - "1") == [True, True, True]
+
+    with pytest.raises(InvalidOperationError):
+        prices < 2  # type: ignore
+
+    with pytest.raises(DifferentCurrencyError):
+        prices < Dinero("1", EUR)  # type: ignore
+
+
+def test_array_indexing():
+    prices = DineroArray(["2.32", "10", "0.99"], USD)
+
+    assert prices[0] == Dinero("2.32", USD)
+    assert prices[-1] == Dinero("0.99", USD)
+    assert prices[1:].to_list() == amounts(["10", "0.99"])
+    assert prices[prices > Dinero("1", USD)].to_list() == amounts(["2.32", "10"])
+    assert prices[[False, True, False]].to_list() == amounts(["10"])
+
+
+@pytest.mark.parametrize("index", [[0, 0, 1], [1, 0, 1], (0, 1, 2), "abc"])
+def test_array_indexing_with_non_mask(index):
+    prices = DineroArray(["2.32", "10", "0.99"], USD)
+
+    with pytest.raises(TypeError):
+        prices[index]
+
+
+def test_array_indexing_with_mask_of_other_length():
+    with pytest.raises(ValueError):
+        DineroArray(["2.32", "10", "0.99"], USD)[[True, False]]
+
+
+def test_array_errors():
+    prices = DineroArray(["2.32", "10"], USD)
+
+    with pytest.raises(ValueError):
+        prices + DineroArray(["1"], USD)
+
+    with pytest.raises(DifferentCurrencyError):
+        prices + DineroArray(["1", "2"], EUR)
+
+    with pytest.raises(DifferentCurrencyError):
+        prices + DineroArray(["1", "2"], Currency("USD", 10, 3))
+
+    with pytest.raises(DifferentCurrencyError):
+        prices < Dinero("1", Currency("USD", 10, 3))  # type: ignore
+
+    with pytest.raises(InvalidOperationError):
+        prices + []  # type: ignore
+
+    with pytest.raises(OverflowError):
+        DineroArray.from_minor_units([2**62], USD) * 2
+
+    with pytest.raises(TypeError):
+        hash(prices)
+
+
+def test_array_minor_units_is_read_only():
+    prices = DineroArray(["2.32"], USD)
+
+    with pytest.raises(TypeError):
+        prices.minor_units[0] = 1  # type: ignore
+
+    assert prices._units.readonly
+    assert repr(prices) == "DineroArray(['2.32'], currency='USD')"
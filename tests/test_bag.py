@@ -0,0 +1,182 @@
+import json
+import pickle
+
+import pytest
+
+from dinero import Dinero, DineroArray, MoneyBag
+from dinero.currencies import CLP, EUR, USD
+from dinero.exceptions import (
+    DifferentCurrencyError,
+    InvalidOperationError,
+    UnknownCurrencyError,
+)
+from dinero.types import Currency
+
+USD_3 = Currency("USD", 10, 3)
+
+
+@pytest.fixture
+def bag():
+    return MoneyBag([Dinero("2.32", USD), Dinero("10", EUR), Dinero("0.99", USD)])
+
+
+def test_totals(bag):
+    assert list(bag) == [Dinero("3.31", USD), Dinero("10", EUR)]
+    assert len(bag) == 2
+    assert bag.currencies == [USD, EUR]
+    assert repr(bag) == "MoneyBag(USD=3.31, EUR=10.00)"
+
+
+def test_add_and_sub(bag):
+    bag.add(Dinero("1", USD))
+    bag.add(DineroArray(["100", "200"], CLP))
+    bag.sub(Dinero("20", EUR))
+    bag.sub(DineroArray(["50"], CLP))
+
+    assert list(bag) == [Dinero("4.31", USD), Dinero("-10", EUR), Dinero("250", CLP)]
+
+
+def test_inplace_operators(bag):
+    bag += Dinero("1", USD)
+    bag -= Dinero("1", EUR)
+    bag += MoneyBag([Dinero("5", CLP)])
+
+    assert list(bag) == [Dinero("4.31", USD), Dinero("9", EUR), Dinero("5", CLP)]
+
+
+def test_add_many():
+    bag = MoneyBag()
+    bag.add_many(Dinero(str(value), USD if value % 2 else EUR) for value in range(10))
+
+    assert bag.get(USD) == Dinero("25", USD)
+    assert bag.get(EUR) == Dinero("20", EUR)
+
+
+def test_sum_is_exact():
+    bag = MoneyBag([Dinero.from_minor_units(2**62, USD)] * 8)
+
+    assert bag.get(USD).minor_units == 2**65
+
+
+def test_merge(bag):
+    other = MoneyBag([Dinero("1", EUR), Dinero("5", CLP)])
+    empty = MoneyBag()
+
+    bag.merge(other, empty)
+
+    assert list(bag) == [Dinero("3.31", USD), Dinero("11", EUR), Dinero("5", CLP)]
+    assert list(other) == [Dinero("1", EUR), Dinero("5", CLP)]
+
+
+def test_merge_matches_single_bag():
+    amounts = [Dinero(str(value), (USD, EUR, CLP)[value % 3]) for value in range(90)]
+    bags = [MoneyBag(amounts[start : start + 30]) for start in range(0, 90, 30)]
+
+    merged = MoneyBag()
+    merged.merge(*bags)
+
+    assert merged == MoneyBag(amounts)
+
+
+@pytest.mark.parametrize(
+    "currency, expected",
+    [
+        (USD, Dinero("3.31", USD)),
+        ("USD", Dinero("3.31", USD)),
+        (dict(USD), Dinero("3.31", USD)),
+        (CLP, Dinero("0", CLP)),
+        ("CLP", Dinero("0", CLP)),
+    ],
+)
+def test_get(bag, currency, expected):
+    assert bag.get(currency) == expected
+
+
+def test_get_unknown_code(bag):
+    with pytest.raises(UnknownCurrencyError):
+        bag.get("XXX")
+
+
+def test_contains(bag):
+    assert USD in bag
+    assert "EUR" in bag
+    assert dict(USD) in bag
+    assert CLP not in bag
+    assert 1 not in bag
+
+
+@pytest.mark.parametrize("amount", ["1", 1, None, [Dinero("1", USD)]])
+def test_invalid_amounts(bag, amount):
+    with pytest.raises(InvalidOperationError):
+        bag.add(amount)
+
+    with pytest.raises(InvalidOperationError):
+        bag.sub(amount)
+
+    with pytest.raises(InvalidOperationError):
+        bag.add_many([Dinero("1", USD), amount])
+
+
+def test_merge_invalid(bag):
+    with pytest.raises(InvalidOperationError):
+        bag.merge([Dinero("1", USD)])
+
+
+def test_currencies_with_different_exponents(bag):
+    amount = Dinero("1.000", USD_3)
+
+    with pytest.raises(DifferentCurrencyError):
+        bag.add(amount)
+
+    with pytest.raises(DifferentCurrencyError):
+        bag.add_many([Dinero("1", USD), amount])
+
+    with pytest.raises(DifferentCurrencyError):
+        bag.merge(MoneyBag([amount]))
+
+    with pytest.raises(DifferentCurrencyError):
+        bag.get(USD_3)
+
+    assert bag.get(USD) == Dinero("4.31", USD)
+    assert MoneyBag([Dinero("0.1", USD)]) != MoneyBag([Dinero("0.010", USD_3)])
+
+
+def test_currencies_with_different_symbols(bag):
+    dollars = Currency("USD", 10, 2, "US$")
+    bag.add_many([Dinero("1", dollars)])
+    bag.add(Dinero("1", dollars))
+
+    assert bag.get(dollars) == Dinero("5.31", USD)
+    assert bag.currencies == [USD, EUR]
+
+
+def test_to_dict_and_json(bag):
+    expected = {
+        "USD": {"amount": "3.31", "currency": dict(USD, symbol="$")},
+        "EUR": {"amount": "10.00", "currency": dict(EUR, symbol="€")},
+    }
+
+    assert bag.to_dict() == expected
+    assert json.loads(bag.to_json()) == expected
+    assert MoneyBag([Dinero("1234", USD)]).to_dict(True)["USD"]["amount"] == "1,234.00"
+
+
+def test_equality(bag):
+    assert bag == MoneyBag([Dinero("10", EUR), Dinero("3.31", USD)])
+    assert bag != MoneyBag([Dinero("3.31", USD)])
+    assert bag != {"USD": "3.31"}
+
+
+def test_equality_ignores_zero_totals():
+    bag = MoneyBag([Dinero("1", USD), Dinero("-1", USD), Dinero("2", EUR)])
+
+    assert USD in bag
+    assert bag == MoneyBag([Dinero("2", EUR)])
+    assert MoneyBag([Dinero("2", EUR)]) == bag
+    assert MoneyBag([Dinero("0", USD)]) == MoneyBag()
+    assert MoneyBag([Dinero("0", USD)]) == MoneyBag([Dinero("0", USD_3)])
+    assert bag != MoneyBag([Dinero("2", EUR), Dinero("1", USD)])
+
+
+def test_pickle(bag):
+    assert pickle.loads(pickle.dumps(bag)) == bag
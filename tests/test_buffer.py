@@ -0,0 +1,130 @@
+import pickle
+import sys
+from array import array
+
+import pytest
+
+from dinero import Dinero, DineroArray
+from dinero.currencies import EUR, USD
+
+
+@pytest.mark.parametrize(
+    "buffer",
+    [
+        array("q", [232, -1000, 0]),
+        array("q", [232, -1000, 0]).tobytes(),
+        bytearray(array("q", [232, -1000, 0]).tobytes()),
+        memoryview(array("q", [232, -1000, 0])),
+    ],
+)
+def test_from_buffer(buffer):
+    prices = DineroArray.from_buffer(buffer, USD)
+
+    assert prices.currency is USD
+    assert list(prices.minor_units) == [232, -1000, 0]
+    assert prices.to_list() == [Dinero("2.32", USD), Dinero("-10", USD), Dinero(0, USD)]
+
+
+def test_from_buffer_shares_memory():
+    units = array("q", [232, 1000])
+    prices = DineroArray.from_buffer(units, USD)
+
+    units[0] = 100
+
+    assert prices[0] == Dinero("1", USD)
+    assert prices.minor_units.readonly
+    with pytest.raises(TypeError):
+        prices.minor_units[0] = 1  # type: ignore
+
+
+def test_from_buffer_empty():
+    prices = DineroArray.from_buffer(b"", USD)
+
+    assert len(prices) == 0
+    assert prices.currency is USD
+
+
+@pytest.mark.parametrize(
+    "buffer, error",
+    [
+        (array("d", [2.32]), TypeError),
+        (array("i", [232]), TypeError),
+        (array("Q", [232]), TypeError),
+        (b"\x00" * 7, ValueError),
+        (memoryview(b"\x00" * 16).cast("q", (1, 2)), ValueError),
+        ("2.32", TypeError),
+    ],
+)
+def test_from_buffer_invalid(buffer, error):
+    with pytest.raises(error):
+        DineroArray.from_buffer(buffer, USD)
+
+
+def test_from_buffer_other_byte_order():
+    np = pytest.importorskip("numpy")
+    order = ">" if sys.byteorder == "little" else "<"
+    units = np.array([232], dtype=f"{order}i8")
+
+    with pytest.raises(ValueError):
+        DineroArray.from_buffer(units, USD)
+
+
+def test_slices_are_views():
+    units = array("q", range(10))
+    prices = DineroArray.from_buffer(units, USD)
+    head, odd = prices[:5], prices[1::2]
+
+    units[1] = 100
+
+    assert head[1].minor_units == 100
+    assert odd[0].minor_units == 100
+    assert list(odd.minor_units) == [100, 3, 5, 7, 9]
+    expected = DineroArray.from_minor_units([100, 3, 5, 7, 9], USD)
+    assert odd.to_bytes() == expected.to_bytes()
+
+
+def test_strided_slice_arithmetic():
+    prices = DineroArray.from_minor_units(range(200), USD)
+    odd = prices[1::2]
+
+    assert list((odd + odd).minor_units) == [2 * value for value in range(1, 200, 2)]
+    assert list((odd * 2).minor_units) == [2 * value for value in range(1, 200, 2)]
+    assert odd.sum() == Dinero.from_minor_units(sum(range(1, 200, 2)), USD)
+    assert list(DineroArray.from_buffer(odd.minor_units, USD).minor_units) == list(
+        range(1, 200, 2)
+    )
+
+
+def test_numpy_buffers():
+    np = pytest.importorskip("numpy")
+    units = np.array([232, 1000, -5], dtype=np.int64)
+    prices = DineroArray.from_buffer(units, EUR)
+
+    units[2] = 7
+    vector = prices.to_numpy()
+
+    assert prices[2] == Dinero.from_minor_units(7, EUR)
+    assert np.shares_memory(vector, units)
+    assert list(DineroArray.from_buffer(units[::2], EUR).minor_units) == [232, 7]
+
+    with pytest.raises(TypeError):
+        DineroArray.from_buffer(units.astype(np.float64), EUR)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="PEP 688 buffer protocol")
+def test_buffer_protocol():
+    prices = DineroArray(["2.32", "10"], USD)
+    view = memoryview(prices)  # type: ignore[arg-type]
+
+    assert view.readonly
+    assert view.format == "q"
+    assert list(view) == [232, 1000]
+
+
+def test_pickle():
+    prices = DineroArray(["2.32", "10", "-0.01"], USD)
+    result = pickle.loads(pickle.dumps(prices))
+
+    assert result.currency == USD
+    assert list(result.minor_units) == [232, 1000, -1]
+    assert list(pickle.loads(pickle.dumps(prices[::2])).minor_units) == [232, -1]
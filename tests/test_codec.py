@@ -0,0 +1,116 @@
+import pytest
+
+from dinero import Dinero, DineroArray
+from dinero.currencies import CLP, EUR, USD, get_numeric_code, register_currency
+from dinero.exceptions import UnknownCurrencyError
+from dinero.types import Currency
+
+INT64_MAX = 2**63 - 1
+INT64_MIN = -(2**63)
+
+
+@pytest.mark.parametrize(
+    "units", [0, 1, -1, 63, 64, -64, -65, 232, INT64_MAX, INT64_MIN, 10**40, -(10**40)]
+)
+@pytest.mark.parametrize("currency", [USD, EUR, CLP])
+def test_round_trip(units, currency):
+    amount = Dinero.from_minor_units(units, currency)
+    result = Dinero.from_bytes(amount.to_bytes())
+
+    assert result == amount
+    assert result.currency is currency
+
+
+@pytest.mark.parametrize(
+    "amount, encoded",
+    [
+        (Dinero("2.32", USD), b"H\x03\xd0\x03"),
+        (Dinero("0", USD), b"H\x03\x00"),
+        (Dinero("-0.01", USD), b"H\x03\x01"),
+        (Dinero("0.63", USD), b"H\x03\x7e"),
+        (Dinero("0.64", USD), b"H\x03\x80\x01"),
+    ],
+)
+def test_encoding(amount, encoded):
+    assert amount.to_bytes() == encoded
+
+
+def test_from_bytes_accepts_buffers():
+    encoded = Dinero("2.32", USD).to_bytes()
+
+    assert Dinero.from_bytes(bytearray(encoded)) == Dinero("2.32", USD)
+    assert Dinero.from_bytes(memoryview(b"xx" + encoded)[2:]) == Dinero("2.32", USD)
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"H", b"H\x03", b"H\x03\x80", b"H\x03\x01\x01"]
+)
+def test_from_bytes_invalid(data):
+    with pytest.raises(ValueError):
+        Dinero.from_bytes(data)
+
+
+def test_unknown_numeric_code():
+    with pytest.raises(UnknownCurrencyError):
+        Dinero.from_bytes(b"\x01\x00\x00")
+
+
+def test_currencies_without_numeric_code():
+    with pytest.raises(UnknownCurrencyError):
+        Dinero("1", Currency("ZZB", 10, 2)).to_bytes()
+
+    with pytest.raises(ValueError):
+        Dinero("1", Currency("USD", 10, 3)).to_bytes()
+
+
+def test_registered_custom_currency():
+    currency = register_currency(Currency("ZZC", 10, 8, "Z"), numeric=65001)
+    amount = Dinero.from_minor_units(123456789, currency)
+
+    assert get_numeric_code("ZZC") == 65001
+    assert Dinero.from_bytes(amount.to_bytes()).currency is currency
+    assert DineroArray.from_bytes(DineroArray([amount]).to_bytes()).currency is currency
+
+
+def test_same_code_currency_decodes_to_the_registered_currency():
+    amount = Dinero("1", Currency("USD", 10, 2, "US$"))
+
+    assert Dinero.from_bytes(amount.to_bytes()).currency is USD
+
+
+@pytest.mark.parametrize(
+    "units", [[], [232, 1000], [INT64_MAX, INT64_MIN, 0] * 20, list(range(-500, 500))]
+)
+def test_array_round_trip(units):
+    array = DineroArray.from_minor_units(units, EUR)
+    encoded = array.to_bytes()
+    result = DineroArray.from_bytes(encoded)
+
+    assert len(encoded) == 8 + 8 * len(units)
+    assert list(result.minor_units) == units
+    assert result.currency is EUR
+    assert list(DineroArray.from_bytes(memoryview(encoded)).minor_units) == units
+
+
+def test_array_encoding():
+    encoded = DineroArray.from_minor_units([1, -1], USD).to_bytes()
+
+    assert encoded[:8] == b"DNA\x01H\x03\x00\x00"
+    assert encoded[8:16] == (1).to_bytes(8, "little")
+    assert encoded[16:] == (-1).to_bytes(8, "little", signed=True)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"DNA\x01H\x03\x00",
+        b"DNA\x01H\x03\x00\x00\x01",
+        b"DNB\x01H\x03\x00\x00",
+        b"DNA\x02H\x03\x00\x00",
+        Dinero("1", USD).to_bytes(),
+    ],
+)
+def test_array_from_bytes_invalid(data):
+    with pytest.raises(ValueError):
+        DineroArray.from_bytes(data)
@@ -0,0 +1,226 @@
+import copy
+import json
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from dinero import Dinero, types
+from dinero.currencies import (
+    EUR,
+    JPY,
+    USD,
+    get_currency,
+    get_currency_by_numeric,
+    get_numeric_code,
+    register_currency,
+    resolve_currency,
+)
+from dinero.exceptions import DifferentCurrencyError, UnknownCurrencyError
+from dinero.types import Currency
+
+
+def test_currency_is_interned():
+    assert Currency("USD", 10, 2) is USD
+    assert Currency.from_dict({"code": "USD", "base": 10, "exponent": 2}) is USD
+    assert Currency.from_dict(USD) is USD
+    assert Currency("USD", 10, 2, "US$") is not USD
+
+
+def test_currency_dict_access():
+    assert JPY["code"] == "JPY"
+    assert JPY.get("symbol") == "¥"
+    assert USD.get("symbol") is None
+    assert USD == {"code": "USD", "base": 10, "exponent": 2}
+    assert isinstance(USD, dict)
+    assert json.dumps(USD) == '{"code": "USD", "base": 10, "exponent": 2}'
+
+
+@pytest.mark.parametrize(
+    "currency, symbol, quantizer, format_spec",
+    [
+        (USD, "$", Decimal("0.01"), ",.2f"),
+        (EUR, "€", Decimal("0.01"), ",.2f"),
+        (JPY, "¥", Decimal("1"), ",.0f"),
+    ],
+)
+def test_currency_precomputed_fields(currency, symbol, quantizer, format_spec):
+    assert currency.symbol == symbol
+    assert currency.quantizer == quantizer
+    assert currency.format_spec == format_spec
+    assert currency.context.prec >= 28
+
+
+def test_currency_is_immutable():
+    with pytest.raises(TypeError):
+        USD["exponent"] = 3  # type: ignore
+
+    with pytest.raises(TypeError):
+        USD.setdefault("symbol", "$")  # type: ignore
+
+    with pytest.raises(TypeError):
+        USD.update({"code": "EUR"})  # type: ignore
+
+    with pytest.raises(AttributeError):
+        USD.exponent = 3  # type: ignore
+
+    assert USD == {"code": "USD", "base": 10, "exponent": 2}
+
+
+def test_currency_copy_and_pickle():
+    assert copy.copy(USD) is USD
+    assert copy.deepcopy(USD) is USD
+    assert pickle.loads(pickle.dumps(JPY)) is JPY
+    assert hash(Currency("USD", 10, 2)) == hash(USD)
+
+
+def test_currency_from_plain_dict():
+    amount = Dinero("2.32", {"code": "USD", "base": 10, "exponent": 2})
+
+    assert amount.currency is USD
+    assert amount + Dinero("1", USD) == Dinero("3.32", USD)
+
+
+def test_currency_same_code_is_compatible():
+    custom = {"code": "USD", "base": 10, "exponent": 2, "symbol": "US$"}
+    assert Dinero("1", custom) + Dinero("1", USD) == Dinero("2", USD)
+
+    with pytest.raises(DifferentCurrencyError):
+        Dinero("1", USD) + Dinero("1", EUR)
+
+
+@pytest.mark.parametrize("currency", [{}, {"code": "USD"}, "USD", None])
+def test_error_invalid_currency(currency):
+    with pytest.raises(TypeError):
+        Dinero("1", currency)
+
+
+@pytest.mark.parametrize(
+    "code, base, exponent, symbol, error",
+    [
+        (840, 10, 2, None, TypeError),
+        ("XTS", 10, 2, 36, TypeError),
+        ("XTS", "10", 2, None, TypeError),
+        ("XTS", 10, 2.5, None, TypeError),
+        ("XTS", 10, True, None, TypeError),
+        ("XTS", 1, 2, None, ValueError),
+        ("XTS", 10, -2, None, ValueError),
+        ("XTS", 10, 29, None, ValueError),
+    ],
+)
+def test_error_invalid_currency_fields(code, base, exponent, symbol, error):
+    with pytest.raises(error):
+        Currency(code, base, exponent, symbol)
+
+    fields = {"code": code, "base": base, "exponent": exponent, "symbol": symbol}
+    with pytest.raises(TypeError):
+        Currency.from_dict(fields)
+
+    with pytest.raises(TypeError):
+        Dinero.from_dict({"amount": "1", "currency": fields})
+
+
+def test_currency_intern_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(types, "MAX_INTERNED", len(Currency._interned))
+
+    currency = Currency("XTB", 10, 2)
+
+    assert Currency("XTB", 10, 2) is not currency
+    assert Currency("XTB", 10, 2) == currency
+    assert Currency("USD", 10, 2) is USD
+    assert register_currency(currency) is register_currency(Currency("XTB", 10, 2))
+
+
+def test_currencies_are_loaded_lazily():
+    import dinero.currencies as currencies
+
+    assert "KWD" in currencies.__all__
+    assert "KWD" in dir(currencies)
+    assert currencies.KWD is Currency("KWD", 10, 3)
+    assert currencies.KWD is currencies.KWD
+
+    with pytest.raises(AttributeError):
+        currencies.XXX  # type: ignore
+
+    namespace = {}  # type: ignore
+    exec("from dinero.currencies import *", namespace)
+    assert namespace["JPY"] is JPY
+
+
+@pytest.mark.parametrize(
+    "code, numeric, currency",
+    [
+        ("USD", 840, USD),
+        ("EUR", "978", EUR),
+        ("JPY", "392", JPY),
+    ],
+)
+def test_currency_lookup(code, numeric, currency):
+    assert get_currency(code) is currency
+    assert get_currency_by_numeric(numeric) is currency
+
+
+@pytest.mark.parametrize("code", ["XXX", "usd", ""])
+def test_error_unknown_currency(code):
+    with pytest.raises(UnknownCurrencyError):
+        get_currency(code)
+
+
+@pytest.mark.parametrize("numeric", [0, "abc", 99999])
+def test_error_unknown_numeric_currency(numeric):
+    with pytest.raises(UnknownCurrencyError):
+        get_currency_by_numeric(numeric)
+
+
+def test_register_currency():
+    xts = register_currency({"code": "XTS", "base": 10, "exponent": 4}, numeric=963)
+
+    assert isinstance(xts, Currency)
+    assert get_currency("XTS") is xts
+    assert get_currency_by_numeric(963) is xts
+    assert register_currency(Currency("XTS", 10, 4)) is xts
+
+    with pytest.raises(ValueError):
+        register_currency(Currency("XTS", 10, 2))
+
+    with pytest.raises(ValueError):
+        register_currency(Currency("XTT", 10, 2), numeric=840)
+
+    with pytest.raises(ValueError):
+        register_currency(Currency("XTT", 10, 2), numeric=65536)
+
+    with pytest.raises(ValueError):
+        register_currency(Currency("XTT", 10, 2), numeric=-1)
+
+    with pytest.raises(ValueError):
+        register_currency(Currency("USD", 10, 2, "US$"))
+
+
+@pytest.mark.parametrize(
+    "currency, expected",
+    [
+        ({"code": "USD", "base": 10, "exponent": 2}, USD),
+        ({"code": "USD", "base": 10, "exponent": 2, "symbol": "$"}, USD),
+        ({"code": "EUR", "base": 10, "exponent": 2, "symbol": "€"}, EUR),
+    ],
+)
+def test_resolve_currency(currency, expected):
+    assert resolve_currency(currency) is expected
+
+
+def test_resolve_unregistered_currency():
+    currency = {"code": "USD", "base": 10, "exponent": 2, "symbol": "US$"}
+
+    assert resolve_currency(currency) is Currency("USD", 10, 2, "US$")
+    assert resolve_currency(dict(currency, code="ZZQ")).code == "ZZQ"
+
+    with pytest.raises(TypeError):
+        resolve_currency({"code": "USD"})
+
+
+def test_get_numeric_code():
+    assert get_numeric_code("USD") == 840
+    assert get_numeric_code("CLP") == 152
+
+    with pytest.raises(UnknownCurrencyError):
+        get_numeric_code("XXX")
@@ -1,7 +1,12 @@
+import json
+
 import pytest
 
-from dinero import Dinero
-from dinero.currencies import USD
+import dinero
+from dinero import Dinero, DineroArray
+from dinero.currencies import CLP, EUR, USD
+from dinero.exceptions import InvalidOperationError
+from dinero.types import Currency
 
 
 @pytest.mark.parametrize(
@@ -60,3 +65,180 @@ def test_unformatted_json(amount):
 def test_formatted_json(amount):
     expected_result = '{"amount": "3,333.20", "currency": {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"}}'  # noqa: E501
     assert amount.to_json(amount_with_format=True) == expected_result
+
+
+def test_serialization_has_no_side_effects():
+    amount = Dinero("3333.26", USD)
+    currency = dict(USD)
+
+    result = amount.to_dict()
+    result["currency"]["symbol"] = "US$"
+    result["amount"] = "0"
+    amount.to_json()
+
+    assert dict(USD) == currency
+    assert amount.to_dict()["currency"]["symbol"] == "$"
+    assert amount + amount == Dinero("6666.52", USD)
+
+
+@pytest.mark.parametrize(
+    "units, currency, expected",
+    [
+        (1, Currency("BTC", 10, 8, "₿"), "0.00000001"),
+        (-5, Currency("BTC", 10, 8, "₿"), "-0.00000005"),
+        (-1, USD, "-0.01"),
+        (0, USD, "0.00"),
+        (1500, CLP, "1500"),
+    ],
+)
+def test_amounts_are_never_in_scientific_notation(units, currency, expected):
+    amount = Dinero.from_minor_units(units, currency)
+
+    assert amount.to_dict()["amount"] == expected
+    assert json.loads(amount.to_json())["amount"] == expected
+
+
+@pytest.mark.parametrize("amount_with_format", [False, True])
+def test_to_json_matches_json_dumps(amount_with_format):
+    for amount in [Dinero("-1234.5", EUR), Dinero("7", CLP), Dinero("0.01", USD)]:
+        expected = json.dumps(amount.to_dict(amount_with_format))
+        assert amount.to_json(amount_with_format) == expected
+
+
+@pytest.mark.parametrize("amount_with_format", [False, True])
+def test_bulk_serialization(amount_with_format):
+    amounts = [Dinero("1234.5", USD), Dinero("-7", EUR), Dinero("7", CLP)]
+    expected = [amount.to_dict(amount_with_format) for amount in amounts]
+
+    assert dinero.to_dicts(amounts, amount_with_format) == expected
+    assert dinero.to_dicts(iter(amounts), amount_with_format) == expected
+    assert dinero.dumps_many(amounts, amount_with_format) == json.dumps(expected)
+
+
+@pytest.mark.parametrize("amount_with_format", [False, True])
+def test_bulk_serialization_of_array(amount_with_format):
+    array = DineroArray(["1234.5", "-0.01", "0"], USD)
+    expected = [amount.to_dict(amount_with_format) for amount in array]
+
+    assert dinero.to_dicts(array, amount_with_format) == expected
+    assert dinero.dumps_many(array, amount_with_format) == json.dumps(expected)
+
+
+def test_bulk_serialization_of_nothing():
+    assert dinero.to_dicts([]) == []
+    assert dinero.dumps_many([]) == "[]"
+    assert dinero.dumps_many(DineroArray([], USD)) == "[]"
+
+
+def test_bulk_serialization_results_are_independent():
+    first, second = dinero.to_dicts([Dinero("1", USD), Dinero("2", USD)])
+    first["currency"]["symbol"] = "US$"
+
+    assert second["currency"]["symbol"] == "$"
+    assert USD.serialized["symbol"] == "$"
+
+
+@pytest.mark.parametrize("function", [dinero.to_dicts, dinero.dumps_many])
+def test_bulk_serialization_of_invalid_amounts(function):
+    with pytest.raises(InvalidOperationError):
+        function([Dinero("1", USD), "1"])
+
+
+@pytest.mark.parametrize("amount_with_format", [False, True])
+@pytest.mark.parametrize(
+    "amount",
+    [
+        Dinero("3333.26", USD),
+        Dinero("-1234567.89", EUR),
+        Dinero("0", USD),
+        Dinero("1500", CLP),
+        Dinero.from_minor_units(1, Currency("BTC", 10, 8, "₿")),
+    ],
+)
+def test_round_trip(amount, amount_with_format):
+    assert Dinero.from_dict(amount.to_dict(amount_with_format)) == amount
+    assert Dinero.from_json(amount.to_json(amount_with_format)) == amount
+
+
+@pytest.mark.parametrize("currency", [USD, EUR, CLP])
+def test_round_trip_resolves_the_registered_currency(currency):
+    amount = Dinero("1", currency)
+
+    assert Dinero.from_json(amount.to_json()).currency is currency
+    assert Dinero.from_dict(amount.to_dict()).currency is currency
+
+
+def test_from_dict_with_custom_currency():
+    dollar = Currency("USD", 10, 2, "US$")
+    result = Dinero.from_dict(Dinero("1", dollar).to_dict())
+
+    assert result.currency is dollar
+    assert result.symbol == "US$"
+
+
+@pytest.mark.parametrize(
+    "amount, expected",
+    [
+        ("2.32", "2.32"),
+        ("2.325", "2.32"),
+        ("-0.50", "-0.5"),
+        ("1e3", "1000"),
+        (2, "2"),
+        (2.675, "2.68"),
+    ],
+)
+def test_from_dict_amounts(amount, expected):
+    currency = {"code": "USD", "base": 10, "exponent": 2}
+    result = Dinero.from_dict({"amount": amount, "currency": currency})
+
+    assert result == Dinero(expected, USD)
+
+
+@pytest.mark.parametrize(
+    "data, error",
+    [
+        ({"amount": "1"}, TypeError),
+        ({"currency": USD}, TypeError),
+        ({"amount": "1", "currency": {"code": "USD"}}, TypeError),
+        ({"amount": "1", "currency": "USD"}, TypeError),
+        (["1", USD], TypeError),
+        ({"amount": "abc", "currency": USD}, InvalidOperationError),
+        ({"amount": "1,2", "currency": USD}, InvalidOperationError),
+        ({"amount": "NaN", "currency": USD}, InvalidOperationError),
+        ({"amount": None, "currency": USD}, InvalidOperationError),
+        ({"amount": "1e10000000", "currency": USD}, InvalidOperationError),
+        ({"amount": "1" * 5000, "currency": USD}, InvalidOperationError),
+        ({"amount": "1" + ",000" * 10, "currency": USD}, InvalidOperationError),
+    ],
+)
+def test_from_dict_invalid(data, error):
+    with pytest.raises(error):
+        Dinero.from_dict(data)
+
+    with pytest.raises(error):
+        dinero.from_dicts([{"amount": "1", "currency": USD}, data])
+
+
+def test_from_json_invalid():
+    with pytest.raises(ValueError):
+        Dinero.from_json("{")
+
+
+def test_bulk_deserialization():
+    amounts = [Dinero("1234.5", USD), Dinero("-7", EUR), Dinero("7", CLP)] * 3
+    document = dinero.dumps_many(amounts)
+
+    result = dinero.loads_many(document)
+
+    assert result == amounts
+    assert dinero.loads_many(document.encode()) == amounts
+    assert dinero.from_dicts(dinero.to_dicts(amounts, True)) == amounts
+    assert [amount.currency for amount in result] == [USD, EUR, CLP] * 3
+    assert all(a.currency is b.currency for a, b in zip(result, result[3:]))
+
+
+def test_loads_many_requires_an_array():
+    with pytest.raises(TypeError):
+        dinero.loads_many(Dinero("1", USD).to_json())
+
+    assert dinero.loads_many("[]") == []
@@ -111,3 +111,123 @@ def test_balance_ok(unit_price, units_sold, money_received):
 def test_balance_wrong(unit_price, units_sold, money_received):
     assert unit_price.multiply(units_sold).eq(money_received) is False
     assert unit_price * units_sold != money_received
+
+
+@pytest.mark.parametrize(
+    "amount, currency, minor_units",
+    [
+        ("2.32", USD, 232),
+        (2.32, USD, 232),
+        (2.675, USD, 268),
+        ("2.325", USD, 232),
+        ("-2.325", USD, -232),
+        (Decimal("24.5"), USD, 2450),
+        (24, USD, 2400),
+        ("1e3", USD, 100000),
+    ],
+)
+def test_minor_units(amount, currency, minor_units):
+    assert Dinero(amount, currency)._minor_units == minor_units
+
+
+def test_large_amounts_are_exact():
+    amount = Dinero("123456789012345.67", USD)
+    total = amount + Dinero("0.01", USD)
+
+    assert total.raw_amount == Decimal("123456789012345.68")
+    assert total.format() == "123,456,789,012,345.68"
+
+
+@pytest.mark.parametrize("amount", ["nan", "inf", float("nan"), Decimal("-Infinity")])
+def test_error_non_finite_amount(amount):
+    with pytest.raises(InvalidOperationError):
+        Dinero(amount, USD)
+
+
+@pytest.mark.parametrize(
+    "amount", ["1e10000000", "-1E+28", "1" * 5000, 10**28, -(10**40), 1e300]
+)
+def test_error_too_large_amount(amount):
+    with pytest.raises(InvalidOperationError):
+        Dinero(amount, USD)
+
+
+def test_largest_and_tiny_amounts():
+    assert Dinero("9" * 28 + ".99", USD).minor_units == int("9" * 30)
+    assert Dinero(10**28 - 1, USD).minor_units == (10**28 - 1) * 100
+    assert Dinero("0" * 40 + "2.32", USD) == Dinero("2.32", USD)
+    assert Dinero("1e-10000000", USD).minor_units == 0
+    assert Dinero("-0.005", USD).minor_units == 0
+
+
+def test_slotted_and_immutable():
+    amount = Dinero("2.32", USD)
+
+    assert not hasattr(amount, "__dict__")
+    assert not hasattr(amount, "dinero")
+
+    with pytest.raises(AttributeError):
+        amount.currency = EUR  # type: ignore
+
+    with pytest.raises(AttributeError):
+        amount.amount = Decimal("3")  # type: ignore
+
+
+def test_decimal_values():
+    amount = Dinero("2.30", USD)
+
+    assert str(amount._normalize()) == "2.3"
+    assert str(amount.raw_amount) == "2.30"
+    assert amount.raw_amount is amount.amount
+    assert (amount + Dinero("1", USD)).raw_amount == Decimal("3.30")
+
+
+@pytest.mark.parametrize(
+    "units, currency, formatted",
+    [
+        (23432, USD, "234.32"),
+        (-5, USD, "-0.05"),
+        (0, EUR, "0.00"),
+    ],
+)
+def test_from_minor_units(units, currency, formatted):
+    amount = Dinero.from_minor_units(units, currency)
+
+    assert amount.format() == formatted
+    assert amount.minor_units == units
+    assert amount == Dinero(formatted, currency)
+
+
+@pytest.mark.parametrize(
+    "amount, total",
+    [
+        (Decimal("234.32"), Dinero("234.32", USD)),
+        (Decimal("234.325"), Dinero("234.32", USD)),
+        (Decimal("-1"), Dinero("-1", USD)),
+    ],
+)
+def test_from_decimal(amount, total):
+    assert Dinero.from_decimal(amount, USD) == total
+
+
+@pytest.mark.parametrize(
+    "constructor, amount",
+    [
+        (Dinero.from_minor_units, "232"),
+        (Dinero.from_minor_units, 2.32),
+        (Dinero.from_decimal, "2.32"),
+        (Dinero.from_decimal, Decimal("NaN")),
+    ],
+)
+def test_error_trusted_constructors(constructor, amount):
+    with pytest.raises(InvalidOperationError):
+        constructor(amount, USD)
+
+
+def test_operation_results_keep_subclass():
+    class Price(Dinero):
+        __slots__ = ()
+
+    total = Price("2.32", USD) + Dinero("1", USD)
+    assert type(total) is Price
+    assert type(total * 2) is Price
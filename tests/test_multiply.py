@@ -1,4 +1,4 @@
-from decimal import Decimal
+from decimal import Decimal, getcontext, localcontext
 
 import pytest
 
@@ -36,3 +36,17 @@ def test_invalid_operation_error(amount, addend):
 
     with pytest.raises(InvalidOperationError):
         amount.multiply(addend)
+
+
+def test_large_amount_keeps_precision():
+    amount = Dinero("123456789012.34", USD)
+    assert amount * 3 == Dinero("370370367037.02", USD)
+
+
+def test_global_context_is_not_modified():
+    with localcontext() as context:
+        context.prec = 3
+        amount = Dinero("2.32", USD) * Decimal("2.335")
+
+        assert getcontext().prec == 3
+        assert amount == Dinero("5.42", USD)
@@ -0,0 +1,218 @@
+import random
+import subprocess
+import sys
+from decimal import Decimal
+
+import pytest
+
+from dinero import Dinero, DineroArray
+from dinero import _array
+from dinero.currencies import USD
+
+np = pytest.importorskip("numpy")
+
+INT64_MAX = 2**63 - 1
+INT64_MIN = -(2**63)
+
+
+@pytest.fixture
+def units():
+    generator = random.Random(2024)
+    values = [generator.randint(-(10**12), 10**12) for _ in range(500)]
+    # ties and small values exercise the half even rounding
+    return values + [-3, -2, -1, 0, 1, 2, 3, 5, 15, 25, 35, -5, -15, -25]
+
+
+@pytest.fixture
+def python_only(monkeypatch):
+    monkeypatch.setattr(_array, "engine", None)
+
+
+def engine_and_python(operation, units):
+    vectorized = operation(DineroArray.from_minor_units(units, USD))
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(_array, "engine", None)
+        python = operation(DineroArray.from_minor_units(units, USD))
+
+    return vectorized, python
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda prices: prices + "1.01",
+        lambda prices: prices - Dinero("-7.77", USD),
+        lambda prices: prices + prices,
+        lambda prices: prices - prices * 2,
+        lambda prices: prices * 3,
+        lambda prices: prices * 0.5,
+        lambda prices: prices * Decimal("-1.175"),
+        lambda prices: prices * Decimal("0.333333333333333333"),
+        lambda prices: prices / 3,
+        lambda prices: prices / -4,
+        lambda prices: prices / Decimal("1.21"),
+        lambda prices: prices / 0.07,
+        lambda prices: -prices,
+    ],
+)
+def test_engine_matches_python(units, operation):
+    vectorized, python = engine_and_python(operation, units)
+
+    assert list(vectorized.minor_units) == list(python.minor_units)
+
+
+@pytest.mark.parametrize("method", ["multiply", "divide"])
+def test_engine_matches_python_with_vectors(units, method):
+    generator = random.Random(7)
+    factors = [Decimal(generator.randint(-999, 999) or 1) / 100 for _ in units]
+
+    vectorized, python = engine_and_python(
+        lambda prices: getattr(prices, method)(factors), units
+    )
+
+    assert list(vectorized.minor_units) == list(python.minor_units)
+
+
+@pytest.mark.parametrize("factor", [Decimal("0.1"), Decimal("2.5"), 3])
+def test_engine_matches_dinero(units, factor):
+    prices = DineroArray.from_minor_units(units, USD)
+
+    assert (prices * factor).to_list() == [price * factor for price in prices]
+    assert (prices / factor).to_list() == [price / factor for price in prices]
+
+
+def test_engine_large_products():
+    units = [INT64_MAX // 3, -(INT64_MAX // 3)] * 20
+    prices = DineroArray.from_minor_units(units, USD)
+
+    assert list((prices * Decimal("2.5")).minor_units) == [
+        INT64_MAX // 3 * 5 // 2,
+        -(INT64_MAX // 3 * 5 // 2),
+    ] * 20
+
+    factor = Decimal("1.0000000000000000000000000001")
+    assert (prices * factor).to_list() == [price * factor for price in prices]
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda prices: prices + prices,
+        lambda prices: prices - (-prices),
+        lambda prices: prices * 2,
+        lambda prices: prices / Decimal("0.5"),
+    ],
+)
+def test_engine_overflow(operation):
+    prices = DineroArray.from_minor_units([INT64_MAX - 1] * 40, USD)
+
+    with pytest.raises(OverflowError):
+        operation(prices)
+
+
+def test_engine_negate_matches_python(units):
+    vectorized, python = engine_and_python(lambda prices: -prices, units)
+
+    assert vectorized.to_list() == python.to_list()
+    assert list(vectorized.minor_units) == [-value for value in units]
+
+
+def test_engine_mask(units):
+    prices = DineroArray.from_minor_units(units, USD)
+    mask = np.asarray(units) > 0
+
+    assert prices[mask].to_list() == [price for price in prices if price.minor_units > 0]
+
+
+def test_engine_negate_overflow():
+    prices = DineroArray.from_minor_units([INT64_MIN] * 40, USD)
+
+    with pytest.raises(OverflowError):
+        -prices
+
+
+def test_engine_zero_division():
+    prices = DineroArray.from_minor_units(range(40), USD)
+
+    with pytest.raises(ZeroDivisionError):
+        prices / 0
+
+    with pytest.raises(ZeroDivisionError):
+        prices / ([1] * 39 + [0])
+
+
+@pytest.mark.parametrize(
+    "ratios", [[1, 1, 1], [15, 85], [Decimal("0.1"), 0.2, 7], [0, 3, 0], [2**40, 1]]
+)
+def test_engine_allocate_matches_python(units, ratios):
+    units = units + [INT64_MAX, INT64_MIN, INT64_MAX // 2]
+    vectorized, python = engine_and_python(lambda prices: prices.allocate(ratios), units)
+
+    assert [list(s.minor_units) for s in vectorized] == [
+        list(s.minor_units) for s in python
+    ]
+    assert [sum(shares) for shares in zip(*(s.minor_units for s in vectorized))] == units
+
+
+def test_engine_sum_is_exact():
+    prices = DineroArray.from_minor_units([INT64_MAX] * 40 + [INT64_MIN] * 3, USD)
+    expected = INT64_MAX * 40 + INT64_MIN * 3
+
+    assert prices.sum().minor_units == expected
+    assert prices.min().minor_units == INT64_MIN
+    assert prices.max().minor_units == INT64_MAX
+
+
+def test_reductions_without_engine(units, python_only):
+    prices = DineroArray.from_minor_units(units, USD)
+
+    assert prices.sum().minor_units == sum(units)
+    assert prices.min().minor_units == min(units)
+    assert prices.max().minor_units == max(units)
+
+
+def test_reductions_of_empty_array():
+    prices = DineroArray([], USD)
+
+    assert prices.sum() == Dinero(0, USD)
+
+    with pytest.raises(ValueError):
+        prices.min()
+
+    with pytest.raises(ValueError):
+        prices.max()
+
+
+def test_to_numpy_is_read_only_view():
+    prices = DineroArray(["2.32", "10"], USD)
+    vector = prices.to_numpy()
+
+    assert vector.dtype == np.int64
+    assert vector.tolist() == [232, 1000]
+    assert np.shares_memory(vector, np.frombuffer(prices.minor_units, dtype=np.int64))
+
+    with pytest.raises(ValueError):
+        vector[0] = 1
+
+
+def test_to_numpy_without_engine(python_only):
+    with pytest.raises(ImportError):
+        DineroArray(["2.32"], USD).to_numpy()
+
+
+def test_engine_is_imported_on_first_use():
+    code = (
+        "import sys, dinero\n"
+        "from dinero.currencies import USD\n"
+        "print('numpy' in sys.modules)\n"
+        "dinero.DineroArray.from_minor_units([1, 2], USD).sum()\n"
+        "print('numpy' in sys.modules)\n"
+        "dinero.DineroArray.from_minor_units(range(100), USD).sum()\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert output.stdout.split() == ["False", "False", "True"]
@@ -1,8 +1,13 @@
+import bisect
+import heapq
+import random
+
 import pytest
 
 from dinero import Dinero
-from dinero.currencies import USD
-from dinero.exceptions import InvalidOperationError
+from dinero.currencies import EUR, USD
+from dinero.exceptions import DifferentCurrencyError, InvalidOperationError
+from dinero.types import Currency
 
 
 @pytest.mark.parametrize(
@@ -88,8 +93,8 @@ def test_gte(obj_1, obj_2):
     ],
 )
 def test_invalid_operation_error(amount, addend):
-    with pytest.raises(InvalidOperationError):
-        amount == addend  # type: ignore
+    assert not amount == addend
+    assert amount != addend
 
     with pytest.raises(InvalidOperationError):
         amount.eq(addend)
@@ -117,3 +122,92 @@ def test_invalid_operation_error(amount, addend):
 
     with pytest.raises(InvalidOperationError):
         amount.gte(addend)
+
+
+def test_comparisons_with_different_currencies():
+    with pytest.raises(DifferentCurrencyError):
+        Dinero("1", USD) < Dinero("1", EUR)  # type: ignore
+
+    with pytest.raises(DifferentCurrencyError):
+        Dinero("1", USD).eq(Dinero("1", EUR))
+
+    assert Dinero("1", USD) != Dinero("1", EUR)
+
+
+def test_comparisons_with_same_code_currencies():
+    dollar = Currency("USD", 10, 2, "US$")
+
+    assert dollar is not USD
+    assert Dinero("1", USD) == Dinero("1", dollar)
+    assert Dinero("1", USD) < Dinero("2", dollar)
+    assert Dinero("2", dollar) >= Dinero("1", USD)
+
+
+def test_comparisons_with_different_exponents():
+    cents = Dinero("0.1", USD)
+    mills = Dinero("0.010", Currency("USD", 10, 3))
+
+    assert cents.minor_units == mills.minor_units
+    assert cents != mills
+    assert len({cents, mills}) == 2
+
+    with pytest.raises(DifferentCurrencyError):
+        cents < mills  # type: ignore
+
+    with pytest.raises(DifferentCurrencyError):
+        mills >= cents  # type: ignore
+
+
+def test_sort_key():
+    rng = random.Random(3)
+    prices = [
+        Dinero.from_minor_units(rng.randrange(-1000, 1000), USD) for _ in range(200)
+    ]
+    ordered = sorted(prices)
+
+    assert Dinero("2.32", USD).sort_key == 232
+    assert sorted(prices, key=Dinero.sort_key) == ordered
+    assert heapq.nlargest(5, prices, key=Dinero.sort_key) == ordered[::-1][:5]
+    assert min(prices) == min(prices, key=Dinero.sort_key) == ordered[0]
+    assert max(prices) == ordered[-1]
+
+    position = bisect.bisect_left(ordered, Dinero("0", USD))
+    assert all(price < Dinero("0", USD) for price in ordered[:position])
+    assert all(price >= Dinero("0", USD) for price in ordered[position:])
+
+
+def test_sort_key_is_read_only():
+    with pytest.raises(AttributeError):
+        Dinero("1", USD).sort_key = 1  # type: ignore
+
+
+@pytest.mark.parametrize("other", [1, "1", None, 1.0, object()])
+def test_equality_with_other_types(other):
+    assert Dinero("1", USD) != other
+    assert other != Dinero("1", USD)
+    assert Dinero("1", USD).__eq__(other) is NotImplemented
+
+
+def test_membership_in_mixed_containers():
+    values = [1, "1", None, Dinero("1", EUR), Dinero("1", USD)]
+
+    assert Dinero("1", USD) in values
+    assert values.index(Dinero("1", USD)) == 4
+    assert Dinero("2", USD) not in values
+
+
+def test_hash():
+    dollar = Currency("USD", 10, 2, "US$")
+
+    assert hash(Dinero("2.32", USD)) == hash(Dinero.from_minor_units(232, USD))
+    assert hash(Dinero("2.32", USD)) == hash(Dinero("2.32", dollar))
+    assert hash(Dinero("2.325", USD)) == hash(Dinero("2.32", USD))
+    assert len({Dinero("1", USD), Dinero("1.00", USD), Dinero("1", EUR)}) == 2
+
+
+def test_dictionary_keys():
+    payments = {Dinero(value, USD): index for index, value in enumerate(["1", "2.5"])}
+
+    assert payments[Dinero("2.50", USD)] == 1
+    assert Dinero("1", EUR) not in payments
+    assert Dinero("3", USD) not in payments
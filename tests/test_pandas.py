@@ -0,0 +1,279 @@
+import pickle
+import subprocess
+import sys
+from decimal import Decimal
+
+import pytest
+
+from dinero import Dinero, DineroArray
+from dinero.currencies import EUR, USD
+from dinero.exceptions import DifferentCurrencyError, InvalidOperationError
+from dinero.types import Currency
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from dinero.pandas import DineroDtype, DineroExtensionArray  # noqa: E402
+
+
+@pytest.fixture
+def prices():
+    return pd.Series(["2.32", "10", None, "0.99"], dtype="dinero[USD]")
+
+
+def amounts(values, currency=USD):
+    return [Dinero(value, currency) for value in values]
+
+
+def test_dtype_from_string():
+    dtype = pd.api.types.pandas_dtype("dinero[USD]")
+
+    assert dtype == DineroDtype(USD)
+    assert dtype == "dinero[USD]"
+    assert dtype != "dinero[EUR]"
+    assert dtype.name == "dinero[USD]"
+    assert dtype.currency is USD
+    assert hash(dtype) == hash(DineroDtype("USD"))
+    assert pickle.loads(pickle.dumps(dtype)) == dtype
+
+
+@pytest.mark.parametrize("string", ["dinero", "dinero[]", "dinero[XXX]", "int64"])
+def test_dtype_from_invalid_string(string):
+    with pytest.raises(TypeError):
+        DineroDtype.construct_from_string(string)
+
+
+def test_series_round_trip(prices):
+    values = amounts(["2.32", "10", "0.99"])
+    series = pd.Series(pd.array(values, dtype="dinero[USD]"))
+
+    assert series.dtype == DineroDtype(USD)
+    assert series.tolist() == values
+    assert prices.tolist()[2] is pd.NA
+    assert list(prices.array.minor_units) == [232, 1000, 0, 99]
+    assert prices.isna().tolist() == [False, False, True, False]
+
+
+def test_from_sequence_infers_the_currency():
+    array = DineroExtensionArray._from_sequence(amounts(["1", "2"], EUR))
+
+    assert array.dtype == DineroDtype(EUR)
+
+    with pytest.raises(ValueError):
+        DineroExtensionArray._from_sequence(["1", "2"])
+
+    with pytest.raises(DifferentCurrencyError):
+        pd.array([Dinero("1", EUR)], dtype="dinero[USD]")
+
+    with pytest.raises(InvalidOperationError):
+        pd.array([[1]], dtype="dinero[USD]")
+
+
+def test_from_dinero_array():
+    values = DineroArray(["2.32", "10"], USD)
+    array = pd.array(values, dtype="dinero[USD]")
+
+    assert array.tolist() == values.to_list()
+    assert array.to_dinero_array().to_list() == values.to_list()
+
+
+def test_to_numpy(prices):
+    result = prices.to_numpy()
+
+    assert result.dtype == object
+    assert result.tolist() == prices.tolist()
+    assert prices.to_numpy(na_value=None)[2] is None
+
+    with pytest.raises(ValueError):
+        prices.array.minor_units[0] = 1
+
+
+@pytest.mark.parametrize(
+    "operation, expected",
+    [
+        (lambda prices: prices + prices, ["4.64", "20", None, "1.98"]),
+        (lambda prices: prices + Dinero("1", USD), ["3.32", "11", None, "1.99"]),
+        (lambda prices: prices + "0.01", ["2.33", "10.01", None, "1"]),
+        (lambda prices: 20 - prices, ["17.68", "10", None, "19.01"]),
+        (lambda prices: prices - prices, ["0", "0", None, "0"]),
+        (lambda prices: prices * 2, ["4.64", "20", None, "1.98"]),
+        (lambda prices: prices * Decimal("0.5"), ["1.16", "5", None, "0.50"]),
+        (lambda prices: 3 * prices, ["6.96", "30", None, "2.97"]),
+        (lambda prices: prices / 3, ["0.77", "3.33", None, "0.33"]),
+        (lambda prices: prices * [1, 2, 3, 4], ["2.32", "20", None, "3.96"]),
+        (lambda prices: -prices, ["-2.32", "-10", None, "-0.99"]),
+        (lambda prices: abs(-prices), ["2.32", "10", None, "0.99"]),
+    ],
+)
+def test_arithmetic(prices, operation, expected):
+    result = operation(prices)
+
+    assert result.dtype == DineroDtype(USD)
+    assert result.tolist() == [
+        pd.NA if value is None else Dinero(value, USD) for value in expected
+    ]
+
+
+def test_arithmetic_matches_dinero():
+    values = amounts(["0.05", "0.15", "0.25", "-0.35", "1234.56"])
+    series = pd.Series(values, dtype="dinero[USD]")
+
+    for factor in (Decimal("0.1"), 0.5, Decimal("1.175")):
+        assert (series * factor).tolist() == [value * factor for value in values]
+        assert (series / factor).tolist() == [value / factor for value in values]
+
+
+def test_arithmetic_errors(prices):
+    with pytest.raises(DifferentCurrencyError):
+        prices + Dinero("1", EUR)
+
+    with pytest.raises(DifferentCurrencyError):
+        prices + pd.Series(["1"] * 4, dtype="dinero[EUR]")
+
+    with pytest.raises(DifferentCurrencyError):
+        prices + pd.Series(["1"] * 4, dtype=DineroDtype(Currency("USD", 10, 3)))
+
+    with pytest.raises(DifferentCurrencyError):
+        prices + Dinero("1", Currency("USD", 10, 3))
+
+    with pytest.raises(InvalidOperationError):
+        prices * "2"
+
+    with pytest.raises(ZeroDivisionError):
+        prices / 0
+
+
+def test_negation_overflow():
+    extremes = pd.array(
+        DineroArray.from_minor_units([-(2**63), 2**63 - 1], USD), dtype="dinero[USD]"
+    )
+    series = pd.Series(extremes)
+
+    with pytest.raises(OverflowError):
+        -series
+
+    with pytest.raises(OverflowError):
+        abs(series)
+
+    assert (-series[1:]).array.minor_units.tolist() == [-(2**63) + 1]
+    assert abs(-series[1:]).array.minor_units.tolist() == [2**63 - 1]
+
+
+def test_comparisons(prices):
+    result = prices > Dinero("1", USD)
+
+    assert result.dtype == "boolean"
+    assert result.tolist() == [True, True, pd.NA, False]
+    assert (prices == prices).tolist() == [True, True, pd.NA, True]
+
+    with pytest.raises(InvalidOperationError):
+        prices > 1
+
+
+def test_reductions(prices):
+    assert prices.sum() == Dinero("13.31", USD)
+    assert prices.min() == Dinero("0.99", USD)
+    assert prices.max() == Dinero("10", USD)
+    assert prices.mean() == Dinero("4.44", USD)
+    assert prices.sum(skipna=False) is pd.NA
+    assert prices.iloc[2:3].min() is pd.NA
+
+    with pytest.raises(TypeError):
+        prices.prod()
+
+
+def test_sum_beyond_int64():
+    array = DineroExtensionArray([2**62, 2**62, -(2**62)], USD)
+
+    assert array._reduce("sum").minor_units == 2**62
+
+
+def test_groupby(prices):
+    frame = pd.DataFrame({"key": ["a", "b", "a", "b"], "price": prices})
+    grouped = frame.groupby("key")["price"]
+
+    assert grouped.sum().tolist() == amounts(["2.32", "10.99"])
+    assert grouped.min().tolist() == amounts(["2.32", "0.99"])
+    assert grouped.max().tolist() == amounts(["2.32", "10"])
+    assert grouped.mean().tolist() == amounts(["2.32", "5.50"])
+    assert grouped.sum().dtype == DineroDtype(USD)
+    assert frame.groupby("key").sum()["price"].tolist() == amounts(["2.32", "10.99"])
+
+
+def test_groupby_missing_values():
+    frame = pd.DataFrame(
+        {
+            "key": ["a", "b", "b", None],
+            "price": pd.array([None, "1", "2", "3"], dtype="dinero[USD]"),
+        }
+    )
+    grouped = frame.groupby("key")["price"]
+
+    assert grouped.sum().tolist() == amounts(["0", "3"])
+    assert grouped.sum(min_count=1).tolist() == [pd.NA, Dinero("3", USD)]
+    assert grouped.max().tolist() == [pd.NA, Dinero("2", USD)]
+
+
+def test_groupby_by_amount(prices):
+    counts = prices.to_frame("price").groupby("price").size()
+
+    assert counts.index.tolist() == amounts(["0.99", "2.32", "10"])
+    assert counts.tolist() == [1, 1, 1]
+
+
+def test_sort_values(prices):
+    assert prices.sort_values().tolist() == amounts(["0.99", "2.32", "10"]) + [pd.NA]
+    assert prices.sort_values(ascending=False).tolist()[:3] == amounts(
+        ["10", "2.32", "0.99"]
+    )
+
+
+def test_missing_values(prices):
+    filled = prices.fillna(Dinero("0", USD))
+
+    assert filled.tolist() == amounts(["2.32", "10", "0", "0.99"])
+    assert prices.dropna().tolist() == amounts(["2.32", "10", "0.99"])
+    assert prices.shift(1).tolist()[:2] == [pd.NA, Dinero("2.32", USD)]
+
+
+def test_setitem(prices):
+    prices[0] = Dinero("1", USD)
+    prices[1] = None
+    prices.iloc[2:4] = ["3", "4"]
+
+    assert prices.tolist() == [Dinero("1", USD), pd.NA] + amounts(["3", "4"])
+
+
+def test_concat_unique_and_isin(prices):
+    combined = pd.concat([prices, prices], ignore_index=True)
+
+    assert len(combined) == 8
+    assert combined.dtype == DineroDtype(USD)
+    assert combined.unique().tolist() == amounts(["2.32", "10", "0.99"]) + [pd.NA]
+    assert prices.isin([Dinero("10", USD)]).tolist() == [False, True, False, False]
+    assert prices.equals(prices.copy())
+
+
+def test_pickle(prices):
+    assert pickle.loads(pickle.dumps(prices)).tolist() == prices.tolist()
+
+
+def test_read_csv(tmp_path):
+    path = tmp_path / "prices.csv"
+    path.write_text("price\n2.32\n10\n\n0.99\n")
+
+    frame = pd.read_csv(path, dtype={"price": "dinero[USD]"}, skip_blank_lines=False)
+
+    assert frame["price"].tolist() == [
+        Dinero("2.32", USD),
+        Dinero("10", USD),
+        pd.NA,
+        Dinero("0.99", USD),
+    ]
+
+
+def test_dinero_does_not_import_pandas():
+    code = "import sys, dinero, dinero.currencies; print('pandas' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,197 @@
+import time
+
+import pytest
+
+from dinero import Dinero, parse_many
+from dinero.currencies import BRL, CLP, EUR, JPY, USD, register_currency
+from dinero.exceptions import InvalidOperationError, UnknownCurrencyError
+from dinero.types import Currency
+
+
+class Price(Dinero):
+    pass
+
+
+@pytest.mark.parametrize(
+    "text, currency, expected",
+    [
+        ("234,342.30", USD, Dinero("234342.30", USD)),
+        ("$234,342.30", USD, Dinero("234342.30", USD)),
+        ("234,342.30 USD", USD, Dinero("234342.30", USD)),
+        ("$234,342.30 USD", None, Dinero("234342.30", USD)),
+        ("USD 1234.5", None, Dinero("1234.50", USD)),
+        ("  2.32  ", USD, Dinero("2.32", USD)),
+        ("1 234 567.89", USD, Dinero("1234567.89", USD)),
+        ("1'234.50", USD, Dinero("1234.50", USD)),
+        ("1_000", USD, Dinero("1000", USD)),
+        (".5", USD, Dinero("0.50", USD)),
+        ("5.", USD, Dinero("5", USD)),
+        ("+5", USD, Dinero("5", USD)),
+        ("-$5.00", USD, Dinero("-5", USD)),
+        ("$-5.00", USD, Dinero("-5", USD)),
+        ("- $ 5.00", USD, Dinero("-5", USD)),
+        ("5.00-", USD, Dinero("-5", USD)),
+        ("($1,000.00)", USD, Dinero("-1000", USD)),
+        ("(1,000.00) USD", None, Dinero("-1000", USD)),
+        ("−3.00 EUR", None, Dinero("-3", EUR)),
+        ("2.32 €", None, Dinero("2.32", EUR)),
+        ("1.00 $", USD, Dinero("1", USD)),
+        ("€2.32", None, Dinero("2.32", EUR)),
+        ("R$10.00", None, Dinero("10", BRL)),
+        ("¥1,000 JPY", None, Dinero(1000, JPY)),
+        ("1,000", CLP, Dinero(1000, CLP)),
+        ("1.005", USD, Dinero("1.00", USD)),
+        ("1.015", USD, Dinero("1.02", USD)),
+        ("-0.005", USD, Dinero("0", USD)),
+        ("2.32", {"code": "USD", "base": 10, "exponent": 2}, Dinero("2.32", USD)),
+    ],
+)
+def test_parse(text, currency, expected):
+    result = Dinero.parse(text, currency)
+
+    assert result == expected
+    assert result.currency is expected.currency
+
+
+@pytest.mark.parametrize(
+    "text, currency, expected",
+    [
+        ("2,00", EUR, Dinero("2", EUR)),
+        ("1.000,50 €", None, Dinero("1000.50", EUR)),
+        ("1.000.000,5 EUR", None, Dinero("1000000.50", EUR)),
+        ("R$ 10,00", None, Dinero("10", BRL)),
+        ("-1 234,56", EUR, Dinero("-1234.56", EUR)),
+        ("1 234,56 €", None, Dinero("1234.56", EUR)),
+    ],
+)
+def test_parse_decimal_comma(text, currency, expected):
+    assert Dinero.parse(text, currency, decimal=",") == expected
+
+
+@pytest.mark.parametrize(
+    "amount", [Dinero("-234342.3010", USD), Dinero("0.01", EUR), Dinero(-1000, CLP)]
+)
+@pytest.mark.parametrize("symbol", [True, False])
+@pytest.mark.parametrize("currency", [True, False])
+def test_parse_format_round_trip(amount, symbol, currency):
+    text = amount.format(symbol=symbol, currency=currency)
+
+    assert Dinero.parse(text, amount.currency) == amount
+    if currency:
+        assert Dinero.parse(text) == amount
+
+
+@pytest.mark.parametrize(
+    "text, currency",
+    [
+        ("abc", USD),
+        ("", USD),
+        ("$", USD),
+        ("1.2.3", USD),
+        ("1,00,000", USD),
+        ("1,000 000", USD),
+        ("--1", USD),
+        ("1 EUR", USD),
+        ("€1", USD),
+        ("1e3", USD),
+        ("(1.00", USD),
+        ("-(1.00)", USD),
+        ("-1.00-", USD),
+        ("-$-1.00", USD),
+        ("2.32", None),
+        ("$2.32", None),
+        ("$2.32 EUR", None),
+        ("€2.32 €", None),
+        ("2,32", EUR),
+    ],
+)
+def test_parse_invalid(text, currency):
+    with pytest.raises(ValueError):
+        Dinero.parse(text, currency)
+
+
+def test_parse_errors():
+    with pytest.raises(TypeError):
+        Dinero.parse(2.32, USD)  # type: ignore
+
+    with pytest.raises(UnknownCurrencyError):
+        Dinero.parse("2.32 XYZ")
+
+    with pytest.raises(ValueError):
+        Dinero.parse("2.32", USD, decimal=";")
+
+    with pytest.raises(InvalidOperationError):
+        Dinero.parse("$" + "1" * 5000, USD)
+
+    with pytest.raises(InvalidOperationError):
+        Dinero.parse("1" + ",000" * 10 + ".005 USD")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        " " * 10_000 + "x",
+        "1" + " " * 10_000 + "x",
+        "(" + " " * 10_000 + "-" + " " * 10_000 + "$" + " " * 10_000 + "x",
+        "1" + " " * 10_000 + "-" + " " * 10_000 + ")" + " " * 10_000 + "x",
+    ],
+)
+@pytest.mark.parametrize("currency", [USD, None])
+def test_parse_long_whitespace_fails_fast(text, currency):
+    start = time.perf_counter()
+    with pytest.raises(ValueError):
+        Dinero.parse(text, currency)
+
+    assert time.perf_counter() - start < 1
+
+
+def test_parse_surrounding_whitespace():
+    assert Dinero.parse("\t $2.32 \n", USD) == Dinero("2.32", USD)
+    assert parse_many([" " * 10_000 + "€2.32" + " " * 10_000]) == [Dinero("2.32", EUR)]
+
+
+def test_parse_subclass():
+    assert type(Price.parse("$2.32", USD)) is Price
+
+
+def test_parse_registered_currency():
+    coin = Currency("XTC", 10, 4, "₮c")
+    register_currency(coin)
+
+    assert Dinero.parse("₮c2.5") == Dinero("2.5", coin)
+    assert Dinero.parse("2.5 XTC") == Dinero("2.5", coin)
+
+
+@pytest.mark.parametrize(
+    "texts, currency, decimal",
+    [
+        (["$2.32", "(1,000.00)", "-0.50 USD", "1.005"], USD, "."),
+        (["€2.32", "1,000.50 EUR", "3 USD", "(¥5) JPY", "€-1"], None, "."),
+        (["€2,32", "1.000,50 EUR", "R$ 3,00", "7 CLP"], None, ","),
+        ([], None, "."),
+    ],
+)
+def test_parse_many(texts, currency, decimal):
+    expected = [Dinero.parse(text, currency, decimal) for text in texts]
+    result = parse_many(iter(texts), currency, decimal)
+
+    assert result == expected
+    assert [amount.currency for amount in result] == [
+        amount.currency for amount in expected
+    ]
+
+
+@pytest.mark.parametrize(
+    "texts, currency, error",
+    [
+        (["2.32", "abc"], USD, ValueError),
+        (["2.32", None], USD, TypeError),
+        (["€2.32", "$1"], None, ValueError),
+        (["€2.32", "1"], None, ValueError),
+        (["€2.32", 1], None, TypeError),
+        (["1 XYZ"], None, UnknownCurrencyError),
+    ],
+)
+def test_parse_many_errors(texts, currency, error):
+    with pytest.raises(error):
+        parse_many(texts, currency)
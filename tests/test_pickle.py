@@ -0,0 +1,98 @@
+import copy
+import pickle
+
+import pytest
+
+from dinero import Dinero, DineroArray
+from dinero.currencies import CLP, EUR, USD, is_iso_currency
+from dinero.types import Currency
+
+BTC = Currency("BTC", 10, 8, "₿")
+US_DOLLAR = Currency("USD", 10, 2, "US$")
+
+
+class Price(Dinero):
+    pass
+
+
+@pytest.mark.parametrize(
+    "amount",
+    [
+        Dinero("2.32", USD),
+        Dinero("-0.01", EUR),
+        Dinero(1000, CLP),
+        Dinero.from_minor_units(10**40, USD),
+        Dinero("0.00000001", BTC),
+        Dinero("2.32", US_DOLLAR),
+        Dinero("2.32", {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"}),
+    ],
+)
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_round_trip(amount, protocol):
+    result = pickle.loads(pickle.dumps(amount, protocol))
+
+    assert result == amount
+    assert result.currency is amount.currency
+    assert result.minor_units == amount.minor_units
+
+
+def test_pickle_uses_the_currency_code():
+    data = pickle.dumps(Dinero("2.32", USD))
+
+    assert b"USD" in data
+    assert b"exponent" not in data
+    assert b"_minor_units" not in data
+    assert len(data) < len(pickle.dumps(USD))
+
+
+def test_pickle_custom_currency():
+    data = pickle.dumps(Dinero("1", BTC))
+
+    assert b"dinero.types" in data
+    assert pickle.loads(data).currency is BTC
+
+
+def test_pickle_subclass():
+    result = pickle.loads(pickle.dumps(Price("2.32", USD)))
+
+    assert type(result) is Price
+    assert result == Dinero("2.32", USD)
+
+
+def test_copy():
+    amount = Dinero("2.32", USD)
+
+    assert copy.copy(amount) == amount
+    assert copy.deepcopy(amount).currency is USD
+
+
+@pytest.mark.parametrize("currency", [USD, CLP, BTC, US_DOLLAR])
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_array(currency, protocol):
+    prices = DineroArray.from_minor_units([232, -1, 0, 2**63 - 1, -(2**63)], currency)
+    result = pickle.loads(pickle.dumps(prices, protocol))
+
+    assert result.currency is currency
+    assert list(result.minor_units) == list(prices.minor_units)
+
+
+def test_pickle_array_is_one_block():
+    prices = DineroArray.from_minor_units(range(1000), USD)
+    data = pickle.dumps(prices)
+
+    assert len(data) < 1000 * 8 + 100
+    assert data.count(b"USD") == 1
+
+
+def test_pickle_array_views():
+    prices = DineroArray.from_minor_units(range(10), USD)
+
+    assert list(pickle.loads(pickle.dumps(prices[1::3])).minor_units) == [1, 4, 7]
+
+
+@pytest.mark.parametrize(
+    "currency, expected",
+    [(USD, True), (CLP, True), (US_DOLLAR, False), (BTC, False)],
+)
+def test_is_iso_currency(currency, expected):
+    assert is_iso_currency(currency) is expected
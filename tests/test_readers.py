@@ -0,0 +1,259 @@
+import io
+import json
+
+import pytest
+
+from dinero import CSVReader, Dinero, DineroArray, JSONLinesReader, MoneyBag, RowError
+from dinero._readers import Reader
+from dinero.currencies import CLP, EUR, USD
+from dinero.exceptions import InvalidOperationError, UnknownCurrencyError
+
+CSV = """id,amount,currency
+1,2.32,USD
+2,10,EUR
+3,-0.01,USD
+4,"1,000",CLP
+5,2.325,USD
+"""
+
+
+def test_csv_reader():
+    reader = CSVReader(io.StringIO(CSV))
+
+    assert list(reader) == [
+        Dinero("2.32", USD),
+        Dinero("10", EUR),
+        Dinero("-0.01", USD),
+        Dinero(1000, CLP),
+        Dinero("2.325", USD),
+    ]
+    assert reader.errors == []
+
+
+def test_csv_reader_matches_constructor():
+    rows = [["2.32"], ["0.005"], ["-0.015"], ["1e3"], [" 7 "], ["123456789.99"]]
+    lines = [",".join(row) for row in rows]
+    reader = CSVReader(lines, amount=0, currency=USD, header=False)
+
+    for amount, row in zip(reader, rows, strict=True):
+        assert amount == Dinero(row[0], USD)
+        assert amount.currency is USD
+
+
+@pytest.mark.parametrize(
+    "lines, amount, currency, options",
+    [
+        (["price,code,amount", "2.32,USD,10"], "price", "code", {}),
+        (["price,code,amount", "2.32,USD,10"], 0, 1, {}),
+        (["price,code,amount", "2.32,USD,10"], 0, "code", {}),
+        (["2.32,USD"], 0, 1, {"header": False}),
+        (["price;code", "2.32;USD"], "price", "code", {"delimiter": ";"}),
+    ],
+)
+def test_csv_reader_columns(lines, amount, currency, options):
+    assert list(CSVReader(lines, amount, currency, **options)) == [Dinero("2.32", USD)]
+
+
+def test_csv_reader_fixed_currency():
+    reader = CSVReader(["amount", "2.32", "10"], currency=EUR)
+
+    assert [amount.currency for amount in reader] == [EUR, EUR]
+
+
+def test_csv_reader_errors():
+    lines = [
+        "amount,currency",
+        "2.32,USD",
+        ",USD",
+        "abc,USD",
+        "",
+        "1,XYZ",
+        "5",
+        "NaN,USD",
+        "10,EUR",
+    ]
+    reader = CSVReader(lines)
+
+    assert list(reader) == [Dinero("2.32", USD), Dinero("10", EUR)]
+    assert [error.line for error in reader.errors] == [3, 4, 6, 7, 8]
+    assert reader.errors[0] == RowError(3, ["", "USD"], reader.errors[0].error)
+    assert isinstance(reader.errors[0].error, InvalidOperationError)
+    assert isinstance(reader.errors[2].error, UnknownCurrencyError)
+    assert isinstance(reader.errors[3].error, IndexError)
+
+
+def test_csv_reader_multiline_rows():
+    lines = io.StringIO('amount,note\n2.32,"a\nb"\nx,y\n')
+    reader = CSVReader(lines, currency=USD)
+
+    assert list(reader) == [Dinero("2.32", USD)]
+    assert reader.errors[0].line == 4
+
+
+@pytest.mark.parametrize(
+    "amount, currency, header",
+    [("price", "currency", True), ("amount", "code", True), ("amount", 1, False)],
+)
+def test_csv_reader_invalid_columns(amount, currency, header):
+    with pytest.raises(ValueError):
+        list(CSVReader(["amount,currency", "2.32,USD"], amount, currency, header))
+
+
+@pytest.mark.parametrize(
+    "lines, key, header",
+    [
+        (["amount,currency,id", "2.32,USD,1", "1,EUR", "3,USD,2"], "id", True),
+        (["2.32,USD,1", "1,EUR", "3,USD,2"], 2, False),
+    ],
+)
+def test_csv_reader_key(lines, key, header):
+    reader = CSVReader(lines, 0, 1, header, key=key)
+
+    assert list(reader) == [Dinero("2.32", USD), Dinero("3", USD)]
+    assert isinstance(reader.errors[0].error, IndexError)
+
+
+def test_csv_reader_invalid_key():
+    with pytest.raises(ValueError):
+        CSVReader(["2.32,USD,1"], 0, 1, header=False, key="id")
+
+    with pytest.raises(ValueError):
+        list(CSVReader(["amount,currency", "2.32,USD"], key="id"))
+
+
+def test_csv_reader_is_lazy():
+    def lines():
+        yield "amount,currency"
+        yield "2.32,USD"
+        raise AssertionError("read past the first amount")
+
+    assert next(iter(CSVReader(lines()))) == Dinero("2.32", USD)
+
+
+def test_csv_reader_arrays():
+    codes = ["EUR", "USD", "USD"]
+    lines = ["amount,currency"] + [f"{index},{codes[index % 3]}" for index in range(10)]
+    arrays = list(CSVReader(lines).arrays(3))
+
+    assert [array.code for array in arrays] == ["USD", "EUR", "USD", "EUR"]
+    assert all(isinstance(array, DineroArray) for array in arrays)
+    assert [list(array.minor_units) for array in arrays] == [
+        [100, 200, 400],
+        [0, 300, 600],
+        [500, 700, 800],
+        [900],
+    ]
+
+
+def test_csv_reader_arrays_overflow():
+    reader = CSVReader(["amount", "1", "100000000000000000", "2"], currency=USD)
+    arrays = list(reader.arrays())
+
+    assert [list(array.minor_units) for array in arrays] == [[100, 200]]
+    assert isinstance(reader.errors[0].error, OverflowError)
+
+
+@pytest.mark.parametrize("size", [0, -1, 1.5])
+def test_csv_reader_arrays_invalid_size(size):
+    with pytest.raises(ValueError):
+        list(CSVReader(["amount,currency"]).arrays(size))
+
+
+def test_json_lines_reader():
+    amounts = [Dinero("2.32", USD), Dinero("10", EUR), Dinero(1000, CLP)]
+    lines = [amount.to_json() for amount in amounts]
+    reader = JSONLinesReader(lines)
+    result = list(reader)
+
+    assert result == amounts
+    assert [amount.currency for amount in result] == [USD, EUR, CLP]
+    assert reader.errors == []
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ({"amount": "2.32", "currency": "USD"}, Dinero("2.32", USD)),
+        ({"amount": 2.32, "currency": "USD"}, Dinero("2.32", USD)),
+        ({"amount": 10, "currency": "EUR"}, Dinero("10", EUR)),
+        ({"amount": "1,000.50", "currency": "USD"}, Dinero("1000.50", USD)),
+        (
+            {"amount": "2.32", "currency": {"code": "USD", "base": 10, "exponent": 2}},
+            Dinero("2.32", USD),
+        ),
+    ],
+)
+def test_json_lines_reader_values(value, expected):
+    assert list(JSONLinesReader([json.dumps(value)])) == [expected]
+
+
+def test_json_lines_reader_fields():
+    lines = [b'{"price": "2.32", "code": "EUR"}\n']
+
+    assert list(JSONLinesReader(lines, "price", "code")) == [Dinero("2.32", EUR)]
+    assert list(JSONLinesReader(lines, "price", USD)) == [Dinero("2.32", USD)]
+
+
+def test_json_lines_reader_errors():
+    lines = [
+        '{"amount": "2.32", "currency": "USD"}',
+        "not json",
+        "",
+        '{"amount": "2.32"}',
+        '{"amount": null, "currency": "USD"}',
+        '{"amount": "1", "currency": 840}',
+        "[1, 2]",
+        '{"amount": "1", "currency": "EUR"}',
+    ]
+    reader = JSONLinesReader(lines)
+
+    assert list(reader) == [Dinero("2.32", USD), Dinero("1", EUR)]
+    assert [error.line for error in reader.errors] == [2, 4, 5, 6, 7]
+    assert reader.errors[0].row == "not json"
+    assert isinstance(reader.errors[1].error, KeyError)
+    assert isinstance(reader.errors[2].error, InvalidOperationError)
+    assert isinstance(reader.errors[3].error, TypeError)
+
+
+def test_readers_reject_too_large_amounts():
+    amounts = ["1e10000000", "1" * 5000, "1" * 29 + ".00", "0" * 40 + "2.32"]
+    csv_reader = CSVReader(
+        io.StringIO("amount,currency\n" + "".join(f"{a},USD\n" for a in amounts))
+    )
+    json_reader = JSONLinesReader(
+        json.dumps({"amount": amount, "currency": "USD"}) for amount in amounts
+    )
+
+    for reader in (csv_reader, json_reader):
+        assert list(reader) == [Dinero("2.32", USD)]
+        assert len(reader.errors) == 3
+        assert all(
+            isinstance(error.error, InvalidOperationError) for error in reader.errors
+        )
+
+
+def test_json_lines_reader_key():
+    lines = [
+        '{"amount": "2.32", "currency": "USD", "id": 1}',
+        '{"amount": "1", "currency": "EUR"}',
+        '{"amount": "1", "currency": "EUR", "id": [1]}',
+    ]
+    reader = JSONLinesReader(lines, key="id")
+
+    assert list(reader) == [Dinero("2.32", USD)]
+    assert isinstance(reader.errors[0].error, KeyError)
+    assert isinstance(reader.errors[1].error, TypeError)
+
+
+def test_json_lines_reader_arrays():
+    lines = [json.dumps({"amount": str(index), "currency": "USD"}) for index in range(5)]
+    bag = MoneyBag()
+    for array in JSONLinesReader(lines).arrays(2):
+        bag.add(array)
+
+    assert bag.get(USD) == Dinero(10, USD)
+
+
+def test_reader_is_abstract():
+    with pytest.raises(TypeError):
+        Reader(USD, None)  # type: ignore
@@ -0,0 +1,135 @@
+import pytest
+
+import dinero
+from dinero import Dinero, DineroArray
+from dinero.currencies import EUR, JPY, USD
+from dinero.exceptions import DifferentCurrencyError, InvalidOperationError
+from dinero.types import Currency
+
+AMOUNTS = ["2.32", "10", "0.99", "-5.01", "7"]
+
+
+def amounts(values=AMOUNTS, currency=USD):
+    return [Dinero(value, currency) for value in values]
+
+
+@pytest.mark.parametrize(
+    "function, expected",
+    [
+        (dinero.sum, "15.30"),
+        (dinero.min, "-5.01"),
+        (dinero.max, "10"),
+        (dinero.mean, "3.06"),
+        (dinero.median, "2.32"),
+    ],
+)
+@pytest.mark.parametrize(
+    "values",
+    [
+        lambda: amounts(),
+        lambda: iter(amounts()),
+        lambda: (amount for amount in amounts()),
+        lambda: DineroArray(amounts()),
+    ],
+)
+def test_reductions(function, expected, values):
+    assert function(values()) == Dinero(expected, USD)
+    assert function(values(), currency=USD) == Dinero(expected, USD)
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (["1", "2"], "1.50"),
+        (["0.01", "0.02"], "0.02"),
+        (["0.01", "0.04"], "0.02"),
+        (["0.03", "0.04", "0.01", "0.02"], "0.02"),
+    ],
+)
+def test_median_even_count_rounds_half_to_even(values, expected):
+    assert dinero.median(amounts(values)) == Dinero(expected, USD)
+    assert dinero.median(DineroArray(amounts(values))) == Dinero(expected, USD)
+
+
+def test_mean_rounds_half_to_even():
+    assert dinero.mean(amounts(["0.01", "0.02"])) == Dinero("0.02", USD)
+    assert dinero.mean(amounts(["0.01", "0.04"])) == Dinero("0.02", USD)
+    assert dinero.mean(amounts(["1", "1", "2"], JPY)) == Dinero("1", JPY)
+
+
+def test_sum_is_exact_beyond_64_bits():
+    values = [Dinero.from_minor_units(2**62, USD)] * 8
+
+    assert dinero.sum(values).minor_units == 2**65
+    assert dinero.mean(values).minor_units == 2**62
+
+
+def test_sum_matches_builtin_sum():
+    values = amounts()
+
+    assert dinero.sum(values) == sum(values)
+    assert sum(values[1:], values[0]) == sum(values)
+
+
+def test_sum_of_empty_iterable():
+    assert dinero.sum([], currency=USD) == Dinero("0", USD)
+    assert dinero.sum(DineroArray([], USD)) == Dinero("0", USD)
+
+    with pytest.raises(ValueError):
+        dinero.sum([])
+
+
+@pytest.mark.parametrize(
+    "function", [dinero.min, dinero.max, dinero.mean, dinero.median]
+)
+@pytest.mark.parametrize("values", [[], DineroArray([], USD)])
+def test_empty_reductions(function, values):
+    with pytest.raises(ValueError):
+        function(values, currency=USD)
+
+
+@pytest.mark.parametrize(
+    "function", [dinero.sum, dinero.min, dinero.max, dinero.mean, dinero.median]
+)
+def test_reductions_with_different_currencies(function):
+    with pytest.raises(DifferentCurrencyError):
+        function(amounts() + [Dinero("1", EUR)])
+
+    with pytest.raises(DifferentCurrencyError):
+        function(amounts(), currency=EUR)
+
+    with pytest.raises(DifferentCurrencyError):
+        function(DineroArray(amounts()), currency=EUR)
+
+
+@pytest.mark.parametrize(
+    "function", [dinero.sum, dinero.min, dinero.max, dinero.mean, dinero.median]
+)
+def test_reductions_with_different_exponents(function):
+    usd_3 = Currency("USD", 10, 3)
+
+    with pytest.raises(DifferentCurrencyError):
+        function([Dinero("1.00", USD), Dinero("1.000", usd_3)])
+
+    with pytest.raises(DifferentCurrencyError):
+        function([Dinero("1.000", usd_3)], currency=USD)
+
+    with pytest.raises(DifferentCurrencyError):
+        function(DineroArray(["1.000"], usd_3), currency=USD)
+
+
+@pytest.mark.parametrize(
+    "function", [dinero.sum, dinero.min, dinero.max, dinero.mean, dinero.median]
+)
+@pytest.mark.parametrize("values", [[1, 2], amounts() + ["1"]])
+def test_reductions_with_invalid_amounts(function, values):
+    with pytest.raises(InvalidOperationError):
+        function(values)
+
+
+def test_reductions_are_not_star_exported():
+    namespace: dict = {}
+    exec("from dinero import *", namespace)
+
+    assert "sum" not in namespace
+    assert "min" not in namespace
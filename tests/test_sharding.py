@@ -0,0 +1,200 @@
+import io
+import json
+import random
+import subprocess
+import sys
+
+import pytest
+
+from dinero import (
+    CSVReader,
+    Dinero,
+    FileTotals,
+    JSONLinesReader,
+    MoneyBag,
+    sum_file,
+)
+from dinero.currencies import CLP, EUR, USD
+from dinero.exceptions import DifferentCurrencyError
+
+
+@pytest.fixture
+def rows():
+    generator = random.Random(2024)
+    codes = ["USD", "EUR", "CLP"]
+    merchants = ["acme", "globex", "initech"]
+    result = []
+    for index in range(300):
+        code = generator.choice(codes)
+        units = generator.randint(-(10**6), 10**6)
+        amount = str(units) if code == "CLP" else f"{units / 100:.2f}"
+        result.append((generator.choice(merchants), amount, code))
+    # invalid rows, a blank line and amounts rounded half to even
+    result[10] = ("acme", "abc", "USD")
+    result[150] = ("globex", "1", "XYZ")
+    result[200] = ("", "", "")
+    result[250] = ("initech", "0.005", "USD")
+    return result
+
+
+@pytest.fixture
+def csv_file(tmp_path, rows):
+    path = tmp_path / "amounts.csv"
+    lines = ["merchant,amount,currency"]
+    lines += ["" if not any(row) else ",".join(row) for row in rows]
+    path.write_text("\r\n".join(lines) + "\r\n")
+    return path
+
+
+@pytest.fixture
+def jsonl_file(tmp_path, rows):
+    path = tmp_path / "amounts.jsonl"
+    lines = [
+        json.dumps({"merchant": merchant, "amount": amount, "currency": code})
+        for merchant, amount, code in rows
+    ]
+    path.write_text("\n".join(lines))
+    return path
+
+
+def summarize(errors):
+    return [(error.line, error.row, type(error.error)) for error in errors]
+
+
+def single_process(reader, rows):
+    groups = {}
+    for (merchant, _, _), amount in zip(rows, reader):
+        groups.setdefault(merchant, MoneyBag()).add(amount)
+    return groups
+
+
+@pytest.mark.parametrize(
+    "workers, chunk_size", [(1, 1), (1, 7), (1, 10**6), (2, 7), (2, 100), (2, 10**6)]
+)
+def test_sum_csv_file(csv_file, chunk_size, workers):
+    reader = CSVReader(io.StringIO(csv_file.read_text()))
+    expected = MoneyBag(reader)
+
+    result = sum_file(csv_file, workers=workers, chunk_size=chunk_size)
+
+    assert isinstance(result, FileTotals)
+    assert result.totals == expected
+    assert result.groups == {}
+    assert summarize(result.errors) == summarize(reader.errors)
+    assert [error.line for error in result.errors] == [12, 152]
+
+
+@pytest.mark.parametrize(
+    "workers, chunk_size", [(1, 1), (1, 64), (2, 64), (2, 10**6)]
+)
+def test_sum_json_lines_file(jsonl_file, chunk_size, workers):
+    reader = JSONLinesReader(jsonl_file.read_text().splitlines())
+    expected = MoneyBag(reader)
+
+    result = sum_file(jsonl_file, workers=workers, chunk_size=chunk_size)
+
+    assert result.totals == expected
+    assert summarize(result.errors) == summarize(reader.errors)
+
+
+def test_sum_file_by_key(csv_file, rows):
+    valid = [row for row in rows if row[1] not in ("abc", "") and row[2] != "XYZ"]
+    lines = [f"{amount},{code}" for _, amount, code in valid]
+    expected = single_process(CSVReader(lines, 0, 1, header=False), valid)
+
+    result = sum_file(csv_file, key="merchant", workers=2, chunk_size=128)
+
+    assert result.groups == expected
+    assert list(result.groups) == list(expected)
+    assert result.groups["acme"].get(USD) == expected["acme"].get(USD)
+
+    totals = MoneyBag()
+    totals.merge(*expected.values())
+    assert result.totals == totals
+
+
+def test_sum_json_lines_file_by_key(jsonl_file):
+    result = sum_file(jsonl_file, key="merchant", workers=1, chunk_size=256)
+    keyed = sum_file(jsonl_file, key="merchant", workers=2, chunk_size=100)
+
+    assert result.totals == keyed.totals
+    assert result.groups == keyed.groups
+    assert summarize(result.errors) == summarize(keyed.errors)
+    assert set(result.groups) == {"acme", "globex", "initech"}
+
+
+def test_sum_file_is_deterministic(csv_file):
+    results = [
+        sum_file(csv_file, key=0, workers=workers, chunk_size=chunk_size)
+        for workers, chunk_size in [(1, 10**6), (2, 3), (2, 50), (1, 50)]
+    ]
+
+    for result in results[1:]:
+        assert result.totals == results[0].totals
+        assert result.groups == results[0].groups
+        assert list(result.groups) == list(results[0].groups)
+        assert summarize(result.errors) == summarize(results[0].errors)
+
+
+def test_sum_file_options(tmp_path):
+    path = tmp_path / "amounts.txt"
+    path.write_text("2.32;x\n10;y\n1,000.50;x\n")
+
+    result = sum_file(path, 0, EUR, key=1, header=False, delimiter=";", workers=1)
+
+    assert result.totals.get(EUR) == Dinero("1012.82", EUR)
+    assert result.groups["x"].get(EUR) == Dinero("1002.82", EUR)
+
+
+def test_sum_file_json_lines_option(tmp_path):
+    path = tmp_path / "amounts.log"
+    path.write_text('{"price": 10, "code": "CLP"}\n{"price": "2.32", "code": "USD"}\n')
+
+    result = sum_file(path, "price", "code", json_lines=True)
+
+    assert list(result.totals) == [Dinero(10, CLP), Dinero("2.32", USD)]
+
+
+def test_sum_file_currencies_with_different_exponents(tmp_path):
+    currencies = [dict(USD), {"code": "USD", "base": 10, "exponent": 3}]
+    path = tmp_path / "amounts.jsonl"
+    path.write_text(
+        "".join(
+            json.dumps({"amount": "1", "currency": currency}) + "\n"
+            for currency in currencies
+        )
+    )
+
+    with pytest.raises(DifferentCurrencyError):
+        sum_file(path, workers=1)
+
+
+def test_import_does_not_load_multiprocessing():
+    code = "import sys, dinero; print('multiprocessing' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert output.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("content", ["amount,currency\n", "amount,currency"])
+def test_sum_empty_file(tmp_path, content):
+    path = tmp_path / "amounts.csv"
+    path.write_text(content)
+
+    result = sum_file(path)
+
+    assert len(result.totals) == 0
+    assert result.errors == []
+
+
+def test_sum_file_missing_column(csv_file):
+    with pytest.raises(ValueError):
+        sum_file(csv_file, amount="price")
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1, 1.5])
+def test_sum_file_invalid_chunk_size(csv_file, chunk_size):
+    with pytest.raises(ValueError):
+        sum_file(csv_file, chunk_size=chunk_size)
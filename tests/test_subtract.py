@@ -3,6 +3,10 @@ import pytest
 from dinero import Dinero
 from dinero.currencies import EUR, USD
 from dinero.exceptions import DifferentCurrencyError, InvalidOperationError
+from dinero.types import Currency
+
+
+USD_3 = Currency("USD", 10, 3)
 
 
 @pytest.mark.parametrize(
@@ -64,6 +68,7 @@ def test_subtract_amount_mixed(amount, subtrahend, total):
         (Dinero(24.5, USD), Dinero("1", EUR)),
         (Dinero("24.5", USD), Dinero("1", EUR)),
         (Dinero("24.5", USD), Dinero(1, EUR)),
+        (Dinero("1.00", USD), Dinero("1.000", USD_3)),
     ],
 )
 def test_different_currencies_error(amount, subtrahend):
@@ -64,6 +64,19 @@ def test_calculate_simple_interest(
         assert interest == expected_interest
 
 
+@pytest.mark.parametrize(
+    "interest_rate, duration, error, message",
+    [
+        ("5", -2, TypeError, "interest rate must be a number"),
+        (-5, 2.5, TypeError, "duration must be an integer"),
+        (-5, -2, ValueError, "interest rate cannot be negative"),
+    ],
+)
+def test_calculate_simple_interest_error_order(interest_rate, duration, error, message):
+    with pytest.raises(error, match=message):
+        calculate_simple_interest(Dinero(1000, USD), interest_rate, duration)
+
+
 @pytest.mark.parametrize(
     "principal, interest_rate, duration, compound_frequency, expected, error",
     [
@@ -0,0 +1,213 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from dinero import Dinero, DineroArray
+from dinero.currencies import CLP, EUR, JPY, USD
+from dinero.exceptions import DifferentCurrencyError, InvalidOperationError
+from dinero.tools import (
+    calculate_base_amount,
+    calculate_base_amount_many,
+    calculate_compound_interest,
+    calculate_compound_interest_many,
+    calculate_cost_amount,
+    calculate_cost_amount_many,
+    calculate_gross_amount,
+    calculate_gross_amount_many,
+    calculate_margin_portion,
+    calculate_margin_portion_many,
+    calculate_marked_up_amount,
+    calculate_marked_up_amount_many,
+    calculate_markup_portion,
+    calculate_markup_portion_many,
+    calculate_net_amount,
+    calculate_net_amount_many,
+    calculate_percentage,
+    calculate_percentage_many,
+    calculate_selling_price,
+    calculate_selling_price_many,
+    calculate_simple_interest,
+    calculate_simple_interest_many,
+    calculate_vat_portion,
+    calculate_vat_portion_many,
+    convert,
+    convert_many,
+)
+from dinero.tools import conversion
+
+RATE_TOOLS = [
+    (calculate_net_amount, calculate_net_amount_many),
+    (calculate_vat_portion, calculate_vat_portion_many),
+    (calculate_gross_amount, calculate_gross_amount_many),
+    (calculate_base_amount, calculate_base_amount_many),
+    (calculate_markup_portion, calculate_markup_portion_many),
+    (calculate_marked_up_amount, calculate_marked_up_amount_many),
+    (calculate_cost_amount, calculate_cost_amount_many),
+    (calculate_margin_portion, calculate_margin_portion_many),
+    (calculate_selling_price, calculate_selling_price_many),
+    (calculate_percentage, calculate_percentage_many),
+]
+
+
+@pytest.fixture
+def amounts():
+    rng = random.Random(12)
+    values = [Decimal(rng.randrange(-(10**8), 10**8)) / 100 for _ in range(200)]
+    return [Dinero(value, USD) for value in values] + [Dinero("0.05", USD)]
+
+
+@pytest.mark.parametrize("tool, tool_many", RATE_TOOLS)
+@pytest.mark.parametrize("rate", [0, 7.5, 15, 21, 33.33])
+def test_batch_matches_single_rate(amounts, tool, tool_many, rate):
+    expected = [tool(amount, rate) for amount in amounts]
+
+    assert tool_many(amounts, rate) == expected
+    assert tool_many(DineroArray(amounts), rate).to_list() == expected
+
+
+@pytest.mark.parametrize("tool, tool_many", RATE_TOOLS)
+def test_batch_matches_rate_vector(amounts, tool, tool_many):
+    rates = [[5, 10, 12.5, 19, 20][index % 5] for index in range(len(amounts))]
+    expected = [tool(amount, rate) for amount, rate in zip(amounts, rates)]
+
+    assert tool_many(amounts, rates) == expected
+    assert tool_many(DineroArray(amounts), tuple(rates)).to_list() == expected
+
+
+def test_batch_interest(amounts):
+    principals = [amount for amount in amounts if amount.minor_units > 0]
+    rates = [[5.0, 2][index % 2] for index in range(len(principals))]
+
+    assert calculate_simple_interest_many(principals, 3.5, 3) == [
+        calculate_simple_interest(principal, 3.5, 3) for principal in principals
+    ]
+    result = calculate_compound_interest_many(DineroArray(principals), 5.0, 10, 12)
+    assert result.to_list() == [
+        calculate_compound_interest(principal, 5.0, 10, 12) for principal in principals
+    ]
+    assert calculate_compound_interest_many(principals, rates, 10, 12) == [
+        calculate_compound_interest(principal, rate, 10, 12)
+        for principal, rate in zip(principals, rates)
+    ]
+
+
+@pytest.mark.parametrize("rate", ["0.85", 0.85, 151.37, "0.000123456789"])
+@pytest.mark.parametrize("currency", [EUR, JPY, CLP])
+def test_batch_convert(amounts, rate, currency):
+    expected = [convert(amount, rate, currency) for amount in amounts]
+
+    assert convert_many(amounts, rate, currency) == expected
+    assert convert_many(DineroArray(amounts), rate, currency).currency is currency
+
+
+def test_convert_is_exact():
+    amount = Dinero("12345678901234567.89", USD)
+
+    assert convert(amount, "1.0000000000000000000000000001", EUR) == Dinero(
+        "12345678901234567.89", EUR
+    )
+    assert convert(Dinero("0.05", USD), "0.1", EUR) == Dinero("0.00", EUR)
+    assert convert(Dinero("0.15", USD), "0.1", EUR) == Dinero("0.02", EUR)
+
+
+def test_batch_returns_the_input_form():
+    result = calculate_gross_amount_many(DineroArray(["100", "50"], USD), 20)
+
+    assert isinstance(result, DineroArray)
+    assert result.to_list() == [Dinero("120", USD), Dinero("60", USD)]
+    assert calculate_gross_amount_many(iter([Dinero("100", USD)]), 20) == [
+        Dinero("120", USD)
+    ]
+
+
+@pytest.mark.parametrize(
+    "amounts, rate, error",
+    [
+        ([Dinero("100", USD), 100], 20, InvalidOperationError),
+        ([Dinero("100", USD), Dinero("100", EUR)], 20, DifferentCurrencyError),
+        ([], 20, ValueError),
+        ([Dinero("100", USD)], "20", TypeError),
+        ([Dinero("100", USD)], -20, ValueError),
+        ([Dinero("100", USD)], [20, -1], ValueError),
+        ([Dinero("100", USD)] * 2, [20, -1], ValueError),
+        ([Dinero("100", USD)] * 2, [20, "1"], TypeError),
+    ],
+)
+def test_batch_errors(amounts, rate, error):
+    with pytest.raises(error):
+        calculate_gross_amount_many(amounts, rate)
+
+
+@pytest.mark.parametrize(
+    "tool, args, error",
+    [
+        (calculate_selling_price_many, ([Dinero(1, USD)], 100), ValueError),
+        (calculate_simple_interest_many, ([Dinero(1, USD)], 5, 2.5), TypeError),
+        (calculate_compound_interest_many, ([Dinero(1, USD)], 5, 0, 1), ValueError),
+        (convert_many, ([1], "0.85", EUR), InvalidOperationError),
+        (convert_many, ([Dinero(1, USD)], True, EUR), ValueError),
+        (convert_many, ([Dinero(1, USD)] * 2, [1, True], EUR), ValueError),
+        (convert_many, ([Dinero(1, USD)] * 2, [1.0, True], EUR), ValueError),
+        (convert_many, ([Dinero(1, USD)], "0", EUR), ValueError),
+        (convert_many, ([Dinero(1, USD)], "0.85", {"code": "EUR"}), TypeError),
+    ],
+)
+def test_batch_tool_errors(tool, args, error):
+    with pytest.raises(error):
+        tool(*args)
+
+
+def error_of(function, *args):
+    with pytest.raises(Exception) as info:
+        function(*args)
+    return type(info.value), str(info.value)
+
+
+@pytest.mark.parametrize("tool, tool_many", RATE_TOOLS)
+@pytest.mark.parametrize("rate", ["20", -20, None])
+def test_batch_errors_match_single_tool(tool, tool_many, rate):
+    amount = Dinero("100", USD)
+
+    assert error_of(tool_many, [amount], rate) == error_of(tool, amount, rate)
+    assert error_of(tool_many, [amount], [rate]) == error_of(tool, amount, rate)
+
+
+@pytest.mark.parametrize(
+    "rate, duration", [("5", "2"), ("5", -2), (-5, "2"), (-5, -2), (5, 2.5), (5, -2)]
+)
+def test_batch_simple_interest_errors_match_single_tool(rate, duration):
+    amount = Dinero("100", USD)
+    expected = error_of(calculate_simple_interest, amount, rate, duration)
+
+    assert error_of(calculate_simple_interest_many, [amount], rate, duration) == expected
+    assert error_of(calculate_simple_interest_many, [amount], [rate], duration) == (
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    "rate, duration, frequency", [(0, 0, 1), (-5, 10, 0), (5, 0, 1), (5, 10, 0)]
+)
+def test_batch_compound_interest_errors_match_single_tool(rate, duration, frequency):
+    amount = Dinero("100", USD)
+    args = (rate, duration, frequency)
+
+    assert error_of(calculate_compound_interest_many, [amount], *args) == error_of(
+        calculate_compound_interest, amount, *args
+    )
+
+
+def test_convert_many_parses_each_rate_once(monkeypatch):
+    parsed = []
+    to_decimal_rate = conversion._to_decimal_rate
+
+    def counting(rate):
+        parsed.append(rate)
+        return to_decimal_rate(rate)
+
+    monkeypatch.setattr(conversion, "_to_decimal_rate", counting)
+    result = convert_many([Dinero("100", USD)] * 3, ["0.85", "0.85", "1.1"], EUR)
+
+    assert result == [Dinero("85", EUR), Dinero("85", EUR), Dinero("110", EUR)]
+    assert parsed == ["0.85", "1.1"]
@@ -2,7 +2,7 @@ import json
 
 import pytest
 from dinero import Dinero
-from dinero._utils import DecimalEncoder
+from dinero._utils import DecimalEncoder, exact_amount_pattern
 from dinero.currencies import EUR, USD
 
 
@@ -42,3 +42,22 @@ def test_decimal_encoder():
 )
 def test_amount_formatter(amount, formatted_amount):
     assert amount._formatted_amount == formatted_amount
+
+
+@pytest.mark.parametrize(
+    "amount, exponent, expected",
+    [
+        ("2.32", 2, True),
+        ("-0.01", 2, True),
+        ("1000", 0, True),
+        ("2.3", 2, False),
+        ("2.325", 2, False),
+        ("1,000.00", 2, False),
+        ("+2.32", 2, False),
+        (" 2.32", 2, False),
+        ("2.", 0, False),
+        ("٢.٣٢", 2, False),
+    ],
+)
+def test_exact_amount_pattern(amount, exponent, expected):
+    assert (exact_amount_pattern(exponent).fullmatch(amount) is not None) is expected